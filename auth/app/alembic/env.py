@@ -4,10 +4,10 @@ import asyncio
 from logging.config import fileConfig
 
 from alembic import context
-from config import PostgreSQLSettings
 from sqlalchemy import pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
+from src.config import PostgreSQLSettings
 from src.infrastructure.models import Base
 
 config = context.config
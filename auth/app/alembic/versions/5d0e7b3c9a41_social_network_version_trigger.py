@@ -0,0 +1,44 @@
+"""Bump social network version by trigger.
+
+Revision ID: 5d0e7b3c9a41
+Revises: c41d7e9a2b58
+Create Date: 2026-10-19 11:40:12.583104
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = '5d0e7b3c9a41'
+down_revision: Union[str, None] = 'c41d7e9a2b58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Changes made by SQL, not by the ORM, bump the version as well.
+    op.execute(
+        """
+        CREATE FUNCTION public.bump_social_network_version()
+        RETURNS trigger LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW.version := nextval('public.social_network_version_seq');
+            RETURN NEW;
+        END;
+        $$
+        """,
+    )
+    op.execute(
+        """
+        CREATE TRIGGER social_network_version
+        BEFORE INSERT OR UPDATE ON public.social_network
+        FOR EACH ROW EXECUTE FUNCTION public.bump_social_network_version()
+        """,
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        'DROP TRIGGER social_network_version ON public.social_network',
+    )
+    op.execute('DROP FUNCTION public.bump_social_network_version()')
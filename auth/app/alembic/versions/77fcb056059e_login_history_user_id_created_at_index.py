@@ -0,0 +1,55 @@
+"""Add login history (user_id, created_at, id) index.
+
+Revision ID: 77fcb056059e
+Revises: f18c8542513b
+Create Date: 2026-10-19 02:52:50.086078
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = '77fcb056059e'
+down_revision: Union[str, None] = 'f18c8542513b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX = 'ix_login_history_user_id_created_at_id'
+COLUMNS = '(user_id, created_at DESC, id DESC)'
+PARTITIONS_QUERY = """
+    SELECT child.relname FROM pg_inherits
+    JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+    JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+    JOIN pg_namespace ON pg_namespace.oid = parent.relnamespace
+    WHERE parent.relname = 'login_history' AND pg_namespace.nspname = 'public'
+"""
+
+
+def upgrade() -> None:
+    # Index on partitioned table can not be built concurrently, so it is
+    # created invalid ON ONLY parent, partitions are indexed concurrently
+    # one by one and attached, parent becomes valid after the last one.
+    # Partitions created later get the index automatically.
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS {0} ON ONLY public.login_history {1}'.format(
+            INDEX, COLUMNS,
+        )
+    )
+    partitions = op.get_bind().execute(sa.text(PARTITIONS_QUERY)).scalars()
+    with op.get_context().autocommit_block():
+        for partition in sorted(partitions):
+            partition_index = '{0}_{1}'.format(partition, 'user_created_idx')
+            op.execute(
+                'CREATE INDEX CONCURRENTLY IF NOT EXISTS {0} '
+                'ON public.{1} {2}'.format(partition_index, partition, COLUMNS)
+            )
+            op.execute(
+                'ALTER INDEX public.{0} ATTACH PARTITION public.{1}'.format(
+                    INDEX, partition_index,
+                )
+            )
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX public.{0}'.format(INDEX))
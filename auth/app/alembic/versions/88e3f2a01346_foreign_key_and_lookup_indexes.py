@@ -0,0 +1,62 @@
+"""Add foreign key and lookup indexes.
+
+Revision ID: 88e3f2a01346
+Revises: 77fcb056059e
+Create Date: 2026-10-19 02:58:10.557031
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = '88e3f2a01346'
+down_revision: Union[str, None] = '77fcb056059e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# login_history.user_id is covered by ix_login_history_user_id_created_at_id,
+# user_social_account.social_network_id by the leading column of
+# uq_user_social_account_social_network_id_social_account_id.
+INDEXES = (
+    ('ix_user_service_role_id', 'user_service', ['role_id'], False),
+    ('ix_user_user_service_id', 'user', ['user_service_id'], False),
+    ('ix_user_social_account_user_id', 'user_social_account', ['user_id'], False),
+    (
+        'uq_user_social_account_social_network_id_social_account_id',
+        'user_social_account',
+        ['social_network_id', 'social_account_id'],
+        True,
+    ),
+    ('uq_user_email_lower', 'user', [sa.text('lower(email)')], True),
+    ('social_network_name_key', 'social_network', ['name'], True),
+)
+
+
+def upgrade() -> None:
+    # Concurrent build does not block writes, but can not run in transaction.
+    # If it fails, index is left INVALID and IF NOT EXISTS would keep it,
+    # so drop it before retrying the migration.
+    with op.get_context().autocommit_block():
+        for name, table, columns, unique in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=unique,
+                schema='public',
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                schema='public',
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
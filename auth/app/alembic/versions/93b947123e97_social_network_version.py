@@ -0,0 +1,43 @@
+"""Add social network version.
+
+Revision ID: 93b947123e97
+Revises: 88e3f2a01346
+Create Date: 2026-10-19 03:15:03.419916
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = '93b947123e97'
+down_revision: Union[str, None] = '88e3f2a01346'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Every insert and update takes the next value, so max(version) with
+    # count(*) tell whether the catalog has changed since the last load.
+    op.execute(sa.schema.CreateSequence(
+        sa.Sequence('social_network_version_seq', schema='public'),
+    ))
+    op.add_column(
+        'social_network',
+        sa.Column(
+            'version',
+            sa.BigInteger(),
+            server_default=sa.text(
+                "nextval('public.social_network_version_seq')",
+            ),
+            nullable=False,
+        ),
+        schema='public',
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('social_network', 'version', schema='public')
+    op.execute(sa.schema.DropSequence(
+        sa.Sequence('social_network_version_seq', schema='public'),
+    ))
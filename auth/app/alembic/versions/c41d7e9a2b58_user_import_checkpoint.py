@@ -0,0 +1,45 @@
+"""Add user import checkpoint.
+
+Revision ID: c41d7e9a2b58
+Revises: 93b947123e97
+Create Date: 2026-10-19 03:52:41.207315
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = 'c41d7e9a2b58'
+down_revision: Union[str, None] = '93b947123e97'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user_import_checkpoint',
+        sa.Column('source', sa.Text(), nullable=False),
+        sa.Column('records', sa.BigInteger(), nullable=False),
+        sa.Column('imported', sa.BigInteger(), nullable=False),
+        sa.Column('conflicts', sa.BigInteger(), nullable=False),
+        sa.Column('rejected', sa.BigInteger(), nullable=False),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('source'),
+        schema='public',
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('user_import_checkpoint', schema='public')
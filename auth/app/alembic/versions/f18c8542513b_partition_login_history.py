@@ -0,0 +1,145 @@
+"""Partition login history by month.
+
+Revision ID: f18c8542513b
+Revises: 3aff79c5a6a5
+Create Date: 2026-10-19 02:49:01.846957
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = 'f18c8542513b'
+down_revision: Union[str, None] = '3aff79c5a6a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Months created in advance, later partitions are created by
+# `python -m src.commands.login_history_partitions`.
+PREMAKE_MONTHS = 3
+CONSTRAINTS = (
+    'login_history_pkey',
+    'login_history_user_id_fkey',
+    'login_history_social_network_id_fkey',
+)
+
+
+def rename_constraints(table: str, suffix: str) -> None:
+    """Free constraint names of login_history for the new table."""
+    for constraint in CONSTRAINTS:
+        op.execute(
+            'ALTER TABLE public.{0} RENAME CONSTRAINT {1} TO {2}'.format(
+                table,
+                constraint,
+                constraint.replace(
+                    'login_history_', 'login_history_{0}_'.format(suffix), 1,
+                ),
+            )
+        )
+
+
+def upgrade() -> None:
+    # Partition bounds are calculated in UTC, whatever the server time zone.
+    op.execute("SET LOCAL TIME ZONE 'UTC'")
+    op.execute('ALTER TABLE public.login_history RENAME TO login_history_old')
+    rename_constraints('login_history_old', 'old')
+    op.execute(
+        """
+        CREATE TABLE public.login_history (
+            user_id UUID NOT NULL,
+            user_agent VARCHAR NOT NULL,
+            social_network_id UUID,
+            id UUID NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+            updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+            CONSTRAINT login_history_pkey PRIMARY KEY (id, created_at),
+            CONSTRAINT login_history_user_id_fkey
+                FOREIGN KEY (user_id) REFERENCES public."user" (id)
+                ON DELETE CASCADE,
+            CONSTRAINT login_history_social_network_id_fkey
+                FOREIGN KEY (social_network_id)
+                REFERENCES public.social_network (id)
+                ON DELETE SET NULL
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    # Catches rows outside of existing partitions instead of failing inserts.
+    op.execute(
+        'CREATE TABLE public.login_history_default '
+        'PARTITION OF public.login_history DEFAULT'
+    )
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            month_start TIMESTAMP WITH TIME ZONE := date_trunc(
+                'month',
+                coalesce(
+                    (SELECT min(created_at) FROM public.login_history_old),
+                    now()
+                )
+            );
+            last_month TIMESTAMP WITH TIME ZONE :=
+                date_trunc('month', now())
+                + make_interval(months => {premake});
+        BEGIN
+            WHILE month_start <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE public.%I PARTITION OF public.login_history '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'login_history_' || to_char(month_start, 'YYYY_MM'),
+                    month_start,
+                    month_start + interval '1 month'
+                );
+                month_start := month_start + interval '1 month';
+            END LOOP;
+        END $$
+        """.format(premake=PREMAKE_MONTHS)
+    )
+    op.execute(
+        """
+        INSERT INTO public.login_history (
+            user_id, user_agent, social_network_id, id, created_at, updated_at
+        )
+        SELECT user_id, user_agent, social_network_id, id, created_at, updated_at
+        FROM public.login_history_old
+        """
+    )
+    op.execute('DROP TABLE public.login_history_old')
+
+
+def downgrade() -> None:
+    op.execute(
+        'ALTER TABLE public.login_history RENAME TO login_history_partitioned'
+    )
+    rename_constraints('login_history_partitioned', 'partitioned')
+    op.execute(
+        """
+        CREATE TABLE public.login_history (
+            user_id UUID NOT NULL,
+            user_agent VARCHAR NOT NULL,
+            social_network_id UUID,
+            id UUID NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+            updated_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+            CONSTRAINT login_history_pkey PRIMARY KEY (id),
+            CONSTRAINT login_history_user_id_fkey
+                FOREIGN KEY (user_id) REFERENCES public."user" (id)
+                ON DELETE CASCADE,
+            CONSTRAINT login_history_social_network_id_fkey
+                FOREIGN KEY (social_network_id)
+                REFERENCES public.social_network (id)
+                ON DELETE SET NULL
+        )
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO public.login_history (
+            user_id, user_agent, social_network_id, id, created_at, updated_at
+        )
+        SELECT user_id, user_agent, social_network_id, id, created_at, updated_at
+        FROM public.login_history_partitioned
+        """
+    )
+    op.execute('DROP TABLE public.login_history_partitioned CASCADE')
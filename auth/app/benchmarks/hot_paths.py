@@ -0,0 +1,232 @@
+"""Microbenchmarks of hot paths of sign up and sign in.
+
+Measures hashing, JWT, Redis key names, DTO conversion and response
+serialization in the process, needs neither PostgreSQL nor Redis.
+Run from auth/app, results are written as JSON:
+
+    python -m benchmarks.hot_paths --output results.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import timeit
+import uuid
+from datetime import UTC, datetime
+from functools import partial
+from typing import Callable
+
+from fastapi.responses import ORJSONResponse
+from src.config import TokensSettings
+from src.domain.role.entities import Role
+from src.domain.role.value_objects import AccessLevel
+from src.domain.user.dto import UserDTO
+from src.domain.user.entities import User
+from src.domain.user_service.entities import UserService
+from src.infrastructure.interfaces.hashing.hasher import pwd_context
+from src.infrastructure.interfaces.tokens.entities import Token, TokenCreator
+from src.infrastructure.interfaces.tokens.key_schema import KeySchema
+from src.use_cases.user.dto import UserOutDTO
+
+PASSWORD = 'correct horse battery staple'  # noqa: S105 (Not a secret.)
+JWT_SECRET = 'benchmark'  # noqa: S105 (Not a secret.)
+ACCESS_TOKEN_EXPIRATION = 60 * 60
+REFRESH_TOKEN_EXPIRATION = 24 * 60 * 60
+NANOSECONDS_IN_SECOND = 10 ** 9
+DEFAULT_REPEAT = 5
+
+Cases = dict[str, Callable[[], object]]
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        '--output',
+        type=argparse.FileType('w'),
+        default=sys.stdout,
+        help='File for JSON results, stdout by default.',
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=DEFAULT_REPEAT,
+        help='Number of timed runs of every case.',
+    )
+    parser.add_argument(
+        '--select',
+        default='',
+        help='Run only cases with the substring in the name.',
+    )
+    parser.add_argument(
+        '--algorithm',
+        default='HS256',
+        help='JWT signing algorithm.',
+    )
+    return parser.parse_args()
+
+
+def password_cases() -> Cases:
+    """Build cases of password hashing.
+
+    Returns:
+        Cases: Calls by case name.
+    """
+    hashed = pwd_context.hash(PASSWORD)
+    return {
+        'bcrypt.hash': partial(pwd_context.hash, PASSWORD),
+        'bcrypt.verify': partial(pwd_context.verify, PASSWORD, hashed),
+    }
+
+
+def token_creator(algorithm: str) -> TokenCreator:
+    """Create token creator independent of the environment.
+
+    Args:
+        algorithm (str): JWT signing algorithm.
+
+    Returns:
+        TokenCreator: Token creator.
+    """
+    return TokenCreator(TokensSettings(
+        jwt_secret=JWT_SECRET,
+        encryption_algorithm=algorithm,
+        access_token_expiration=ACCESS_TOKEN_EXPIRATION,
+        refresh_token_expiration=REFRESH_TOKEN_EXPIRATION,
+    ))
+
+
+def token_cases(creator: TokenCreator) -> Cases:
+    """Build cases of JWT tokens and their Redis keys.
+
+    Args:
+        creator (TokenCreator): Token creator.
+
+    Returns:
+        Cases: Calls by case name.
+    """
+    uid = uuid.uuid4()
+    access = creator.create_access_token(uid)
+    refresh = creator.create_refresh_token(uid)
+    # Token without verified payload decodes on every call.
+    token = Token(access.get_encoded_token(), creator.config)
+    schema = KeySchema()
+    return {
+        'jwt.create_access_token': partial(creator.create_access_token, uid),
+        'jwt.create_refresh_token': partial(
+            creator.create_refresh_token, uid,
+        ),
+        'jwt.get_decoded_token': token.get_decoded_token,
+        'key_schema.user_access_token': partial(
+            schema.user_access_token, uid, access,
+        ),
+        'key_schema.user_refresh_token': partial(
+            schema.user_refresh_token, uid, refresh,
+        ),
+        'key_schema.social_account': partial(
+            schema.social_account, uid, '1234567890',
+        ),
+    }
+
+
+def model_cases(creator: TokenCreator) -> Cases:
+    """Build cases of user DTO conversion and serialization.
+
+    Args:
+        creator (TokenCreator): Token creator.
+
+    Returns:
+        Cases: Calls by case name.
+    """
+    role = Role.create('base', AccessLevel.base)
+    user = User.create(
+        'user@example.com',
+        'user',
+        pwd_context.hash(PASSWORD),
+        UserService.create(role),
+    )
+    fields = user.as_dto().model_dump()
+    out = UserOutDTO(
+        user=UserDTO.model_validate(fields),
+        access_token=creator.create_access_token(user.id).get_encoded_token(),
+        refresh_token=creator.create_refresh_token(
+            user.id,
+        ).get_encoded_token(),
+    )
+    return {
+        'user.as_dto': user.as_dto,
+        'user_dto.validate': partial(UserDTO.model_validate, fields),
+        # As FastAPI renders the validated response model.
+        'user_out_dto.response': lambda: ORJSONResponse(
+            out.model_dump(mode='json'),
+        ),
+    }
+
+
+def measure(call: Callable[[], object], repeat: int) -> dict:
+    """Time the call, number of calls per run is chosen by timeit.
+
+    Args:
+        call (Callable[[], object]): Benchmarked call.
+        repeat (int): Number of timed runs.
+
+    Returns:
+        dict: Nanoseconds per call of the runs.
+    """
+    timer = timeit.Timer(call)
+    number, _ = timer.autorange()
+    runs = [
+        elapsed * NANOSECONDS_IN_SECOND / number
+        for elapsed in timer.repeat(repeat=repeat, number=number)
+    ]
+    return {
+        'number': number,
+        'repeat': repeat,
+        'min_ns': min(runs),
+        'median_ns': statistics.median(runs),
+        'max_ns': max(runs),
+        'ops_per_second': NANOSECONDS_IN_SECOND / min(runs),
+    }
+
+
+def main(args: argparse.Namespace) -> None:
+    """Run selected cases and write results.
+
+    Args:
+        args (argparse.Namespace): Parsed arguments.
+    """
+    creator = token_creator(args.algorithm)
+    cases = {
+        **password_cases(),
+        **token_cases(creator),
+        **model_cases(creator),
+    }
+    timings = {
+        name: measure(call, args.repeat)
+        for name, call in cases.items()
+        if args.select in name
+    }
+    json.dump(
+        {
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'created_at': datetime.now(UTC).isoformat(),
+            'results': timings,
+        },
+        args.output,
+        indent=2,
+    )
+    args.output.write('\n')
+
+
+if __name__ == '__main__':
+    main(parse_args())
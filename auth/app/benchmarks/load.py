@@ -0,0 +1,286 @@
+"""In-process load test of sign up, sign in and login history.
+
+Drives the application through the ASGI transport of httpx, so results
+include middlewares, validation and serialization but no network.
+Storage is the one configured by the usual environment. Run from
+auth/app, results are written as JSON:
+
+    python -m benchmarks.load --concurrency 50 --duration 30
+
+Users are generated and signed up before the timed run, signed up
+users join the population during the run as well.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+from collections import Counter, defaultdict
+from datetime import UTC, datetime
+
+import httpx
+from src.api.main import app
+
+SIGNUP = 'signup'
+SIGNIN = 'signin'
+LOGIN_HISTORY = 'login_history'
+USERS_PATH = '/api/public/v1/user'
+PASSWORD = 'load-test-password'  # noqa: S105 (Not a secret.)
+REPORTED_PERCENTILES = (50, 95, 99)
+PERCENTILES = 100
+MILLISECONDS_IN_SECOND = 1000
+DEFAULT_MIX = 'signup=1,signin=6,login_history=3'
+DEFAULT_USERS = 20
+DEFAULT_LAG_INTERVAL = 0.01
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        '--output',
+        type=argparse.FileType('w'),
+        default=sys.stdout,
+        help='File for JSON results, stdout by default.',
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=10,
+        help='Number of clients sending requests one after another.',
+    )
+    parser.add_argument(
+        '--duration',
+        type=float,
+        default=10,
+        help='Seconds of the timed run.',
+    )
+    parser.add_argument(
+        '--users',
+        type=int,
+        default=DEFAULT_USERS,
+        help='Users signed up before the timed run.',
+    )
+    parser.add_argument(
+        '--mix',
+        default=DEFAULT_MIX,
+        help='Weights of operations, {0} by default.'.format(DEFAULT_MIX),
+    )
+    parser.add_argument(
+        '--lag-interval',
+        type=float,
+        default=DEFAULT_LAG_INTERVAL,
+        help='Seconds between checks of the event loop lag.',
+    )
+    return parser.parse_args()
+
+
+class LoadScenario:  # noqa: WPS306 (Without Base class.)
+    """Clients with synthetic users and collected latencies."""
+
+    def __init__(self, client: httpx.AsyncClient, mix: str) -> None:
+        """Init method.
+
+        Args:
+            client (httpx.AsyncClient): Client of the application.
+            mix (str): Weights of operations, e.g. signup=1,signin=6.
+        """
+        self._client = client
+        weights = dict(part.split('=') for part in mix.split(','))
+        self._operations = {
+            SIGNUP: self.signup,
+            SIGNIN: self.signin,
+            LOGIN_HISTORY: self.login_history,
+        }
+        self._names = list(weights)
+        self._weights = [float(weights[name]) for name in self._names]
+        self._run = uuid.uuid4().hex[:8]
+        self._created = 0
+        # Login and the latest access token of signed up users.
+        self.users: list[tuple[str, str]] = []
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.statuses: dict[str, Counter] = defaultdict(Counter)
+
+    def reset(self) -> None:
+        """Forget results of the warm up."""
+        self.latencies.clear()
+        self.statuses.clear()
+
+    async def signup(self) -> None:
+        """Sign up a new user and add it to the population."""
+        self._created += 1
+        login = 'load-{0}-{1}'.format(self._run, self._created)
+        response = await self._call(SIGNUP, 'POST', '/signup/', json={
+            'email': '{0}@example.com'.format(login),
+            'login': login,
+            'password': PASSWORD,
+        })
+        if response.is_success:
+            self.users.append((login, response.json()['access_token']))
+
+    async def signin(self) -> None:
+        """Sign in a random user, keeping its new access token."""
+        index = random.randrange(  # noqa: S311 (Not for security.)
+            len(self.users),
+        )
+        login, _ = self.users[index]
+        response = await self._call(SIGNIN, 'POST', '/signin/', json={
+            'credential': login,
+            'password': PASSWORD,
+        })
+        if response.is_success:
+            self.users[index] = (login, response.json()['access_token'])
+
+    async def login_history(self) -> None:
+        """Read login history of a random user by access token."""
+        _, token = random.choice(self.users)  # noqa: S311 (Not for security.)
+        await self._call(LOGIN_HISTORY, 'GET', '/login-history/', headers={
+            'Authorization': 'Bearer {0}'.format(token),
+        })
+
+    async def run_client(self, deadline: float) -> None:
+        """Send requests of random operations until the deadline.
+
+        Args:
+            deadline (float): Monotonic time to stop at.
+        """
+        while time.monotonic() < deadline:
+            name = random.choices(  # noqa: S311 (Not for security.)
+                self._names, self._weights,
+            )[0]
+            if name != SIGNUP and not self.users:
+                name = SIGNUP
+            await self._operations[name]()
+
+    async def run_clients(self, concurrency: int, duration: float) -> float:
+        """Run concurrent clients for the duration.
+
+        Args:
+            concurrency (int): Number of clients.
+            duration (float): Seconds to run.
+
+        Returns:
+            float: Seconds the clients actually ran.
+        """
+        started = time.monotonic()
+        await asyncio.gather(*(
+            self.run_client(started + duration) for _ in range(concurrency)
+        ))
+        return time.monotonic() - started
+
+    async def _call(
+        self, name: str, method: str, path: str, **kwargs,
+    ) -> httpx.Response:
+        started = time.perf_counter()
+        response = await self._client.request(
+            method, '{0}{1}'.format(USERS_PATH, path), **kwargs,
+        )
+        self.latencies[name].append(time.perf_counter() - started)
+        self.statuses[name][str(response.status_code)] += 1
+        return response
+
+
+async def watch_loop_lag(interval: float, lags: list[float]) -> None:
+    """Collect how late the event loop wakes up a sleeping task.
+
+    Args:
+        interval (float): Seconds to sleep between checks.
+        lags (list[float]): Collected lags in seconds.
+    """
+    while True:  # noqa: WPS457 (Cancelled after the run.)
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - started - interval)
+
+
+def summarize(latencies: list[float]) -> dict:
+    """Summarize latencies in milliseconds.
+
+    Args:
+        latencies (list[float]): Latencies in seconds.
+
+    Returns:
+        dict: Count and percentiles.
+    """
+    summary: dict = {'count': len(latencies)}
+    if not latencies:
+        return summary
+    ordered = sorted(latencies)
+    for percentile in REPORTED_PERCENTILES:
+        summary['p{0}_ms'.format(percentile)] = _milliseconds(
+            ordered[len(ordered) * percentile // PERCENTILES],
+        )
+    summary['max_ms'] = _milliseconds(ordered[-1])
+    return summary
+
+
+def _milliseconds(seconds: float) -> float:
+    return seconds * MILLISECONDS_IN_SECOND
+
+
+async def run(args: argparse.Namespace) -> dict:
+    """Warm up, sign up the population and run the clients.
+
+    Args:
+        args (argparse.Namespace): Parsed arguments.
+
+    Returns:
+        dict: Results of the timed run.
+    """
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url='http://auth',
+            headers={'User-Agent': 'benchmarks.load'},
+        ) as client:
+            scenario = LoadScenario(client, args.mix)
+            for _ in range(args.users):
+                await scenario.signup()
+            scenario.reset()
+            lags: list[float] = []
+            watcher = asyncio.create_task(
+                watch_loop_lag(args.lag_interval, lags),
+            )
+            elapsed = await scenario.run_clients(
+                args.concurrency, args.duration,
+            )
+            watcher.cancel()
+    return {
+        'concurrency': args.concurrency,
+        'duration': elapsed,
+        'throughput': sum(map(len, scenario.latencies.values())) / elapsed,
+        'operations': {
+            name: {
+                **summarize(latencies),
+                'statuses': dict(scenario.statuses[name]),
+            }
+            for name, latencies in scenario.latencies.items()
+        },
+        'loop_lag': summarize(lags),
+    }
+
+
+def main(args: argparse.Namespace) -> None:
+    """Run load test and write results.
+
+    Args:
+        args (argparse.Namespace): Parsed arguments.
+    """
+    report = asyncio.run(run(args))
+    report['created_at'] = datetime.now(UTC).isoformat()
+    json.dump(report, args.output, indent=2)
+    args.output.write('\n')
+
+
+if __name__ == '__main__':
+    main(parse_args())
@@ -0,0 +1,185 @@
+"""Import-time profile of the API and memory of Gunicorn workers.
+
+Imports the application in a fresh interpreter with -X importtime and
+reports wall time, peak RSS and the slowest modules. With the pid of
+a running Gunicorn master, memory of the master and every worker is
+read from /proc as well: Pss and private pages drop when workers share
+the preloaded app. Run from auth/app, results are written as JSON:
+
+    python -m benchmarks.startup --master-pid "$(pgrep -o gunicorn)"
+"""
+
+import argparse
+import json
+import platform
+import resource
+import subprocess  # noqa: S404 (Runs the interpreter only.)
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Optional
+
+APP_MODULE = 'src.api.main'
+DEFAULT_TOP = 20
+MICROSECONDS_IN_MILLISECOND = 1000
+MILLISECONDS_IN_SECOND = 1000
+# Fields of smaps_rollup in kB, private pages are not shared by fork.
+MEMORY_FIELDS = ('Rss', 'Pss', 'Private_Clean', 'Private_Dirty')
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        '--output',
+        type=argparse.FileType('w'),
+        default=sys.stdout,
+        help='File for JSON results, stdout by default.',
+    )
+    parser.add_argument(
+        '--module',
+        default=APP_MODULE,
+        help='Module to import.',
+    )
+    parser.add_argument(
+        '--top',
+        type=int,
+        default=DEFAULT_TOP,
+        help='Number of the slowest modules to report.',
+    )
+    parser.add_argument(
+        '--master-pid',
+        type=int,
+        default=None,
+        help='Pid of Gunicorn master to read memory of workers.',
+    )
+    return parser.parse_args()
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """Parse output of -X importtime.
+
+    Args:
+        stderr (str): Standard error of the interpreter.
+
+    Returns:
+        list[tuple[str, int, int]]: Module, self and cumulative time in us.
+    """
+    timings = []
+    for line in stderr.splitlines():
+        fields = line.removeprefix('import time:').split('|')
+        if len(fields) == 3 and fields[0].strip().isdigit():
+            timings.append((
+                fields[2].strip(),
+                int(fields[0]),
+                int(fields[1]),
+            ))
+    return timings
+
+
+def profile_imports(module: str, top: int) -> dict:
+    """Import the module in a fresh interpreter and time its imports.
+
+    Args:
+        module (str): Module to import.
+        top (int): Number of the slowest modules to report.
+
+    Returns:
+        dict: Wall time, peak RSS and the slowest modules.
+    """
+    command = 'import {0}'.format(module)
+    started = time.perf_counter()
+    completed = subprocess.run(  # noqa: S603 (Arguments are ours.)
+        [sys.executable, '-X', 'importtime', '-c', command],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed = time.perf_counter() - started
+    timings = parse_importtime(completed.stderr)
+    timings.sort(key=lambda timing: timing[1], reverse=True)
+    return {
+        'wall_ms': elapsed * MILLISECONDS_IN_SECOND,
+        'imports_ms': sum(
+            timing[1] for timing in timings
+        ) / MICROSECONDS_IN_MILLISECOND,
+        'modules': len(timings),
+        'max_rss_kb': resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+        'slowest_self_ms': {
+            name: self_us / MICROSECONDS_IN_MILLISECOND
+            for name, self_us, _ in timings[:top]
+        },
+    }
+
+
+def read_memory(pid: int) -> dict[str, int]:
+    """Read memory of the process.
+
+    Args:
+        pid (int): Process ID.
+
+    Returns:
+        dict[str, int]: Fields of smaps_rollup in kB.
+    """
+    memory = {}
+    rollup = Path('/proc/{0}/smaps_rollup'.format(pid)).read_text()
+    for line in rollup.splitlines():
+        name, _, size = line.partition(':')
+        if name in MEMORY_FIELDS:
+            memory[name] = int(size.split()[0])
+    return memory
+
+
+def read_workers_memory(master_pid: int) -> dict:
+    """Read memory of Gunicorn master and its workers.
+
+    Args:
+        master_pid (int): Pid of Gunicorn master.
+
+    Returns:
+        dict: Memory of the master and of every worker by pid.
+    """
+    children = Path(
+        '/proc/{0}/task/{0}/children'.format(master_pid),
+    ).read_text().split()
+    return {
+        'master': read_memory(master_pid),
+        'workers': {pid: read_memory(int(pid)) for pid in children},
+    }
+
+
+def main(args: argparse.Namespace) -> None:
+    """Profile imports, read memory of workers and write results.
+
+    Args:
+        args (argparse.Namespace): Parsed arguments.
+    """
+    report: dict[str, Optional[dict]] = {
+        'imports': profile_imports(args.module, args.top),
+        'gunicorn': None,
+    }
+    if args.master_pid is not None:
+        report['gunicorn'] = read_workers_memory(args.master_pid)
+    json.dump(
+        {
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'created_at': datetime.now(UTC).isoformat(),
+            'results': report,
+        },
+        args.output,
+        indent=2,
+    )
+    args.output.write('\n')
+
+
+if __name__ == '__main__':
+    main(parse_args())
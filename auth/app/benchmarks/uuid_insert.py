@@ -0,0 +1,137 @@
+"""Benchmark of inserts keyed by random UUIDv4 and time-ordered UUIDv7.
+
+Fills two tables shaped like login_history with the same number of rows
+and reports insert throughput, primary key index size and WAL volume.
+Needs PostgreSQL configured by the usual environment, run from auth/app:
+
+    python -m benchmarks.uuid_insert --rows 10000000
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import UTC, datetime
+from types import MappingProxyType
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+from src.config import PostgreSQLSettings
+from src.domain.base import uuid7
+from src.infrastructure.databases import PostgreSQL
+
+GENERATORS = MappingProxyType({
+    'uuid4': uuid.uuid4,
+    'uuid7': uuid7,
+})
+DEFAULT_ROWS = 10 ** 7
+DEFAULT_BATCH = 10 ** 4
+CREATE_TABLE = """
+    CREATE TABLE {table} (
+        id UUID PRIMARY KEY,
+        user_id UUID NOT NULL,
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL
+    )
+"""
+STATS_QUERY = """
+    SELECT
+        pg_relation_size(to_regclass('{table}_pkey')),
+        pg_wal_lsn_diff(pg_current_wal_lsn(), '0/0')
+"""
+MEGABYTE = 1024 * 1024
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=DEFAULT_ROWS)
+    parser.add_argument('--batch', type=int, default=DEFAULT_BATCH)
+    return parser.parse_args()
+
+
+async def fill(
+    conn: AsyncConnection,
+    table: str,
+    generator: Callable[[], uuid.UUID],
+    args: argparse.Namespace,
+) -> float:
+    """Create table and insert rows in batches, as steady write load does.
+
+    Args:
+        conn (AsyncConnection): Connection to the database.
+        table (str): Name of the table.
+        generator (Callable[[], uuid.UUID]): Primary key generator.
+        args (argparse.Namespace): Parsed arguments.
+
+    Returns:
+        float: Seconds spent on inserts, key generation excluded.
+    """
+    await conn.exec_driver_sql(CREATE_TABLE.format(table=table))
+    driver = (await conn.get_raw_connection()).driver_connection
+    user_id = uuid.uuid4()
+    elapsed: float = 0
+    for offset in range(0, args.rows, args.batch):
+        now = datetime.now(UTC)
+        records = [
+            (generator(), user_id, now)
+            for _ in range(min(args.batch, args.rows - offset))
+        ]
+        started = time.perf_counter()
+        await driver.copy_records_to_table(
+            table, records=records, columns=('id', 'user_id', 'created_at'),
+        )
+        elapsed += time.perf_counter() - started
+    return elapsed
+
+
+async def run(conn: AsyncConnection, name: str, args: argparse.Namespace):
+    """Run benchmark for one key generator and print results.
+
+    Args:
+        conn (AsyncConnection): Connection to the database.
+        name (str): Name of key generator.
+        args (argparse.Namespace): Parsed arguments.
+    """
+    table = 'benchmark_{name}'.format(name=name)
+    await conn.exec_driver_sql('DROP TABLE IF EXISTS {0}'.format(table))
+    _, wal_start = (await conn.exec_driver_sql(
+        STATS_QUERY.format(table=table),
+    )).one()
+
+    elapsed = await fill(conn, table, GENERATORS[name], args)
+
+    index_size, wal_end = (await conn.exec_driver_sql(
+        STATS_QUERY.format(table=table),
+    )).one()
+    await conn.exec_driver_sql('DROP TABLE {0}'.format(table))
+    print(  # noqa: WPS421 (Benchmark report.)
+        '{name}: {rows} rows, {rate:.0f} rows/s, '.format(
+            name=name, rows=args.rows, rate=args.rows / elapsed,
+        )
+        + 'pkey {index:.1f} MiB, WAL {wal:.1f} MiB'.format(
+            index=index_size / MEGABYTE,
+            wal=int(wal_end - wal_start) / MEGABYTE,
+        ),
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run benchmarks.
+
+    Args:
+        args (argparse.Namespace): Parsed arguments.
+    """
+    postgresql = PostgreSQL(PostgreSQLSettings())
+    engine = postgresql.engine.execution_options(isolation_level='AUTOCOMMIT')
+    async with engine.connect() as conn:
+        for name in GENERATORS:
+            await run(conn, name, args)
+    await postgresql.engine.dispose()
+
+
+if __name__ == '__main__':
+    asyncio.run(main(parse_args()))
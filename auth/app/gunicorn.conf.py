@@ -0,0 +1,58 @@
+"""Gunicorn configuration of the API."""
+
+import gc
+import os
+import shutil
+
+# Workers write Prometheus metrics to files in the directory and
+# /metrics aggregates them, the variable must be set before workers
+# import prometheus_client.
+metrics_dir = os.environ.setdefault(
+    'PROMETHEUS_MULTIPROC_DIR', '/tmp/auth-prometheus',  # noqa: S108
+)
+# The preloaded app creates metrics before on_starting is called.
+os.makedirs(metrics_dir, exist_ok=True)
+
+bind = '0.0.0.0:8000'
+workers = 4
+worker_class = 'uvicorn.workers.UvicornWorker'
+# The master imports the app, settings and the wired container once,
+# workers share the pages until written. Engines, pools and threads
+# are started by the lifespan of every worker, after fork.
+preload_app = True
+
+
+def on_starting(server):
+    """Remove metrics of the previous run.
+
+    Args:
+        server (Arbiter): Gunicorn master.
+    """
+    # Files of the master are dropped as well, it counts nothing.
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir)
+
+
+def pre_fork(server, worker):
+    """Keep the garbage collector off objects of the preloaded app.
+
+        Frozen objects are not traversed by collections of the worker,
+        so their headers are not written and pages stay shared.
+
+    Args:
+        server (Arbiter): Gunicorn master.
+        worker (Worker): Worker to be forked.
+    """
+    gc.freeze()
+
+
+def child_exit(server, worker):
+    """Drop live gauges of the exited worker.
+
+    Args:
+        server (Arbiter): Gunicorn master.
+        worker (Worker): Exited worker.
+    """
+    from prometheus_client import multiprocess  # noqa: WPS433 (Nested Import)
+
+    multiprocess.mark_process_dead(worker.pid)
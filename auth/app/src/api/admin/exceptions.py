@@ -0,0 +1,15 @@
+"""Module with API exceptions."""
+
+from http import HTTPStatus
+
+from fastapi import HTTPException
+
+TOKEN_NOT_VALID = HTTPException(
+    status_code=HTTPStatus.UNAUTHORIZED,
+    detail='Token is not valid or expired.',
+    headers={'WWW-Authenticate': 'Bearer'},
+)
+ACCESS_DENIED = HTTPException(
+    status_code=HTTPStatus.FORBIDDEN,
+    detail='Superuser access level is required.',
+)
@@ -0,0 +1,11 @@
+"""Module with admin API routers."""
+
+from fastapi import APIRouter
+from src.api.admin.v1 import handlers
+
+router = APIRouter()
+router.include_router(
+    handlers.router,
+    prefix='/v1/sampling',
+    tags=['admin'],
+)
@@ -0,0 +1,122 @@
+"""Module with admin API handlers."""
+
+from http import HTTPStatus
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from src.api.admin.exceptions import ACCESS_DENIED, TOKEN_NOT_VALID
+from src.containers import Container
+from src.use_cases.exceptions import AccessDenied, TokenNotValid
+from src.use_cases.sampling.dto import SamplingRatesDTO
+from src.use_cases.sampling.rates import SamplingRatesUseCase
+
+router = APIRouter()
+bearer = HTTPBearer()
+
+
+@router.get(
+    path='/',
+    status_code=HTTPStatus.OK,
+    response_model=SamplingRatesDTO,
+    responses={
+        HTTPStatus.UNAUTHORIZED: {
+            'content': {
+                'application/json': {
+                    'example': {'detail': TOKEN_NOT_VALID.detail},
+                },
+            },
+        },
+        HTTPStatus.FORBIDDEN: {
+            'content': {
+                'application/json': {
+                    'example': {'detail': ACCESS_DENIED.detail},
+                },
+            },
+        },
+    },
+    summary='Get Sentry sampling rates',
+)
+@inject
+async def retrieve_sampling_rates(
+    credentials: HTTPAuthorizationCredentials = Depends(bearer),
+    use_case: SamplingRatesUseCase = Depends(
+        Provide[Container.sampling_rates_use_case],
+    ),
+) -> SamplingRatesDTO:
+    """Get sampling rates handler.
+
+    Args:
+        credentials (HTTPAuthorizationCredentials): Bearer access token.
+        use_case (SamplingRatesUseCase): Sampling rates use case.
+
+    Raises:
+        TOKEN_NOT_VALID: If access token not valid.
+        ACCESS_DENIED: If token owner is not superuser.
+
+    Returns:
+        SamplingRatesDTO: Rates used by the process.
+    """
+    try:
+        res = await use_case.retrieve(credentials.credentials)
+    except TokenNotValid:
+        raise TOKEN_NOT_VALID
+    except AccessDenied:
+        raise ACCESS_DENIED
+    return res
+
+
+@router.put(
+    path='/',
+    status_code=HTTPStatus.OK,
+    response_model=SamplingRatesDTO,
+    responses={
+        HTTPStatus.UNAUTHORIZED: {
+            'content': {
+                'application/json': {
+                    'example': {'detail': TOKEN_NOT_VALID.detail},
+                },
+            },
+        },
+        HTTPStatus.FORBIDDEN: {
+            'content': {
+                'application/json': {
+                    'example': {'detail': ACCESS_DENIED.detail},
+                },
+            },
+        },
+    },
+    summary='Change Sentry sampling rates',
+)
+@inject
+async def change_sampling_rates(
+    body: SamplingRatesDTO,
+    credentials: HTTPAuthorizationCredentials = Depends(bearer),
+    use_case: SamplingRatesUseCase = Depends(
+        Provide[Container.sampling_rates_use_case],
+    ),
+) -> SamplingRatesDTO:
+    """Change sampling rates handler.
+
+    Rates are applied by all processes of the service and kept
+    until changed again.
+
+    Args:
+        body (SamplingRatesDTO): New rates.
+        credentials (HTTPAuthorizationCredentials): Bearer access token.
+        use_case (SamplingRatesUseCase): Sampling rates use case.
+
+    Raises:
+        TOKEN_NOT_VALID: If access token not valid.
+        ACCESS_DENIED: If token owner is not superuser.
+
+    Returns:
+        SamplingRatesDTO: Applied rates.
+    """
+    try:
+        res = await use_case.change(credentials.credentials, body)
+    except TokenNotValid:
+        raise TOKEN_NOT_VALID
+    except AccessDenied:
+        raise ACCESS_DENIED
+    return res
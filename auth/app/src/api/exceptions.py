@@ -0,0 +1,29 @@
+"""Module with API exceptions common for all routers."""
+
+import math
+from http import HTTPStatus
+
+from fastapi import Request
+from fastapi.responses import ORJSONResponse
+from src.use_cases.exceptions import DependencyUnavailable
+
+SERVICE_UNAVAILABLE_DETAIL = 'Service is temporarily unavailable.'
+
+
+async def dependency_unavailable_handler(
+    request: Request, exc: DependencyUnavailable,
+) -> ORJSONResponse:
+    """Answer 503 without waiting for unhealthy Database or Cache.
+
+    Args:
+        request (Request): Request which failed.
+        exc (DependencyUnavailable): Raised exception.
+
+    Returns:
+        ORJSONResponse: Response with Retry-After header.
+    """
+    return ORJSONResponse(
+        status_code=HTTPStatus.SERVICE_UNAVAILABLE,
+        content={'detail': SERVICE_UNAVAILABLE_DETAIL},
+        headers={'Retry-After': str(max(math.ceil(exc.retry_after), 1))},
+    )
@@ -0,0 +1,47 @@
+"""Module with health API routers."""
+
+from http import HTTPStatus
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
+from src.containers import Container
+from src.infrastructure.health import HealthMonitor
+
+router = APIRouter()
+
+
+@router.get(path='/health/live', include_in_schema=False)
+async def live() -> dict[str, str]:
+    """Answer while the event loop of the worker serves requests.
+
+        Dependencies are not checked, restart of the worker
+        does not bring them back.
+
+    Returns:
+        dict[str, str]: Status of the worker.
+    """
+    return {'status': 'alive'}
+
+
+@router.get(path='/health/ready', include_in_schema=False)
+@inject
+async def ready(
+    monitor: HealthMonitor = Depends(Provide[Container.health_monitor]),
+) -> ORJSONResponse:
+    """Answer whether the worker may take traffic.
+
+        Answered from the state in process memory, no connection
+        is opened, so checks may be frequent.
+
+    Args:
+        monitor (HealthMonitor): Health of the worker and dependencies.
+
+    Returns:
+        ORJSONResponse: Report, with 503 status if not ready.
+    """
+    report = monitor.report()
+    status = HTTPStatus.OK
+    if not report['ready']:
+        status = HTTPStatus.SERVICE_UNAVAILABLE
+    return ORJSONResponse(report, status_code=status)
@@ -1,30 +1,42 @@
 """Module with API entry point."""
 
-import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.responses import ORJSONResponse
 from src import api
+from src.api.exceptions import dependency_unavailable_handler
+from src.api.middlewares import (
+    DeadlineMiddleware,
+    MetricsMiddleware,
+    ReadYourWritesMiddleware,
+)
 from src.api.routers import init_routers
 from src.config import APISettings, LoggingSettings
 from src.containers import Container
-from src.logging import get_logging_config
+from src.infrastructure.sampling import TraceSampler
+from src.logging import start_logging, stop_logging
+from src.use_cases.exceptions import DependencyUnavailable
 
 
-def setup_logging():
-    """Set logging configuration."""
-    logging_config = LoggingSettings()
+def setup_sentry(sampler: TraceSampler, app: FastAPI):
+    """Init Sentry with adaptive sampling of traces.
 
-    logging.config.dictConfig(get_logging_config())
+    Args:
+        sampler (TraceSampler): Sampler with rates shared by processes.
+        app (FastAPI): Application with routes keying the rates.
+    """
+    logging_config = LoggingSettings()
 
     if logging_config.use_sentry:
+        sampler.routes = app.routes
         import sentry_sdk  # noqa: WPS433 (Nested Import)
 
         sentry_sdk.init(
             dsn=logging_config.sentry_dsn,
-            traces_sample_rate=1.0,
-            profiles_sample_rate=1.0,
+            traces_sampler=sampler.traces_sampler,
+            profiles_sampler=sampler.profiles_sampler,
+            before_send_transaction=sampler.before_send_transaction,
         )
 
 
@@ -35,15 +47,26 @@ async def lifespan(app: FastAPI):
     Args:
         app (FastAPI): FastAPI application instance.
 
+    Raises:
+        BaseException: Exception of the app, after the logs are written.
+
     Yields:
         None: None. :)
     """
-    setup_logging()
-    async with Container.lifespan(wireable_packages=[api]):
-        yield
+    listener = start_logging()
+    try:
+        async with Container.lifespan(container) as started:
+            setup_sentry(started.trace_sampler(), app)
+            yield
+    except BaseException:  # noqa: WPS424 (Cancellation as well.)
+        stop_logging(listener)
+        raise
+    stop_logging(listener)
 
 
 config = APISettings()
+# Built on import, so preloaded by the Gunicorn master and shared.
+container = Container.build(wireable_packages=[api])
 
 app = FastAPI(
     lifespan=lifespan,
@@ -53,4 +76,18 @@ app = FastAPI(
     default_response_class=ORJSONResponse,
 )
 
+app.add_middleware(
+    DeadlineMiddleware,
+    timeout=config.request_timeout,
+    route_timeouts=config.route_timeouts,
+)
+app.add_middleware(
+    ReadYourWritesMiddleware,
+    window=Container.config.postgresql_settings.db_read_your_writes_window,
+)
+# The outermost, so timed out and shed requests are observed as well.
+app.add_middleware(MetricsMiddleware)
+app.add_exception_handler(
+    DependencyUnavailable, dependency_unavailable_handler,
+)
 init_routers(app)
@@ -0,0 +1,35 @@
+"""Module with metrics API routers."""
+
+import os
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    generate_latest,
+    multiprocess,
+)
+
+router = APIRouter()
+
+
+@router.get(path='/metrics', include_in_schema=False)
+def metrics() -> Response:
+    """Export metrics in Prometheus text format.
+
+        Under gunicorn metrics of all workers are aggregated from their
+        files, which is blocking, so the handler runs in a thread.
+
+    Returns:
+        Response: Metrics of the service.
+    """
+    registry = REGISTRY
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    return Response(
+        generate_latest(registry),
+        headers={'Content-Type': CONTENT_TYPE_LATEST},
+    )
@@ -0,0 +1,232 @@
+"""Module with API middlewares."""
+
+import asyncio
+import logging
+import math
+import time
+from functools import partial
+from http import HTTPStatus
+from typing import Optional
+
+from src.infrastructure.databases import ReadYourWrites, read_your_writes
+from src.infrastructure.deadlines import remaining, set_deadline
+from src.infrastructure.metrics import REQUEST_LATENCY
+from src.infrastructure.routes import route_template
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+READ_YOUR_WRITES_COOKIE = 'db-primary-until'
+REQUEST_TIMEOUT_HEADER = 'x-request-timeout'
+UNMATCHED_ROUTE = 'unmatched'
+
+
+class ReadYourWritesMiddleware:  # noqa: WPS306 (Without Base class.)
+    """Keep reads of the client on the primary after its writes.
+
+    Time until which reads go to the primary is passed to the client
+    in a cookie, so its next requests, served by any process, read
+    what it has just written, not a lagging replica.
+    """
+
+    def __init__(self, app: ASGIApp, window: float) -> None:
+        """Init method.
+
+        Args:
+            app (ASGIApp): ASGI application.
+            window (float): Read-your-writes window in seconds.
+        """
+        self.app = app
+        self._window = window
+        self._max_age = math.ceil(window)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Run application with read-your-writes state of the client.
+
+        Args:
+            scope (Scope): ASGI connection scope.
+            receive (Receive): ASGI receive channel.
+            send (Send): ASGI send channel.
+        """
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        until = self._parse_until(
+            HTTPConnection(scope).cookies.get(READ_YOUR_WRITES_COOKIE),
+        )
+        state = ReadYourWrites(until)
+        read_your_writes.set(state)
+        await self.app(
+            scope, receive, partial(self._send, send, state, until),
+        )
+
+    def _parse_until(self, cookie: Optional[str]) -> float:
+        try:
+            until = float(cookie or 0)
+        except ValueError:
+            return 0
+        if not math.isfinite(until):
+            return 0
+        # Client may set the cookie itself, it never extends the window.
+        return min(until, time.time() + self._window)
+
+    async def _send(
+        self,
+        send: Send,
+        state: ReadYourWrites,
+        initial_until: float,
+        message: Message,
+    ) -> None:
+        written = state.until > initial_until
+        if message['type'] == 'http.response.start' and written:
+            MutableHeaders(scope=message).append(
+                'set-cookie',
+                '{0}={1:.3f}; Max-Age={2}; Path=/; HttpOnly'.format(
+                    READ_YOUR_WRITES_COOKIE, state.until, self._max_age,
+                ),
+            )
+        await send(message)
+
+
+class DeadlineMiddleware:  # noqa: WPS306 (Without Base class.)
+    """Cancel requests which outlive their deadline.
+
+    Deadline is the route timeout, or the default one, shortened by
+    X-Request-Timeout header of the client or gateway. Database and
+    Cache calls take the rest of it as their timeouts, and the request
+    still running at the deadline is cancelled with 504, nobody waits
+    for its answer anymore.
+    """
+
+    def __init__(
+        self, app: ASGIApp, timeout: float, route_timeouts: dict[str, float],
+    ) -> None:
+        """Init method.
+
+        Args:
+            app (ASGIApp): ASGI application.
+            timeout (float): Default timeout in seconds.
+            route_timeouts (dict[str, float]): Timeouts by route template.
+        """
+        self.app = app
+        self._timeout = timeout
+        self._route_timeouts = route_timeouts
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Run application until deadline.
+
+        Args:
+            scope (Scope): ASGI connection scope.
+            receive (Receive): ASGI receive channel.
+            send (Send): ASGI send channel.
+
+        Raises:
+            TimeoutError: If timed out something else than the request.
+        """
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        timeout = self._route_timeout(scope)
+        client_timeout = self._client_timeout(scope)
+        if client_timeout is not None:
+            timeout = min(timeout, client_timeout)
+        when = set_deadline(timeout)
+        started: list[bool] = []
+        try:
+            async with asyncio.timeout_at(when):
+                await self.app(
+                    scope, receive, partial(self._send, send, started),
+                )
+        except TimeoutError:
+            time_left = remaining()
+            if time_left is None or time_left > 0:
+                raise
+            logger.warning('Request exceeded its timeout.', extra={
+                'method': scope['method'],
+                'path': scope['path'],
+                'timeout': timeout,
+            })
+            if not started:
+                await Response(status_code=HTTPStatus.GATEWAY_TIMEOUT)(
+                    scope, receive, send,
+                )
+
+    def _route_timeout(self, scope: Scope) -> float:
+        if not self._route_timeouts:
+            return self._timeout
+        # Application puts itself into the scope before middlewares.
+        route = route_template(scope['app'].routes, scope)
+        return self._route_timeouts.get(route or '', self._timeout)
+
+    def _client_timeout(self, scope: Scope) -> Optional[float]:
+        header = Headers(scope=scope).get(REQUEST_TIMEOUT_HEADER)
+        try:
+            return float(header) if header else None
+        except ValueError:
+            return None
+
+    async def _send(
+        self, send: Send, started: list[bool], message: Message,
+    ) -> None:
+        started.append(True)
+        await send(message)
+
+
+class MetricsMiddleware:  # noqa: WPS306 (Without Base class.)
+    """Observe latency of requests by route and status.
+
+    Requests are labelled by the path template of the route, so ids in
+    paths do not multiply series. Requests failed before the response
+    started are counted with status 500, as server error middleware
+    answers them.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Init method.
+
+        Args:
+            app (ASGIApp): ASGI application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Run application and observe its latency.
+
+        Args:
+            scope (Scope): ASGI connection scope.
+            receive (Receive): ASGI receive channel.
+            send (Send): ASGI send channel.
+
+        Raises:
+            BaseException: Exception of the application, after observing.
+        """
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        started = time.perf_counter()
+        status = [HTTPStatus.INTERNAL_SERVER_ERROR]
+        try:
+            await self.app(scope, receive, partial(self._send, send, status))
+        except BaseException:  # noqa: WPS424 (Cancellation as well.)
+            self._observe(scope, status[-1], started)
+            raise
+        self._observe(scope, status[-1], started)
+
+    def _observe(self, scope: Scope, status: int, started: float) -> None:
+        # Router puts the matched route into the shared scope.
+        route = scope.get('route')
+        REQUEST_LATENCY.labels(
+            scope['method'],
+            route.path if route else UNMATCHED_ROUTE,
+            status,
+        ).observe(time.perf_counter() - started)
+
+    async def _send(
+        self, send: Send, status: list[int], message: Message,
+    ) -> None:
+        if message['type'] == 'http.response.start':
+            status.append(message['status'])
+        await send(message)
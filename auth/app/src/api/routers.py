@@ -1,7 +1,11 @@
 """Module with API routers."""
 
 from fastapi import FastAPI
-from src.api.user.routers import router
+from src.api.admin.routers import router as admin_router
+from src.api.health.routers import router as health_router
+from src.api.metrics.routers import router as metrics_router
+from src.api.social_network.routers import router as social_network_router
+from src.api.user.routers import router as user_router
 
 
 def init_routers(app: FastAPI):
@@ -10,4 +14,8 @@ def init_routers(app: FastAPI):
     Args:
         app (FastAPI): FastAPI application instance.
     """
-    app.include_router(router, prefix='/api/public')
+    app.include_router(user_router, prefix='/api/public')
+    app.include_router(social_network_router, prefix='/api/public')
+    app.include_router(admin_router, prefix='/api/admin')
+    app.include_router(metrics_router)
+    app.include_router(health_router)
@@ -0,0 +1,11 @@
+"""Module with social networks API routers."""
+
+from fastapi import APIRouter
+from src.api.social_network.v1 import handlers
+
+router = APIRouter()
+router.include_router(
+    handlers.router,
+    prefix='/v1/social-networks',
+    tags=['social networks'],
+)
@@ -0,0 +1,78 @@
+"""Module with social networks API handlers."""
+
+from http import HTTPStatus
+from typing import Optional, Union
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, Header, Response
+from src.containers import Container
+from src.domain.social_network.dto import SocialNetworkDTO
+from src.use_cases.social_network.catalog import ListSocialNetworksUseCase
+
+router = APIRouter()
+
+WEAK_PREFIX = 'W/'
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """Check If-None-Match header against entity tag.
+
+        Weak comparison is used, as required for If-None-Match.
+
+    Args:
+        etag (str): Current entity tag.
+        if_none_match (str, optional): Value of If-None-Match header.
+
+    Returns:
+        bool: True if client has the current representation.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    return any(
+        candidate.strip().removeprefix(WEAK_PREFIX) == etag
+        for candidate in if_none_match.split(',')
+    )
+
+
+@router.get(
+    path='/',
+    status_code=HTTPStatus.OK,
+    response_model=list[SocialNetworkDTO],
+    responses={
+        HTTPStatus.NOT_MODIFIED: {
+            'description': 'Social networks were not changed.',
+        },
+    },
+    summary='List social networks',
+)
+@inject
+async def list_social_networks(
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+    use_case: ListSocialNetworksUseCase = Depends(
+        Provide[Container.list_social_networks_use_case],
+    ),
+) -> Union[list[SocialNetworkDTO], Response]:
+    """List social networks available for sign in.
+
+        Served from process memory with strong ETag,
+        revalidated requests are answered with 304 without body.
+
+    Args:
+        response (Response): Response to set headers to.
+        if_none_match (str, optional): Entity tags known to client.
+        use_case (ListSocialNetworksUseCase):
+        Use case for listing social networks.
+
+    Returns:
+        Union[list[SocialNetworkDTO], Response]:
+        Social networks or empty 304 response.
+    """
+    etag = use_case.etag()
+    headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+    if etag_matches(etag, if_none_match):
+        return Response(status_code=HTTPStatus.NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return use_case.execute()
@@ -16,3 +16,12 @@ CREDENTIAL_OR_PASSWORD_NOT_CORRECT = HTTPException(
     status_code=HTTPStatus.UNAUTHORIZED,
     detail='Credential or password not correct.',
 )
+TOKEN_NOT_VALID = HTTPException(
+    status_code=HTTPStatus.UNAUTHORIZED,
+    detail='Token is not valid or expired.',
+    headers={'WWW-Authenticate': 'Bearer'},
+)
+CURSOR_NOT_VALID = HTTPException(
+    status_code=HTTPStatus.BAD_REQUEST,
+    detail='Pagination cursor is not valid.',
+)
@@ -1,26 +1,41 @@
 """Module with users API handlers."""
 
 from http import HTTPStatus
+from typing import Optional
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from src.api.user.exceptions import (
     BASE_ROLE_NOT_FOUND,
     CREDENTIAL_OR_PASSWORD_NOT_CORRECT,
+    CURSOR_NOT_VALID,
+    TOKEN_NOT_VALID,
     USER_ALREADY_EXISTS,
 )
 from src.containers import Container
+from src.domain.login_history.exceptions import InvalidCursor
 from src.domain.repositories.role.exceptions import BaseRoleNotFoundError
 from src.domain.repositories.user.exceptions import (
     UserAlreadyExists,
     UserNotFoundError,
 )
-from src.use_cases.exceptions import PasswordNotCorrect
-from src.use_cases.user.dto import UserOutDTO, UserSignInDTO, UserSignUpDTO
+from src.use_cases.exceptions import PasswordNotCorrect, TokenNotValid
+from src.use_cases.user.dto import (
+    LoginHistoryPageDTO,
+    UserOutDTO,
+    UserSignInDTO,
+    UserSignUpDTO,
+)
+from src.use_cases.user.login_history import LoginHistoryUseCase
 from src.use_cases.user.signin import SignInUseCase
 from src.use_cases.user.signup import SignUpUseCase
 
 router = APIRouter()
+bearer = HTTPBearer()
+
+LOGIN_HISTORY_PAGE_SIZE = 20
+LOGIN_HISTORY_MAX_PAGE_SIZE = 100
 
 
 @router.post(
@@ -92,12 +107,14 @@ async def signup(
 @inject
 async def signin(
     body: UserSignInDTO,
+    user_agent: str = Header(default=''),
     use_case: SignInUseCase = Depends(Provide[Container.signin_use_case]),
 ) -> UserOutDTO:
     """Sign in handler.
 
     Args:
         body (UserSignInDTO): Data for sign in.
+        user_agent (str): User-Agent header of the client.
         use_case (SignInUseCase): Sign in Use case.
 
     Raises:
@@ -107,7 +124,66 @@ async def signin(
         UserOutDTO: Output data with new user info.
     """
     try:
-        res = await use_case.execute(body)
+        res = await use_case.execute(body, user_agent)
     except (UserNotFoundError, PasswordNotCorrect):
         raise CREDENTIAL_OR_PASSWORD_NOT_CORRECT
     return res
+
+
+@router.get(
+    path='/login-history/',
+    status_code=HTTPStatus.OK,
+    response_model=LoginHistoryPageDTO,
+    responses={
+        HTTPStatus.UNAUTHORIZED: {
+            'content': {
+                'application/json': {
+                    'example': {'detail': TOKEN_NOT_VALID.detail},
+                },
+            },
+        },
+        HTTPStatus.BAD_REQUEST: {
+            'content': {
+                'application/json': {
+                    'example': {'detail': CURSOR_NOT_VALID.detail},
+                },
+            },
+        },
+    },
+)
+@inject
+async def login_history(
+    credentials: HTTPAuthorizationCredentials = Depends(bearer),
+    cursor: Optional[str] = None,
+    limit: int = Query(
+        default=LOGIN_HISTORY_PAGE_SIZE, ge=1, le=LOGIN_HISTORY_MAX_PAGE_SIZE,
+    ),
+    use_case: LoginHistoryUseCase = Depends(
+        Provide[Container.login_history_use_case],
+    ),
+) -> LoginHistoryPageDTO:
+    """Login history handler.
+
+    Returns login entries of the access token owner, newest first.
+    Pass next_cursor of the response to get the next page.
+
+    Args:
+        credentials (HTTPAuthorizationCredentials): Bearer access token.
+        cursor (str, optional): Cursor of the next page.
+        limit (int): Page size.
+        use_case (LoginHistoryUseCase): Login history use case.
+
+    Raises:
+        TOKEN_NOT_VALID: If access token not valid.
+        CURSOR_NOT_VALID: If cursor not valid.
+
+    Returns:
+        LoginHistoryPageDTO: Page of login entries.
+    """
+    try:
+        res = await use_case.execute(credentials.credentials, limit, cursor)
+    except TokenNotValid:
+        raise TOKEN_NOT_VALID
+    except InvalidCursor:
+        raise CURSOR_NOT_VALID
+    return res
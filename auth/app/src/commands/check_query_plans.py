@@ -0,0 +1,226 @@
+"""Command for checking that repository lookups are served by indexes.
+
+Runs repository lookups against the database, in read-only scope as well,
+so lookups routed to replicas are captured too. Emitted statements are
+EXPLAINed on the primary with sequential scans disabled, so the planner
+picks an index whenever one can be used, whatever the size of the tables.
+Exits with non-zero status if any plan still has a Seq Scan.
+Run it after migrations, for example in CI:
+
+    python -m src.commands.check_query_plans
+"""
+
+import asyncio
+import logging
+import sys
+import uuid
+from contextlib import suppress
+from datetime import UTC, datetime
+from typing import Any, Coroutine, Iterator
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncConnection
+from src.config import PostgreSQLSettings
+from src.domain.login_history.exceptions import LoginEntryNotFound
+from src.domain.login_history.value_objects import LoginHistoryCursor
+from src.domain.repositories.role.exceptions import (
+    BaseRoleNotFoundError,
+    RoleNotFoundError,
+)
+from src.domain.repositories.user.exceptions import UserNotFoundError
+from src.domain.social_network.exceptions import SocialNetworkNotFound
+from src.domain.user_social_account.exceptions import UserSocialAccountNotFound
+from src.infrastructure.databases import PostgreSQL
+from src.infrastructure.interfaces.database.unit_of_work import UnitOfWork
+from src.infrastructure.models import (
+    LoginHistory,
+    User,
+    UserService,
+    UserSocialAccount,
+)
+
+logger = logging.getLogger(__name__)
+
+PROBE_ID = uuid.uuid4()
+PROBE_NAME = 'probe'
+PROBE_EMAIL = 'Probe@Example.com'
+PAGE_SIZE = 21
+NOT_FOUND = (
+    LoginEntryNotFound,
+    BaseRoleNotFoundError,
+    RoleNotFoundError,
+    UserNotFoundError,
+    SocialNetworkNotFound,
+    UserSocialAccountNotFound,
+)
+# Referencing columns, scanned by the database on delete of referenced row.
+FOREIGN_KEYS = (
+    UserService.role_id,
+    User.user_service_id,
+    LoginHistory.user_id,
+    UserSocialAccount.user_id,
+    UserSocialAccount.social_network_id,
+)
+
+
+def lookups(uow: UnitOfWork) -> list[Coroutine[Any, Any, Any]]:
+    """Build repository lookups to check.
+
+    Args:
+        uow (UnitOfWork): Entered Database Unit of Work.
+
+    Returns:
+        list[Coroutine[Any, Any, Any]]: Lookups, awaited one by one.
+    """
+    cursor = LoginHistoryCursor(created_at=datetime.now(UTC), id=PROBE_ID)
+    return [
+        uow.user.retrieve_by_id(PROBE_ID),
+        uow.user.retrieve_by_email(PROBE_EMAIL),
+        uow.user.retrieve_by_login(PROBE_NAME),
+        uow.user.retrieve_by_email_or_login(PROBE_EMAIL, PROBE_NAME),
+        uow.user_service.retrieve_by_id(PROBE_ID),
+        uow.role.retrieve_by_id(PROBE_ID),
+        uow.role.retrieve_by_name(PROBE_NAME),
+        uow.role.retrieve_base_role(),
+        uow.social_network.retrieve_by_id(PROBE_ID),
+        uow.social_network.retrieve_by_name(PROBE_NAME),
+        uow.user_social_account.retrieve_by_id(PROBE_ID),
+        uow.user_social_account.retrieve_by_user_id(PROBE_ID),
+        uow.user_social_account.retrieve_by_social_network_id(PROBE_ID),
+        uow.user_social_account.retrieve_by_social_account(
+            PROBE_ID, PROBE_NAME,
+        ),
+        uow.login_history.retrieve_by_id(PROBE_ID),
+        uow.login_history.retrieve_by_user_id(PROBE_ID),
+        uow.login_history.retrieve_page_by_user_id(PROBE_ID, PAGE_SIZE),
+        uow.login_history.retrieve_page_by_user_id(
+            PROBE_ID, PAGE_SIZE, cursor,
+        ),
+    ]
+
+
+class StatementRecorder:  # noqa: WPS306 (Without Base class.)
+    """Listener of engine which records emitted SELECT statements."""
+
+    def __init__(self) -> None:
+        """Init method."""
+        self.statements: list[tuple[str, Any]] = []
+
+    def __call__(self, **kwargs: Any) -> None:
+        """Record statement, called by engine before cursor execute.
+
+        Args:
+            kwargs: Event arguments, see ConnectionEvents.
+        """
+        statement: str = kwargs['statement']
+        if statement.lstrip().upper().startswith('SELECT'):
+            self.statements.append((statement, kwargs['parameters']))
+
+
+async def capture_statements(
+    postgresql: PostgreSQL,
+) -> list[tuple[str, Any]]:
+    """Run repository lookups and capture emitted statements.
+
+    Args:
+        postgresql (PostgreSQL): Database to run lookups against.
+
+    Returns:
+        list[tuple[str, Any]]: Statements with their parameters.
+    """
+    recorder = StatementRecorder()
+    sync_engines = [engine.sync_engine for engine in postgresql.engines]
+    for listened in sync_engines:
+        sa.event.listen(
+            listened, 'before_cursor_execute', recorder, named=True,
+        )
+    await run_lookups(postgresql)
+    for removed in sync_engines:
+        sa.event.remove(removed, 'before_cursor_execute', recorder)
+    return recorder.statements
+
+
+async def run_lookups(postgresql: PostgreSQL) -> None:
+    """Run repository lookups in both scopes and foreign key probes.
+
+    Args:
+        postgresql (PostgreSQL): Database to run lookups against.
+    """
+    uow = UnitOfWork(postgresql)
+    for read_only in (False, True):
+        async with uow(autocommit=False, read_only=read_only):
+            for lookup in lookups(uow):
+                with suppress(*NOT_FOUND):
+                    await lookup
+    async with postgresql.sessionmaker() as session:
+        for column in FOREIGN_KEYS:
+            await session.execute(
+                sa.Select(sa.literal(1)).where(column == PROBE_ID),
+            )
+
+
+def seq_scans(plan: dict) -> Iterator[str]:
+    """Find relations read by sequential scan.
+
+    Args:
+        plan (dict): Node of JSON plan.
+
+    Yields:
+        Iterator[str]: Names of relations.
+    """
+    if plan['Node Type'] == 'Seq Scan':
+        yield plan['Relation Name']
+    for child in plan.get('Plans', []):
+        yield from seq_scans(child)
+
+
+async def explain(
+    conn: AsyncConnection, statement: str, statement_params: Any,
+) -> dict:
+    """Return plan of statement.
+
+    Args:
+        conn (AsyncConnection): Connection with disabled sequential scans.
+        statement (str): Captured statement.
+        statement_params (Any): Captured statement parameters.
+
+    Returns:
+        dict: Root node of JSON plan.
+    """
+    res = await conn.exec_driver_sql(
+        'EXPLAIN (FORMAT JSON) {0}'.format(statement), statement_params,
+    )
+    return res.scalar()[0]['Plan']
+
+
+async def main() -> int:
+    """Check plans of repository lookups.
+
+    Returns:
+        int: Exit status.
+    """
+    postgresql = PostgreSQL(PostgreSQLSettings())
+    failed = 0
+    statements = await capture_statements(postgresql)
+    async with postgresql.engine.connect() as conn:
+        await conn.exec_driver_sql('SET enable_seqscan = off')
+        for statement, statement_params in statements:
+            relations = sorted(set(seq_scans(
+                await explain(conn, statement, statement_params),
+            )))
+            if relations:
+                failed += 1
+                logger.error(
+                    'Seq Scan on %s: %s', ', '.join(relations), statement,
+                )
+    for engine in postgresql.engines:
+        await engine.dispose()
+    logger.info(
+        'Checked %s statements, %s without index.', len(statements), failed,
+    )
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(asyncio.run(main()))
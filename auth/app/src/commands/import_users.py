@@ -0,0 +1,158 @@
+"""Command for bulk import of users with pre-hashed passwords.
+
+Reads CSV with header or NDJSON (.ndjson, .jsonl) file with fields
+email, login, password (bcrypt hash) and optional full_name, birthday,
+phone_number, bio, role, active, verified and created_at:
+
+    python -m src.commands.import_users users.csv --report conflicts.csv
+
+Records are validated in worker processes and loaded with COPY,
+memory does not depend on file size. Progress is saved with every
+batch, run the same command again to resume after failure.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from src.config import PostgreSQLSettings, UserSettings
+from src.infrastructure.databases import PostgreSQL
+from src.infrastructure.user_import.loader import (
+    ImportReport,
+    ImportStats,
+    UserImporter,
+)
+from src.infrastructure.user_import.source import (
+    ValidatedBatch,
+    batched,
+    read_source,
+    validate_batch,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH = 10000
+BATCHES_PER_WORKER = 2
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('path', type=Path, help='CSV or NDJSON file.')
+    parser.add_argument(
+        '--report',
+        type=Path,
+        help='CSV file for conflicting and rejected records.',
+    )
+    parser.add_argument(
+        '--source',
+        help='Name of the import for checkpoint, file name by default.',
+    )
+    parser.add_argument('--batch', type=int, default=DEFAULT_BATCH)
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Number of validating processes.',
+    )
+    return parser.parse_args()
+
+
+async def run(
+    importer: UserImporter,
+    report: ImportReport,
+    total: ImportStats,
+    args: argparse.Namespace,
+) -> ImportStats:
+    """Validate batches in processes and load them in order.
+
+        At most BATCHES_PER_WORKER batches per worker are in flight,
+        so validation of next batches overlaps with loading.
+
+    Args:
+        importer (UserImporter): Entered importer.
+        report (ImportReport): Report of skipped records.
+        total (ImportStats): Progress saved in the checkpoint.
+        args (argparse.Namespace): Parsed command line arguments.
+
+    Returns:
+        ImportStats: Totals including the previous runs.
+    """
+    logger.info('Resuming after %s records.', total.records)
+    loop = asyncio.get_running_loop()
+    started = time.monotonic()
+    in_flight: deque[asyncio.Future[ValidatedBatch]] = deque()
+    with ProcessPoolExecutor(args.workers) as pool:
+        batches = batched(read_source(args.path, total.records), args.batch)
+        for batch in batches:
+            in_flight.append(loop.run_in_executor(pool, validate_batch, batch))
+            if len(in_flight) >= args.workers * BATCHES_PER_WORKER:
+                total = await load(importer, report, in_flight, total)
+        while in_flight:
+            total = await load(importer, report, in_flight, total)
+    logger.info('Done in %.0f s: %s.', time.monotonic() - started, total)
+    return total
+
+
+async def load(
+    importer: UserImporter,
+    report: ImportReport,
+    in_flight: deque[asyncio.Future[ValidatedBatch]],
+    total: ImportStats,
+) -> ImportStats:
+    """Load the oldest validated batch.
+
+    Args:
+        importer (UserImporter): Entered importer.
+        report (ImportReport): Report of skipped records.
+        in_flight (deque[asyncio.Future[ValidatedBatch]]): Batches in order.
+        total (ImportStats): Totals before the batch.
+
+    Returns:
+        ImportStats: Totals after the batch.
+    """
+    stats = await importer.load(await in_flight.popleft(), report)
+    total = ImportStats(
+        records=stats.records,
+        imported=total.imported + stats.imported,
+        conflicts=total.conflicts + stats.conflicts,
+        rejected=total.rejected + stats.rejected,
+    )
+    logger.info('Processed %s.', total)
+    return total
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run import.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+    """
+    config = PostgreSQLSettings()
+    importer = UserImporter(
+        PostgreSQL(config).engine,
+        config.db_schema,
+        args.source or args.path.name,
+        UserSettings().default_user_role,
+    )
+    report_path = args.report or args.path.with_suffix('.report.csv')
+    with report_path.open('a', newline='', encoding='utf-8') as stream:
+        async with importer as checkpoint:
+            await run(importer, ImportReport(stream), checkpoint, args)
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,70 @@
+"""Command for maintenance of Login History partitions.
+
+Creates partitions for the next months, moving their rows caught by the
+DEFAULT partition, and detaches expired ones. With --drop, expired
+partitions detached by earlier runs are dropped as well.
+Run it periodically, for example daily by cron:
+
+    python -m src.commands.login_history_partitions --drop
+"""
+
+import argparse
+import asyncio
+import logging
+
+from src.config import LoginHistorySettings, PostgreSQLSettings
+from src.infrastructure.databases import PostgreSQL
+from src.infrastructure.partitions import LoginHistoryPartitionManager
+
+logger = logging.getLogger(__name__)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
+    """
+    config = LoginHistorySettings()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--ahead',
+        type=int,
+        default=config.login_history_premake_months,
+        help='Number of months to create partitions in advance.',
+    )
+    parser.add_argument(
+        '--retention',
+        type=int,
+        default=config.login_history_retention_months,
+        help='Number of months to keep attached.',
+    )
+    parser.add_argument(
+        '--drop',
+        action='store_true',
+        help='Drop expired partitions instead of only detaching them.',
+    )
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run partitions maintenance.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+    """
+    config = PostgreSQLSettings()
+    manager = LoginHistoryPartitionManager(
+        PostgreSQL(config).sessionmaker, config.db_schema,
+    )
+    created = await manager.create_partitions(args.ahead)
+    logger.info('Created partitions: %s', created)
+    expired = await manager.expire_partitions(args.retention, args.drop)
+    logger.info(
+        '%s partitions: %s', 'Dropped' if args.drop else 'Detached', expired,
+    )
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,74 @@
+"""Command for bulk reassignment of users role.
+
+Reads user IDs, one per line, from the file or standard input:
+
+    python -m src.commands.reassign_role subscriber --ids users.txt
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import uuid
+from typing import Iterator, TextIO
+
+from src.containers import Container
+from src.use_cases.user.reassign_role import DEFAULT_CHUNK_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('role', help='Name of the new role.')
+    parser.add_argument(
+        '--ids',
+        type=argparse.FileType('r'),
+        default=sys.stdin,
+        help='File with user IDs, standard input by default.',
+    )
+    parser.add_argument(
+        '--chunk',
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help='Number of users per transaction.',
+    )
+    return parser.parse_args()
+
+
+def read_ids(stream: TextIO) -> Iterator[uuid.UUID]:
+    """Read user IDs, skipping blank lines.
+
+    Args:
+        stream (TextIO): Stream with one ID per line.
+
+    Yields:
+        Iterator[uuid.UUID]: User UUID IDs.
+    """
+    for line in stream:
+        if line.strip():
+            yield uuid.UUID(line.strip())
+
+
+async def main(args: argparse.Namespace) -> None:
+    """Run reassignment.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+    """
+    use_case = Container().reassign_role_use_case()
+    changed = await use_case.execute(read_ids(args.ids), args.role, args.chunk)
+    logger.info('Role %s set for %s users.', args.role, changed)
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,125 @@
+"""Command for summary of spans written by the file exporter.
+
+Prints spans grouped by name, ordered by total self time, which is
+the time of the span without its children. Every worker writes its own
+file, files of all workers are read together:
+
+    python -m src.commands.span_report logs/spans.*.jsonl
+"""
+
+import argparse
+import statistics
+from collections import defaultdict
+from typing import Iterable, TextIO
+
+import orjson
+from src.tracing import Span
+
+MILLISECONDS_IN_SECOND = 1000
+PERCENTILES = 100
+TAIL_PERCENTILE = 95
+REPORT_ROW = '{0:>8} {1:>6} {2:>10} {3:>10} {4:>10} {5:>12}  {6}'
+REPORT_HEADER = (
+    'count', 'errors', 'p50 ms', 'p95 ms', 'max ms', 'self ms', 'span',
+)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Returns:
+        argparse.Namespace: Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        'spans',
+        type=argparse.FileType('r'),
+        nargs='+',
+        help='Files with spans as JSON lines.',
+    )
+    return parser.parse_args()
+
+
+def read_spans(streams: Iterable[TextIO]) -> list[Span]:
+    """Read spans, skipping blank lines.
+
+    Args:
+        streams (Iterable[TextIO]): Streams with one span per line.
+
+    Returns:
+        list[Span]: Spans of all streams.
+    """
+    return [
+        Span(**orjson.loads(line))
+        for stream in streams
+        for line in stream
+        if line.strip()
+    ]
+
+
+def summarize(spans: Iterable[Span]) -> list[tuple[str, ...]]:
+    """Build report rows of spans grouped by name.
+
+    Args:
+        spans (Iterable[Span]): Finished spans.
+
+    Returns:
+        list[tuple[str, ...]]: Rows ordered by total self time.
+    """
+    children: dict[str, float] = defaultdict(float)
+    groups: dict[str, list[Span]] = defaultdict(list)
+    for span in spans:
+        if span.parent_id:
+            children[span.parent_id] += span.duration
+        groups['{0}:{1}'.format(span.component, span.name)].append(span)
+    rows = [
+        _row(name, group, children) for name, group in groups.items()
+    ]
+    rows.sort(key=lambda row: row[0], reverse=True)
+    return [row for _, row in rows]
+
+
+def _row(
+    name: str, group: list[Span], children: dict[str, float],
+) -> tuple[float, tuple[str, ...]]:
+    durations = [member.duration for member in group]
+    self_time = sum(
+        member.duration - children[member.span_id] for member in group
+    )
+    return self_time, (
+        str(len(group)),
+        str(sum(1 for member in group if member.error)),
+        _milliseconds(statistics.median(durations)),
+        _milliseconds(_percentile(durations, TAIL_PERCENTILE)),
+        _milliseconds(max(durations)),
+        _milliseconds(self_time),
+        name,
+    )
+
+
+def _percentile(durations: list[float], percentile: int) -> float:
+    if len(durations) == 1:
+        return durations[0]
+    return statistics.quantiles(durations, n=PERCENTILES)[percentile - 1]
+
+
+def _milliseconds(seconds: float) -> str:
+    return '{0:.2f}'.format(seconds * MILLISECONDS_IN_SECOND)
+
+
+def main(args: argparse.Namespace) -> None:
+    """Print report.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+    """
+    print(REPORT_ROW.format(*REPORT_HEADER))  # noqa: WPS421 (Report output.)
+    for row in summarize(read_spans(args.spans)):
+        print(REPORT_ROW.format(*row))  # noqa: WPS421 (Report output.)
+
+
+if __name__ == '__main__':
+    main(parse_args())
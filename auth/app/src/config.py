@@ -1,6 +1,8 @@
 """Module with project configuration."""
 
 import logging
+from pathlib import Path
+from typing import Literal
 
 import pydantic as pd
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -26,6 +28,12 @@ class LoggingSettings(BaseServiceSettings):
     use_sentry: bool
     sentry_dsn: str
     logging_level: int
+    logging_file: Path = Path('logs/application.log')
+    # worker: every process rotates its own file suffixed with its pid,
+    # external: file is reopened after it is moved, e.g. by logrotate.
+    logging_rotation: Literal['worker', 'external'] = 'worker'
+    # Records over the size are dropped and counted, not waited for.
+    logging_queue_size: int = 10000
 
     @pd.field_validator('logging_level', mode='before')
     @classmethod
@@ -62,6 +70,8 @@ class APISettings(BaseServiceSettings):
     production: bool
     api_title: str
     api_version: str
+    request_timeout: float = 10.0
+    route_timeouts: dict[str, float] = {}
 
 
 class UserSettings(BaseServiceSettings):
@@ -80,6 +90,13 @@ class PostgreSQLSettings(BaseServiceSettings):
     db_password: str
     db_name: str
     db_schema: str
+    db_replica_dsns: list[pd.PostgresDsn] = []
+    db_read_your_writes_window: float = 5.0
+    db_replica_retry_interval: float = 10.0
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_statement_timeout: float = 5.0
+    db_echo: bool = False
 
 
 class RedisSettings(BaseServiceSettings):
@@ -90,6 +107,26 @@ class RedisSettings(BaseServiceSettings):
     redis_user: str
     redis_password: str
     max_connections: int
+    redis_mode: Literal['standalone', 'sentinel', 'cluster'] = 'standalone'
+    redis_nodes: list[str] = []
+    redis_sentinel_service: str = 'mymaster'
+    redis_socket_timeout: float = 5.0
+    redis_socket_connect_timeout: float = 1.0
+
+    @property
+    def redis_addresses(self) -> list[tuple[str, int]]:
+        """Get addresses of cluster startup nodes or sentinels.
+
+        Returns:
+            list[tuple[str, int]]: Hosts and ports, redis_host by default.
+        """
+        if not self.redis_nodes:
+            return [(self.redis_host, self.redis_port)]
+        addresses = []
+        for node in self.redis_nodes:
+            host, port = node.rsplit(':', 1)
+            addresses.append((host, int(port)))
+        return addresses
 
 
 class TokensSettings(BaseServiceSettings):
@@ -101,6 +138,97 @@ class TokensSettings(BaseServiceSettings):
     refresh_token_expiration: int
 
 
+class LoginHistorySettings(BaseServiceSettings):
+    """Login History Configuration."""
+
+    login_history_enabled: bool = True
+    login_history_queue_size: int = 10000
+    login_history_batch_size: int = 500
+    login_history_flush_interval: float = 1.0
+    login_history_flush_attempts: int = 3
+    login_history_shutdown_timeout: float = 10.0
+    login_history_premake_months: int = 3
+    login_history_retention_months: int = 12
+
+
+class SocialAccountSettings(BaseServiceSettings):
+    """Social Accounts Configuration."""
+
+    social_account_cache_ttl: int = 86400
+
+
+class SocialNetworkSettings(BaseServiceSettings):
+    """Social Networks Configuration."""
+
+    social_network_poll_interval: float = 30.0
+
+
+class ResilienceSettings(BaseServiceSettings):
+    """Circuit breakers and retries of Database and Cache calls."""
+
+    breaker_failure_threshold: int = 5
+    breaker_reset_timeout: float = 5.0
+    retry_attempts: int = 2
+    retry_base_delay: float = 0.05
+    retry_max_delay: float = 0.5
+    retry_budget_ratio: float = 0.1
+    retry_budget_per_second: float = 1.0
+
+
+class ConcurrencySettings(BaseServiceSettings):
+    """Adaptive concurrency limits of Database, Cache and hashing."""
+
+    concurrency_initial_limit: int = 20
+    concurrency_min_limit: int = 2
+    concurrency_max_limit: int = 200
+    concurrency_backoff_ratio: float = 0.9
+    concurrency_latency_tolerance: float = 2.0
+    concurrency_retry_after: float = 1.0
+    password_hashing_threads: int = 4
+
+
+class SamplingSettings(BaseServiceSettings):
+    """Sentry traces sampling configuration, defaults until changed."""
+
+    sentry_traces_rate: float = 0.01
+    sentry_route_traces_rates: dict[str, float] = {}
+    sentry_slow_request_threshold: float = 1.0
+    sentry_max_traces_per_second: float = 5.0
+    sentry_profiles_rate: float = 0.01
+
+
+class TracingSettings(BaseServiceSettings):
+    """Span instrumentation configuration."""
+
+    tracing_exporter: Literal['none', 'memory', 'file'] = 'none'
+    tracing_memory_size: int = 10000
+    tracing_file: Path = Path('logs/spans.jsonl')
+
+
+class StorageSettings(BaseServiceSettings):
+    """Storage behind Units of Work."""
+
+    # external: PostgreSQL and Redis, memory: tables and cache of
+    # the process, lost on exit, for benchmarks and stress tests.
+    storage_backend: Literal['external', 'memory'] = 'external'
+
+
+class WarmUpSettings(BaseServiceSettings):
+    """Warm-up of a worker before it takes traffic."""
+
+    # Concurrent scopes per storage, every one opens a pooled connection.
+    warmup_connections: int = 4
+    warmup_timeout: float = 10.0
+
+
+class HealthSettings(BaseServiceSettings):
+    """Health checks of the worker and its dependencies."""
+
+    health_probe_interval: float = 5.0
+    # Dependency silent for longer makes the worker not ready.
+    health_stale_after: float = 15.0
+
+
 class ProjectSettings(pd.BaseModel):
     """Project configuration."""
 
@@ -108,3 +236,13 @@ class ProjectSettings(pd.BaseModel):
     postgresql_settings: PostgreSQLSettings = PostgreSQLSettings()
     redis_settings: RedisSettings = RedisSettings()
     tokens_settings: TokensSettings = TokensSettings()
+    login_history_settings: LoginHistorySettings = LoginHistorySettings()
+    social_account_settings: SocialAccountSettings = SocialAccountSettings()
+    social_network_settings: SocialNetworkSettings = SocialNetworkSettings()
+    resilience_settings: ResilienceSettings = ResilienceSettings()
+    concurrency_settings: ConcurrencySettings = ConcurrencySettings()
+    sampling_settings: SamplingSettings = SamplingSettings()
+    tracing_settings: TracingSettings = TracingSettings()
+    storage_settings: StorageSettings = StorageSettings()
+    warmup_settings: WarmUpSettings = WarmUpSettings()
+    health_settings: HealthSettings = HealthSettings()
@@ -7,15 +7,56 @@ from typing import Any, AsyncGenerator
 
 from dependency_injector import containers, providers
 from src.config import ProjectSettings
-from src.infrastructure.databases import PostgreSQL, Redis, init_redis
+from src.infrastructure.concurrency import (
+    CACHE_STAGE,
+    DATABASE_STAGE,
+    HASHING_STAGE,
+    ConcurrencyLimiter,
+)
+from src.infrastructure.databases import (
+    PostgreSQL,
+    Redis,
+    init_redis,
+    init_redis_pubsub,
+)
+from src.infrastructure.health import init_health_monitor
 from src.infrastructure.interfaces.cache.unit_of_work import (
     UnitOfWork as RedisUnifOfWork,
 )
 from src.infrastructure.interfaces.database.unit_of_work import (
     UnitOfWork as PostgreSQLUnitOfWork,
 )
+from src.infrastructure.interfaces.hashing.hasher import (
+    PasswordHasher,
+    init_hashing_executor,
+)
+from src.infrastructure.interfaces.login_history.writer import (
+    init_login_history_writer,
+)
+from src.infrastructure.interfaces.sampling.rates import init_sampling_rates
+from src.infrastructure.interfaces.social_networks.catalog import (
+    init_social_network_catalog,
+)
+from src.infrastructure.interfaces.social_networks.changes import (
+    SocialNetworkChanges,
+)
 from src.infrastructure.interfaces.tokens.entities import TokenCreator
 from src.infrastructure.interfaces.tokens.key_schema import KeySchema
+from src.infrastructure.interfaces.tracing.exporters import init_tracing
+from src.infrastructure.memory.cache import MemoryCache
+from src.infrastructure.memory.storage import MemoryDatabase
+from src.infrastructure.memory.unit_of_work import (
+    CacheUnitOfWork as MemoryCacheUnitOfWork,
+)
+from src.infrastructure.memory.unit_of_work import (
+    DatabaseUnitOfWork as MemoryDatabaseUnitOfWork,
+)
+from src.infrastructure.sampling import TraceSampler
+from src.infrastructure.warmup import Readiness, WarmUp
+from src.use_cases.sampling.rates import SamplingRatesUseCase
+from src.use_cases.social_network.catalog import ListSocialNetworksUseCase
+from src.use_cases.user.login_history import LoginHistoryUseCase
+from src.use_cases.user.reassign_role import ReassignRoleUseCase
 from src.use_cases.user.signin import SignInUseCase
 from src.use_cases.user.signup import SignUpUseCase
 
@@ -24,13 +65,23 @@ class PostgreSQLContainer(containers.DeclarativeContainer):
     """Container with PostgreSQL resources and classes."""
 
     config = providers.Dependency(instance_of=ProjectSettings)
+    social_network_changes = providers.Dependency(
+        instance_of=SocialNetworkChanges,
+    )
     postgresql = providers.Singleton(
         PostgreSQL,
         config=config.provided.postgresql_settings,
-        )
+    )
+    limiter = providers.Singleton(
+        ConcurrencyLimiter,
+        stage=DATABASE_STAGE,
+        config=config.provided.concurrency_settings,
+    )
     uow = providers.Factory(
         PostgreSQLUnitOfWork,
-        session_factory=postgresql.provided.sessionmaker,
+        database=postgresql,
+        limiter=limiter,
+        social_network_changes=social_network_changes,
     )
 
 
@@ -47,10 +98,48 @@ class RedisContainer(containers.DeclarativeContainer):
         Redis,
         redis=redis_client,
     )
+    pubsub_client = providers.Resource(
+        init_redis_pubsub,
+        config=config.provided.redis_settings,
+    )
+    limiter = providers.Singleton(
+        ConcurrencyLimiter,
+        stage=CACHE_STAGE,
+        config=config.provided.concurrency_settings,
+    )
     uow = providers.Factory(
         RedisUnifOfWork,
         redis=redis.provided.client,
         key_schema=key_schema.provided,
+        social_account_config=config.provided.social_account_settings,
+        limiter=limiter,
+        redis_mode=config.provided.redis_settings.redis_mode,
+    )
+
+
+class MemoryContainer(containers.DeclarativeContainer):
+    """Container with in-memory tables, cache and their classes."""
+
+    config = providers.Dependency(instance_of=ProjectSettings)
+    social_network_changes = providers.Dependency(
+        instance_of=SocialNetworkChanges,
+    )
+    key_schema = providers.Singleton(KeySchema)
+    database = providers.Singleton(
+        MemoryDatabase,
+        config=config.provided.user_settings,
+    )
+    cache = providers.Singleton(MemoryCache)
+    database_uow = providers.Factory(
+        MemoryDatabaseUnitOfWork,
+        database=database,
+        social_network_changes=social_network_changes,
+    )
+    cache_uow = providers.Factory(
+        MemoryCacheUnitOfWork,
+        cache=cache,
+        key_schema=key_schema,
+        social_account_config=config.provided.social_account_settings,
     )
 
 
@@ -59,44 +148,188 @@ class Container(containers.DeclarativeContainer):
 
     config = ProjectSettings()
 
-    postgresql = providers.Container(PostgreSQLContainer, config=config)
+    span_exporter = providers.Resource(
+        init_tracing,
+        config=config.tracing_settings,
+    )
+    social_network_changes = providers.Singleton(SocialNetworkChanges)
+    postgresql = providers.Container(
+        PostgreSQLContainer,
+        config=config,
+        social_network_changes=social_network_changes,
+    )
     redis = providers.Container(RedisContainer, config=config)
+    memory = providers.Container(
+        MemoryContainer,
+        config=config,
+        social_network_changes=social_network_changes,
+    )
+    # Pub/Sub of the catalog and sampling rates stays on Redis.
+    storage_backend = providers.Object(
+        config.storage_settings.storage_backend,
+    )
+    database_uow = providers.Selector(
+        storage_backend,
+        external=postgresql.container.uow,
+        memory=memory.container.database_uow,
+    )
+    cache_uow = providers.Selector(
+        storage_backend,
+        external=redis.container.uow,
+        memory=memory.container.cache_uow,
+    )
+    login_history_writer = providers.Resource(
+        init_login_history_writer,
+        uow_factory=database_uow.provider,
+        config=config.login_history_settings,
+    )
     token_creator = providers.Singleton(
         TokenCreator,
         config=config.tokens_settings,
     )
+    hashing_executor = providers.Resource(
+        init_hashing_executor,
+        config=config.concurrency_settings,
+    )
+    password_hasher = providers.Singleton(
+        PasswordHasher,
+        executor=hashing_executor,
+        limiter=providers.Singleton(
+            ConcurrencyLimiter,
+            stage=HASHING_STAGE,
+            config=config.concurrency_settings,
+        ),
+    )
 
     signup_use_case = providers.Factory(
         SignUpUseCase,
-        cache_uow=redis.container.uow,
-        database_uow=postgresql.container.uow,
+        cache_uow=cache_uow,
+        database_uow=database_uow,
         tokens=token_creator.provided,
+        hasher=password_hasher,
     )
 
     signin_use_case = providers.Factory(
         SignInUseCase,
-        cache_uow=redis.container.uow,
-        database_uow=postgresql.container.uow,
+        cache_uow=cache_uow,
+        database_uow=database_uow,
+        tokens=token_creator.provided,
+        login_history=login_history_writer,
+        hasher=password_hasher,
+    )
+
+    social_network_catalog = providers.Resource(
+        init_social_network_catalog,
+        uow_factory=database_uow.provider,
+        redis=redis.container.pubsub_client,
+        key_schema=redis.container.key_schema,
+        changes=social_network_changes,
+        config=config.social_network_settings,
+    )
+
+    list_social_networks_use_case = providers.Factory(
+        ListSocialNetworksUseCase,
+        catalog=social_network_catalog,
+    )
+
+    login_history_use_case = providers.Factory(
+        LoginHistoryUseCase,
+        database_uow=database_uow,
+        tokens=token_creator.provided,
+    )
+
+    reassign_role_use_case = providers.Factory(
+        ReassignRoleUseCase,
+        database_uow_factory=database_uow.provider,
+    )
+
+    trace_sampler = providers.Singleton(
+        TraceSampler,
+        config=config.sampling_settings,
+    )
+
+    sampling_rates = providers.Resource(
+        init_sampling_rates,
+        sampler=trace_sampler,
+        redis=redis.container.pubsub_client,
+        key_schema=redis.container.key_schema,
+    )
+
+    sampling_rates_use_case = providers.Factory(
+        SamplingRatesUseCase,
+        database_uow=database_uow,
         tokens=token_creator.provided,
+        rates=sampling_rates,
+    )
+
+    readiness = providers.Singleton(Readiness)
+
+    warm_up = providers.Factory(
+        WarmUp,
+        database_uow_factory=database_uow.provider,
+        cache_uow_factory=cache_uow.provider,
+        catalog=social_network_catalog,
+        hasher=password_hasher,
+        tokens=token_creator.provided,
+        readiness=readiness,
+        config=config.warmup_settings,
+    )
+
+    health_monitor = providers.Resource(
+        init_health_monitor,
+        readiness=readiness,
+        postgresql=providers.Selector(
+            storage_backend,
+            external=postgresql.container.postgresql,
+            memory=providers.Object(None),
+        ),
+        redis=providers.Selector(
+            storage_backend,
+            external=redis.container.redis,
+            memory=providers.Object(None),
+        ),
+        config=config.health_settings,
     )
 
+    @classmethod
+    def build(cls, wireable_packages: list) -> Container:
+        """Create container and wire it, with no resource initialized.
+
+            Nothing is connected or started here, so with preload of
+            Gunicorn the container is built once in the master and
+            every worker starts its own engines and pools after fork.
+
+        Args:
+            wireable_packages (list): Names of packages for wire.
+
+        Returns:
+            Container: Wired container.
+        """
+        container = cls()
+        # Redis Unit of Work depends on the async client resource, so
+        # the memory one is made awaitable too, callers await both.
+        container.cache_uow.enable_async_mode()
+        container.wire(packages=wireable_packages)
+        return container
+
     @classmethod
     @asynccontextmanager
     async def lifespan(
-        cls, wireable_packages: list,
+        cls, container: Container,
     ) -> AsyncGenerator[Container, Any]:
         """Container lifespan.
 
-        Args:
-            wireable_packages (list): Names of packages for wire.
+            Resources are started and the worker is warmed up
+            before the container is yielded to take traffic.
 
+        Args:
+            container (Container): Container made by build.
 
         Yields:
             class: Yield themself.
         """
-        container = cls()
-        container.wire(packages=wireable_packages)
-
         await container.init_resources()
+        warm_up = await container.warm_up()
+        await warm_up.run()
         yield container
         await container.shutdown_resources()
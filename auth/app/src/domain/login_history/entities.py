@@ -6,7 +6,7 @@ import uuid
 from datetime import UTC, datetime
 from typing import Optional
 
-from src.domain.base import Base
+from src.domain.base import Base, uuid7
 from src.domain.login_history.dto import LoginHistoryDTO
 from src.domain.social_network.entities import SocialNetwork
 
@@ -58,7 +58,7 @@ class LoginHistory(Base):
         """
         return cls(
             entity=LoginHistoryDTO(
-                id=uuid.uuid4(),
+                id=uuid7(),
                 user_id=uid,
                 user_agent=user_agent,
                 social_network_id=(
@@ -69,3 +69,18 @@ class LoginHistory(Base):
             ),
             social_network=social_network,
         )
+
+    def as_dto(self) -> LoginHistoryDTO:
+        """Get login entry info as DTO.
+
+        Returns:
+            LoginHistoryDTO: Instance of Login History data transfer object.
+        """
+        return LoginHistoryDTO(
+            id=self.id,
+            user_id=self._user_id,
+            user_agent=self._user_agent,
+            social_network_id=self._social_network_id,
+            created_at=self._created_at,
+            updated_at=self._updated_at,
+        )
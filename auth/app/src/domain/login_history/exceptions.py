@@ -3,3 +3,7 @@
 
 class LoginEntryNotFound(Exception):
     """Login entry with that fields not found."""
+
+
+class InvalidCursor(Exception):
+    """Pagination cursor is malformed or was tampered with."""
@@ -0,0 +1,55 @@
+"""Module with Login History value objects."""
+
+from __future__ import annotations
+
+import base64
+import uuid
+from datetime import datetime
+
+import pydantic as pd
+from src.domain.login_history.exceptions import InvalidCursor
+
+
+class LoginHistoryCursor(pd.BaseModel, frozen=True):
+    """Position of the last returned entry in keyset pagination.
+
+        Entries are ordered by (created_at, id) descending,
+        the next page starts strictly after that position.
+
+    Args:
+        pd.BaseModel (class): Base class for pydantic validations models.
+    """
+
+    created_at: datetime
+    id: uuid.UUID
+
+    def encode(self) -> str:
+        """Encode cursor to opaque URL safe string.
+
+        Returns:
+            str: Encoded cursor.
+        """
+        return base64.urlsafe_b64encode(
+            self.model_dump_json().encode(),
+        ).decode().rstrip('=')
+
+    @classmethod
+    def decode(cls, cursor: str) -> LoginHistoryCursor:
+        """Decode cursor from opaque string.
+
+        Args:
+            cursor (str): Encoded cursor.
+
+        Raises:
+            InvalidCursor: If cursor can not be decoded.
+
+        Returns:
+            LoginHistoryCursor: Decoded cursor.
+        """
+        padding = '=' * (-len(cursor) % 4)
+        try:
+            return cls.model_validate_json(
+                base64.urlsafe_b64decode(cursor + padding),
+            )
+        except ValueError as exc:
+            raise InvalidCursor(str(exc))
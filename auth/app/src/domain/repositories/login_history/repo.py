@@ -2,8 +2,11 @@
 
 import uuid
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
 
 from src.domain.login_history.entities import LoginHistory
+from src.domain.login_history.value_objects import LoginHistoryCursor
 
 
 class ILoginHistoryRepository(ABC):
@@ -25,28 +28,62 @@ class ILoginHistoryRepository(ABC):
             LoginHistory class which represent login entry.
         """
 
+    @abstractmethod
+    async def insert_many(self, entities: list[LoginHistory]) -> None:
+        """Add a batch of login entries in one statement.
+
+        Args:
+            entities (list[LoginHistory]): entities of LoginHistory.
+        """
+
     @abstractmethod
     async def retrieve_by_id(
         self,
         login_entry_id: uuid.UUID,
+        created_at: Optional[datetime] = None,
     ) -> LoginHistory:
         """Retrieve login entry by id.
 
         Args:
             login_entry_id (uuid.UUID): Login Entry UUID ID.
+            created_at (datetime, optional):
+            Login time, if known, limits lookup to one partition.
 
         Returns:
             LoginHistory | None: Return Login Entry if exists.
         """
 
     @abstractmethod
-    async def retrieve_by_user_id(self, uid: uuid.UUID) -> list[LoginHistory]:
+    async def retrieve_by_user_id(
+        self, uid: uuid.UUID, since: Optional[datetime] = None,
+    ) -> list[LoginHistory]:
         """Retrieve login entry by user id.
 
         Args:
             uid (uuid.UUID): User UUID ID.
+            since (datetime, optional):
+            Skip entries created before, older partitions are not scanned.
 
         Returns:
             LoginHistory (class):
             LoginHistory classs which represent login entry.
         """
+
+    @abstractmethod
+    async def retrieve_page_by_user_id(
+        self,
+        uid: uuid.UUID,
+        limit: int,
+        cursor: Optional[LoginHistoryCursor] = None,
+    ) -> list[LoginHistory]:
+        """Retrieve page of user login entries, newest first.
+
+        Args:
+            uid (uuid.UUID): User UUID ID.
+            limit (int): Maximum number of entries.
+            cursor (LoginHistoryCursor, optional):
+            Position of the last entry of the previous page.
+
+        Returns:
+            list[LoginHistory]: Login entries, may be empty.
+        """
@@ -65,3 +65,22 @@ class ISocialNetworkRepository(ABC):
             SocialNetwork (class): Social Network class
             which represent Social Network.
         """
+
+    @abstractmethod
+    async def retrieve_all(self) -> list[SocialNetwork]:
+        """Retrieve all social networks.
+
+        Returns:
+            list[SocialNetwork]: Social Networks ordered by name.
+        """
+
+    @abstractmethod
+    async def retrieve_version(self) -> tuple[int, int]:
+        """Retrieve version of social networks.
+
+            Pair changes whenever any social network is added,
+            changed or deleted.
+
+        Returns:
+            tuple[int, int]: Greatest row version and number of rows.
+        """
@@ -79,3 +79,17 @@ class IUserServiceRepository(ABC):
             UserService (class):
             User Service which represent user service.
         """
+
+    @abstractmethod
+    async def update_role_by_user_ids(
+        self, user_ids: list[uuid.UUID], role: Role,
+    ) -> list[uuid.UUID]:
+        """Update role of many users in one statement.
+
+        Args:
+            user_ids (list[uuid.UUID]): Users UUID IDs.
+            role (Role): Entity of class Role which represent Role.
+
+        Returns:
+            list[uuid.UUID]: IDs of users whose role was changed.
+        """
@@ -89,3 +89,18 @@ class IUserSocialAccountRepository(ABC):
         Returns:
             UserSocialAccount (class): list of Users Social Accounts.
         """
+
+    @abstractmethod
+    async def retrieve_by_social_account(
+        self, social_network_id: uuid.UUID, social_account_id: str,
+    ) -> UserSocialAccount:
+        """Retrieve User Social Account by identifier in Social Network.
+
+        Args:
+            social_network_id (uuid.UUID): Social Network UUID ID.
+            social_account_id (str): Account identifier in Social Network.
+
+        Returns:
+            UserSocialAccount (class):
+            UserSocialAccount class which represent User Social Account.
+        """
@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
-import uuid
 from datetime import UTC, datetime
 from typing import Optional
 
-from src.domain.base import Base
+from src.domain.base import Base, uuid7
 from src.domain.role.dto import RoleDTO
 from src.domain.role.value_objects import AccessLevel
 
@@ -51,7 +50,7 @@ class Role(Base):
         """
         return cls(
             entity=RoleDTO(
-                id=uuid.uuid4(),
+                id=uuid7(),
                 name=name,
                 description=description,
                 access_level=access_level,
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-import uuid
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Optional
 
-from src.domain.base import Base
+from src.domain.base import Base, uuid7
 from src.domain.social_network.dto import SocialNetworkDTO
 
 
@@ -46,7 +45,7 @@ class SocialNetwork(Base):
         """
         return cls(
             entity=SocialNetworkDTO(
-                id=uuid.uuid4(),
+                id=uuid7(),
                 picture=picture_file_path,
                 name=name,
                 created_at=datetime.now(UTC),
@@ -61,3 +60,17 @@ class SocialNetwork(Base):
             picture_file_path (Path): File path to new social network icon.
         """
         self._picture = picture_file_path
+
+    def as_dto(self) -> SocialNetworkDTO:
+        """Get social network info as DTO.
+
+        Returns:
+            SocialNetworkDTO: Instance of Social Network data transfer object.
+        """
+        return SocialNetworkDTO(
+            id=self.id,
+            picture=self._picture,
+            name=self._name,
+            created_at=self._created_at,
+            updated_at=self._updated_at,
+        )
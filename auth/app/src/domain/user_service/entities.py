@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-import uuid
 from datetime import UTC, datetime
 
-from src.domain.base import Base
+from src.domain.base import Base, uuid7
 from src.domain.role.entities import Role
 from src.domain.user_service.dto import UserServiceDTO
 
@@ -53,7 +52,7 @@ class UserService(Base):
         """
         return cls(
             entity=UserServiceDTO(
-                id=uuid.uuid4(),
+                id=uuid7(),
                 role_id=role.id,
                 active=is_active,
                 verified=verified,
@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
-import uuid
 from datetime import UTC, datetime
 from typing import Optional
 
-from src.domain.base import Base
+from src.domain.base import Base, uuid7
 from src.domain.social_network.entities import SocialNetwork
 from src.domain.user.entities import User
 from src.domain.user_social_account.dto import UserSocialAccountDTO
@@ -33,7 +32,7 @@ class UserSocialAccount(Base):
             user (User): Entity of User.
             social_network (SocialNetwork): Entity of Social Network.
         """
-        self.id = entity
+        self.id = entity.id
 
         self._social_network_id = entity.social_network_id
         self._user_id = entity.user_id
@@ -63,7 +62,7 @@ class UserSocialAccount(Base):
         """
         return cls(
             entity=UserSocialAccountDTO(
-                id=uuid.uuid4(),
+                id=uuid7(),
                 social_network_id=social_network.id,
                 user_id=user.id,
                 social_account_id=social_account_id,
@@ -73,3 +72,18 @@ class UserSocialAccount(Base):
             user=user,
             social_network=social_network,
         )
+
+    def as_dto(self) -> UserSocialAccountDTO:
+        """Get user social account info as DTO.
+
+        Returns:
+            UserSocialAccountDTO: Instance of data transfer object.
+        """
+        return UserSocialAccountDTO(
+            id=self.id,
+            social_network_id=self._social_network_id,
+            user_id=self._user_id,
+            social_account_id=self._social_account_id,
+            created_at=self._created_at,
+            updated_at=self._updated_at,
+        )
@@ -0,0 +1,156 @@
+"""Module with adaptive concurrency limits of service stages."""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from typing import AsyncIterator, Optional
+
+from src.config import ConcurrencySettings
+from src.infrastructure.metrics import (
+    CONCURRENCY_IN_FLIGHT,
+    CONCURRENCY_LIMIT,
+    CONCURRENCY_REJECTED,
+)
+from src.infrastructure.resilience import POSTGRESQL, REDIS
+from src.use_cases.exceptions import DependencyUnavailable
+
+DATABASE_STAGE = 'database'
+CACHE_STAGE = 'cache'
+HASHING_STAGE = 'hashing'
+# Weight of a sample in the long-term latency, small to follow only
+# lasting changes.
+LATENCY_SMOOTHING = 0.01
+# Cancelled by deadline calls mean the stage is overloaded.
+OVERLOAD_ERRORS = (TimeoutError, asyncio.CancelledError)
+# Unavailable dependencies which mean the stage is overloaded, others,
+# like hashing rejected within a Database scope, say nothing of it.
+STAGE_DEPENDENCIES = MappingProxyType({
+    DATABASE_STAGE: frozenset((DATABASE_STAGE, POSTGRESQL)),
+    CACHE_STAGE: frozenset((CACHE_STAGE, REDIS)),
+    HASHING_STAGE: frozenset((HASHING_STAGE,)),
+})
+
+
+class ConcurrencyLimiter:  # noqa: WPS306 (Without Base class.)
+    """AIMD concurrency limit learned from latency of the stage.
+
+    Calls over the limit are rejected at once instead of queueing for
+    a slow dependency. The limit grows by one per limit of fast calls
+    while it is used at least by half, and is cut by backoff ratio,
+    at most once per latency, when a call fails or is slower than
+    tolerance times the long-term latency. Every call not failed by
+    overload moves the long-term latency, so a lasting change of it
+    becomes the new norm instead of keeping the limit at its minimum.
+    """
+
+    def __init__(self, stage: str, config: ConcurrencySettings) -> None:
+        """Init method.
+
+        Args:
+            stage (str): Name of the stage.
+            config (ConcurrencySettings): Settings for concurrency limits.
+        """
+        self.stage = stage
+        self._config = config
+        self._dependencies = STAGE_DEPENDENCIES.get(stage, frozenset((stage,)))
+        self._limit = float(config.concurrency_initial_limit)
+        self._in_flight = 0
+        self._latency: Optional[float] = None
+        self._decreased_at: float = 0
+        self._limit_gauge = CONCURRENCY_LIMIT.labels(stage)
+        self._in_flight_gauge = CONCURRENCY_IN_FLIGHT.labels(stage)
+        self._rejected = CONCURRENCY_REJECTED.labels(stage)
+        self._limit_gauge.set(self.limit)
+
+    @property
+    def limit(self) -> int:
+        """Get current limit.
+
+        Returns:
+            int: Maximum number of calls in progress.
+        """
+        return int(self._limit)
+
+    def enter(self) -> float:
+        """Take a slot of the stage.
+
+        Raises:
+            DependencyUnavailable: If the stage is at its limit.
+
+        Returns:
+            float: Start time of the call, to pass to exit.
+        """
+        if self._in_flight >= self.limit:
+            self._rejected.inc()
+            raise DependencyUnavailable(
+                self.stage, self._config.concurrency_retry_after,
+            )
+        self._in_flight += 1
+        self._in_flight_gauge.inc()
+        return time.monotonic()
+
+    def exit(self, started: float, exc: Optional[BaseException]) -> None:
+        """Release the slot and adjust the limit.
+
+        Args:
+            started (float): Start time returned by enter.
+            exc (BaseException, optional): Exception raised by the call.
+        """
+        latency = time.monotonic() - started
+        self._in_flight -= 1
+        self._in_flight_gauge.dec()
+        if self._latency is None:
+            self._latency = latency
+        tolerated = self._latency * self._config.concurrency_latency_tolerance
+        overloaded = self._overloaded(exc)
+        if not overloaded:
+            self._latency += (latency - self._latency) * LATENCY_SMOOTHING
+        if overloaded or latency > tolerated:
+            self._decrease(latency)
+        else:
+            self._increase()
+        self._limit_gauge.set(self.limit)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        """Hold a slot of the stage for the call.
+
+        Raises:
+            BaseException: Exception of the call, after the slot release.
+
+        Yields:
+            Iterator[AsyncIterator[None]]: Nothing.
+        """
+        started = self.enter()
+        try:
+            yield
+        except BaseException as exc:  # noqa: WPS424 (Cancellation as well.)
+            self.exit(started, exc)
+            raise
+        self.exit(started, None)
+
+    def _overloaded(self, exc: Optional[BaseException]) -> bool:
+        if isinstance(exc, DependencyUnavailable):
+            return exc.dependency in self._dependencies
+        return isinstance(exc, OVERLOAD_ERRORS)
+
+    def _increase(self) -> None:
+        # Idle stage proves nothing about higher limit.
+        if self._in_flight * 2 < self.limit:
+            return
+        self._limit = min(
+            self._limit + 1 / self._limit,
+            self._config.concurrency_max_limit,
+        )
+
+    def _decrease(self, latency: float) -> None:
+        now = time.monotonic()
+        # Calls started before the last decrease report the old load.
+        if now - self._decreased_at < latency:
+            return
+        self._decreased_at = now
+        self._limit = max(
+            self._limit * self._config.concurrency_backoff_ratio,
+            self._config.concurrency_min_limit,
+        )
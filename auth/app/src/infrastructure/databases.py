@@ -1,20 +1,123 @@
 """Module with Database class."""
 
-from typing import Any, AsyncGenerator
+import itertools
+import logging
+import math
+import time
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, Optional, Union
 
+import sqlalchemy as sa
 from pydantic import PostgresDsn
 from redis.asyncio import ConnectionPool
 from redis.asyncio import Redis as RedisClient
+from redis.asyncio.cluster import ClusterNode, RedisCluster
+from redis.asyncio.sentinel import Sentinel
+from sqlalchemy.engine import Dialect, ExceptionContext
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import ConnectionPoolEntry
 from src.config import PostgreSQLSettings, RedisSettings
+from src.infrastructure.metrics import observe_pool
+
+logger = logging.getLogger(__name__)
+
+AnyRedisClient = Union[RedisClient, RedisCluster]
+MILLISECONDS_IN_SECOND = 1000
+
+
+class ReadYourWrites:  # noqa: WPS306 (Without Base class.)
+    """Unix time until which reads of the client go to the primary."""
+
+    def __init__(self, until: float = 0) -> None:
+        """Init method.
+
+        Args:
+            until (float): Unix time, reads may go to replicas after it.
+        """
+        self.until = until
+
+
+# Mutable holder, so the time set deep in the request is seen by
+# the middleware which passes it to the next requests of the client.
+read_your_writes: ContextVar[Optional[ReadYourWrites]] = ContextVar(
+    'read_your_writes', default=None,
+)
+
+
+class Replica:  # noqa: WPS306 (Without Base class.)
+    """Read-only replica, skipped for a while after connection errors."""
+
+    def __init__(self, engine: AsyncEngine, retry_interval: float) -> None:
+        """Init method.
+
+        Args:
+            engine (AsyncEngine): SQLAlchemy engine of the replica.
+            retry_interval (float): Seconds to skip replica after failure.
+        """
+        self.sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+        self._engine = engine
+        self._retry_interval = retry_interval
+        self._down_until: float = 0
+        sa.event.listen(engine.sync_engine, 'do_connect', self._connect)
+        sa.event.listen(engine.sync_engine, 'handle_error', self._on_error)
+        observe_pool(engine, 'replica_{0}'.format(engine.url.host))
+
+    @property
+    def engine(self) -> AsyncEngine:
+        """Get async engine.
+
+        Returns:
+            AsyncEngine: SQLAlchemy async engine of the replica.
+        """
+        return self._engine
+
+    @property
+    def healthy(self) -> bool:
+        """Check replica is not marked as failed.
+
+        Returns:
+            bool: True if replica can be used.
+        """
+        return time.monotonic() >= self._down_until
+
+    def _connect(
+        self,
+        dialect: Dialect,
+        conn_rec: ConnectionPoolEntry,
+        cargs: tuple[Any, ...],
+        cparams: dict[str, Any],
+    ) -> Any:
+        # Refused connection is raised as OSError, not seen by handle_error.
+        try:
+            return dialect.connect(*cargs, **cparams)
+        except Exception as exc:
+            self._mark_down(exc)
+            raise
+
+    def _on_error(self, context: ExceptionContext) -> None:
+        if context.is_disconnect:
+            self._mark_down(context.original_exception)
+
+    def _mark_down(self, exc: BaseException) -> None:
+        self._down_until = time.monotonic() + self._retry_interval
+        logger.warning(
+            'Replica is down.',
+            extra={'host': self._engine.url.host, 'error': exc},
+        )
 
 
 class PostgreSQL:
-    """Class for work with PostgreSQL."""
+    """Class for work with PostgreSQL.
+
+    Writes go to the primary. Read-only scopes go to healthy replicas
+    in turn, or to the primary if there are no replicas, all of them
+    failed or the client wrote recently.
+    """
 
     def __init__(self, config: PostgreSQLSettings) -> None:
         """Init method.
@@ -35,14 +138,66 @@ class PostgreSQL:
             ),
         )
 
+        # Set once per connection, scopes do not send it every time.
+        connect_args = {'server_settings': {
+            'statement_timeout': str(
+                math.ceil(
+                    self._config.db_statement_timeout * MILLISECONDS_IN_SECOND,
+                ),
+            ),
+        }}
+        if self._config.db_echo:
+            # Not echo of the engine, it adds a handler writing to stdout,
+            # records of the logger go through the logging queue instead.
+            logging.getLogger('sqlalchemy.engine').setLevel(logging.INFO)
         self._engine = create_async_engine(
             url=str(dsn),
-            echo=True,
+            pool_size=self._config.db_pool_size,
+            max_overflow=self._config.db_max_overflow,
+            connect_args=connect_args,
         )
+        observe_pool(self._engine, 'primary')
         self._session_factory = async_sessionmaker(
             self._engine,
             expire_on_commit=False,
         )
+        self._replicas = [
+            Replica(
+                create_async_engine(
+                    url=str(replica_dsn), connect_args=connect_args,
+                ),
+                self._config.db_replica_retry_interval,
+            )
+            for replica_dsn in self._config.db_replica_dsns
+        ]
+        self._turn = itertools.count()
+
+    @property
+    def engine(self) -> AsyncEngine:
+        """Get async engine.
+
+        Returns:
+            AsyncEngine: SQLAlchemy async engine.
+        """
+        return self._engine
+
+    @property
+    def engines(self) -> list[AsyncEngine]:
+        """Get async engines of the primary and replicas.
+
+        Returns:
+            list[AsyncEngine]: SQLAlchemy async engines.
+        """
+        return [self._engine, *(replica.engine for replica in self._replicas)]
+
+    @property
+    def statement_timeout(self) -> Optional[float]:
+        """Get statement timeout of connections.
+
+        Returns:
+            Optional[float]: Seconds, None if statements are not limited.
+        """
+        return self._config.db_statement_timeout or None
 
     @property
     def sessionmaker(self) -> async_sessionmaker[AsyncSession]:
@@ -53,45 +208,163 @@ class PostgreSQL:
         """
         return self._session_factory
 
+    def read_sessionmaker(self) -> async_sessionmaker[AsyncSession]:
+        """Get session maker for read-only scope.
+
+        Returns:
+            async_sessionmaker: Session maker of replica or primary.
+        """
+        state = read_your_writes.get()
+        if not self._replicas or (state and state.until > time.time()):
+            return self._session_factory
+        for _ in self._replicas:
+            turn = next(self._turn) % len(self._replicas)
+            if self._replicas[turn].healthy:
+                return self._replicas[turn].sessionmaker
+        return self._session_factory
+
+    def pool_status(self) -> dict[str, int]:
+        """Get checkout level of the primary pool, read from memory.
+
+        Returns:
+            dict[str, int]: Checked out connections and their limit.
+        """
+        return {
+            'checked_out': self._engine.pool.checkedout(),
+            'limit': self._config.db_pool_size + self._config.db_max_overflow,
+        }
+
+    async def ping(self) -> None:
+        """Run the cheapest query on the primary."""
+        async with self._engine.connect() as connection:
+            await connection.execute(sa.text('SELECT 1'))
+
+    def written(self) -> None:
+        """Send reads of the current client to the primary for a while."""
+        until = time.time() + self._config.db_read_your_writes_window
+        state = read_your_writes.get()
+        if state is None:
+            read_your_writes.set(ReadYourWrites(until))
+        else:
+            state.until = until
+
 
 class Redis:
     """Class for work with Redis."""
 
-    def __init__(self, redis: RedisClient) -> None:
+    def __init__(self, redis: AnyRedisClient) -> None:
         """Init method.
 
         Args:
-            redis (RedisClient): Redis connection client.
+            redis (AnyRedisClient): Redis or Redis Cluster client.
         """
         self._redis = redis
 
     @property
-    def client(self) -> RedisClient:
+    def client(self) -> AnyRedisClient:
         """Get redis client.
 
         Returns:
-            RedisClient: Redis client instance.
+            AnyRedisClient: Redis or Redis Cluster client instance.
         """
         return self._redis
 
+    async def ping(self) -> None:
+        """Send PING command."""
+        await self._redis.ping()
 
-async def init_redis(
-    config: RedisSettings,
-) -> AsyncGenerator[RedisClient, Any]:
-    """Initialize redis connection pool.
+
+def create_redis(
+    config: RedisSettings, socket_timeout: Optional[float],
+) -> AnyRedisClient:
+    """Create client for configured Redis mode.
+
+        In sentinel mode the master is discovered by sentinels and
+        rediscovered on failover, in cluster mode commands are routed
+        to nodes by hash slot of their keys.
 
     Args:
         config (RedisSettings): Configuration for redis.
+        socket_timeout (float, optional): Seconds to wait for response.
 
-    Yields:
-        Iterator[AsyncGenerator[RedisClient, Any]]: Yield redis client.
+    Returns:
+        AnyRedisClient: Redis or Redis Cluster client.
     """
+    connection_kwargs = {
+        'username': config.redis_user,
+        'password': config.redis_password,
+        'socket_timeout': socket_timeout,
+        'socket_connect_timeout': config.redis_socket_connect_timeout,
+        'max_connections': config.max_connections,
+    }
+    if config.redis_mode == 'cluster':
+        return RedisCluster(
+            startup_nodes=[
+                ClusterNode(host, port)
+                for host, port in config.redis_addresses
+            ],
+            **connection_kwargs,
+        )
+    if config.redis_mode == 'sentinel':
+        sentinel = Sentinel(
+            config.redis_addresses,
+            socket_timeout=config.redis_socket_timeout,
+            socket_connect_timeout=config.redis_socket_connect_timeout,
+        )
+        return sentinel.master_for(
+            config.redis_sentinel_service,
+            redis_class=RedisClient,
+            **connection_kwargs,
+        )
     connection_pool = ConnectionPool(
         host=config.redis_host,
         port=config.redis_port,
-        username=config.redis_user,
-        password=config.redis_password,
-        max_connections=config.max_connections,
+        **connection_kwargs,
     )
-    async with RedisClient(connection_pool=connection_pool) as redis:
+    return RedisClient(connection_pool=connection_pool)
+
+
+async def init_redis(
+    config: RedisSettings,
+) -> AsyncGenerator[AnyRedisClient, Any]:
+    """Initialize redis connection pool.
+
+    Args:
+        config (RedisSettings): Configuration for redis.
+
+    Yields:
+        Iterator[AsyncGenerator[AnyRedisClient, Any]]: Yield redis client.
+    """
+    async with create_redis(config, config.redis_socket_timeout) as redis:
         yield redis
+
+
+async def init_redis_pubsub(
+    config: RedisSettings,
+) -> AsyncGenerator[RedisClient, Any]:
+    """Initialize client for publish and subscribe.
+
+        Subscriber waits for messages as long as needed, so its socket
+        has no timeout. Cluster client has no Pub/Sub, but messages
+        published on any node of the cluster reach subscribers of all
+        nodes, so a plain client of one node is used.
+
+    Args:
+        config (RedisSettings): Configuration for redis.
+
+    Yields:
+        Iterator[AsyncGenerator[RedisClient, Any]]: Yield redis client.
+    """
+    if config.redis_mode == 'cluster':
+        host, port = config.redis_addresses[0]
+        pubsub_redis = RedisClient(
+            host=host,
+            port=port,
+            username=config.redis_user,
+            password=config.redis_password,
+            socket_connect_timeout=config.redis_socket_connect_timeout,
+        )
+    else:
+        pubsub_redis = create_redis(config, socket_timeout=None)
+    async with pubsub_redis:
+        yield pubsub_redis
@@ -0,0 +1,34 @@
+"""Module with deadline of the current request."""
+
+import asyncio
+from contextvars import ContextVar
+from typing import Optional
+
+# Event loop time until which the current request must be answered.
+deadline: ContextVar[Optional[float]] = ContextVar('deadline', default=None)
+
+
+def set_deadline(timeout: float) -> float:
+    """Set deadline of the current request.
+
+    Args:
+        timeout (float): Seconds from now.
+
+    Returns:
+        float: Deadline in event loop time.
+    """
+    when = asyncio.get_running_loop().time() + timeout
+    deadline.set(when)
+    return when
+
+
+def remaining() -> Optional[float]:
+    """Get time left until deadline.
+
+    Returns:
+        Optional[float]: Seconds, may be negative, None without deadline.
+    """
+    current = deadline.get()
+    if current is None:
+        return None
+    return current - asyncio.get_running_loop().time()
@@ -0,0 +1,153 @@
+"""Module with health of the worker and its dependencies.
+
+Health checks answer from state kept in the process: readiness flag,
+circuit breakers, checkout level of the primary pool and time of the
+last answer of every dependency. The probe calls dependencies which
+were silent for a probe interval, so the state stays fresh without
+traffic and checks never open connections themselves.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, AsyncGenerator, Awaitable, Callable, Optional
+
+from src.config import HealthSettings
+from src.infrastructure.databases import PostgreSQL, Redis
+from src.infrastructure.resilience import POSTGRESQL, REDIS, get_policy
+from src.infrastructure.warmup import Readiness
+from src.use_cases.exceptions import DependencyUnavailable
+
+logger = logging.getLogger(__name__)
+
+Ping = Callable[[], Awaitable[None]]
+
+
+class HealthMonitor:  # noqa: WPS306 (Without Base class.)
+    """Readiness of the worker and probe of its dependencies.
+
+    Dependencies are absent with the memory storage backend,
+    then readiness depends on the warm-up only.
+    """
+
+    def __init__(
+        self,
+        readiness: Readiness,
+        postgresql: Optional[PostgreSQL],
+        redis: Optional[Redis],
+        config: HealthSettings,
+    ) -> None:
+        """Init method.
+
+        Args:
+            readiness (Readiness): Flag set after warm-up.
+            postgresql (PostgreSQL, optional): Primary Database.
+            redis (Redis, optional): Cache.
+            config (HealthSettings): Settings for health checks.
+        """
+        self._readiness = readiness
+        self._postgresql = postgresql
+        self._config = config
+        self._pings: dict[str, Ping] = {}
+        if postgresql is not None:
+            self._pings[POSTGRESQL] = postgresql.ping
+        if redis is not None:
+            self._pings[REDIS] = redis.ping
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def report(self) -> dict[str, Any]:
+        """Report readiness from the state in memory.
+
+            Worker is ready after warm-up, while every dependency has
+            its breaker closed and answered within the stale time, and
+            connections of the primary pool are not all checked out.
+
+        Returns:
+            dict[str, Any]: Readiness and state of every dependency.
+        """
+        now = time.monotonic()
+        dependencies = {
+            name: self._dependency_state(name, now) for name in self._pings
+        }
+        return {
+            'ready': self._readiness.ready and all(
+                state['healthy'] for state in dependencies.values()
+            ),
+            'warmed_up': self._readiness.ready,
+            'dependencies': dependencies,
+        }
+
+    async def start(self) -> None:
+        """Start probing in the background."""
+        self._task = asyncio.create_task(self._probe())
+
+    async def stop(self) -> None:
+        """Stop probing."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    def _dependency_state(self, name: str, now: float) -> dict[str, Any]:
+        breaker = get_policy(name).breaker
+        silent_for = None
+        if breaker.answered_at is not None:
+            silent_for = now - breaker.answered_at
+        state: dict[str, Any] = {
+            'breaker_closed': breaker.closed,
+            'silent_for': silent_for,
+        }
+        healthy = breaker.closed and silent_for is not None and (
+            silent_for <= self._config.health_stale_after
+        )
+        if name == POSTGRESQL and self._postgresql is not None:
+            pool = self._postgresql.pool_status()
+            state['pool'] = pool
+            healthy = healthy and pool['checked_out'] < pool['limit']
+        state['healthy'] = healthy
+        return state
+
+    async def _probe(self) -> None:
+        interval = self._config.health_probe_interval
+        while True:  # noqa: WPS457 (Infinite loop, cancelled on stop.)
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            for name, ping in self._pings.items():
+                answered_at = get_policy(name).breaker.answered_at
+                # Traffic keeps the state fresh, busy dependencies
+                # are not called once more.
+                if answered_at is None or now - answered_at >= interval:
+                    await self._ping(name, ping)
+
+    async def _ping(self, name: str, ping: Ping) -> None:
+        try:
+            await get_policy(name).call(ping)
+        except DependencyUnavailable:
+            # Failure is counted by the breaker, it logs when opens.
+            return
+        except Exception:
+            logger.exception(
+                'Health probe failed.', extra={'dependency': name},
+            )
+
+
+async def init_health_monitor(
+    readiness: Readiness,
+    postgresql: Optional[PostgreSQL],
+    redis: Optional[Redis],
+    config: HealthSettings,
+) -> AsyncGenerator[HealthMonitor, Any]:
+    """Initialize health monitor and its probe.
+
+    Args:
+        readiness (Readiness): Flag set after warm-up.
+        postgresql (PostgreSQL, optional): Primary Database.
+        redis (Redis, optional): Cache.
+        config (HealthSettings): Settings for health checks.
+
+    Yields:
+        Iterator[AsyncGenerator[HealthMonitor, Any]]: Yield monitor.
+    """
+    monitor = HealthMonitor(readiness, postgresql, redis, config)
+    await monitor.start()
+    yield monitor
+    await monitor.stop()
@@ -0,0 +1,85 @@
+"""Module with Redis pipeline grouped by hash slot in cluster mode."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from redis.asyncio.client import Pipeline
+from redis.crc import key_slot
+from src.infrastructure.databases import AnyRedisClient
+
+# Slot of all commands when they are not split.
+SINGLE_SLOT = 0
+
+
+class SlotPipeline:  # noqa: WPS306 (Without Base class.)
+    """Pipeline which sends commands of every hash slot separately.
+
+    In cluster mode commands of one slot go to one node in one round
+    trip. Cluster pipelines of redis-py are never transactional, keys
+    of one user share the slot by hash tag, so they are still grouped
+    together. In standalone and sentinel modes all commands share one
+    pipeline, so with transaction they are executed atomically.
+    """
+
+    def __init__(
+        self, redis: AnyRedisClient, transaction: bool, by_slot: bool,
+    ) -> None:
+        """Init method.
+
+        Args:
+            redis (AnyRedisClient): Redis or Redis Cluster client.
+            transaction (bool): Wrap commands of pipelines in MULTI/EXEC.
+            by_slot (bool): Split commands by hash slot, in cluster mode.
+        """
+        self._redis = redis
+        self._transaction = transaction
+        self._by_slot = by_slot
+        self._pipelines: dict[int, Pipeline] = {}
+        self._order: list[int] = []
+
+    def for_key(self, key: str) -> Pipeline:
+        """Get pipeline for the next command with the key.
+
+        Args:
+            key (str): Key of the command.
+
+        Returns:
+            Pipeline: Pipeline of the key slot.
+        """
+        slot = SINGLE_SLOT
+        if self._by_slot:
+            slot = key_slot(key.encode())
+        if slot not in self._pipelines:
+            self._pipelines[slot] = self._redis.pipeline(
+                transaction=self._transaction,
+            )
+        self._order.append(slot)
+        return self._pipelines[slot]
+
+    async def execute(self) -> list[Any]:
+        """Send commands of all slots concurrently.
+
+        Returns:
+            list[Any]: Responses in order of commands.
+        """
+        slots = list(self._pipelines)
+        slot_responses = await asyncio.gather(*(
+            self._pipelines[slot].execute() for slot in slots
+        ))
+        responses = {
+            slot: iter(response)
+            for slot, response in zip(slots, slot_responses)
+        }
+        ordered = [next(responses[slot]) for slot in self._order]
+        self._pipelines.clear()
+        self._order.clear()
+        return ordered
+
+    async def discard(self) -> None:
+        """Drop commands of all slots."""
+        for pipeline in self._pipelines.values():
+            await pipeline.reset()
+        self._pipelines.clear()
+        self._order.clear()
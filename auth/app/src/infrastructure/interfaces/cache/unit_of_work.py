@@ -2,14 +2,30 @@
 
 from __future__ import annotations
 
-from redis.asyncio import Redis
+import asyncio
+
+from src.config import SocialAccountSettings
+from src.infrastructure.concurrency import ConcurrencyLimiter
+from src.infrastructure.databases import AnyRedisClient
+from src.infrastructure.deadlines import deadline
+from src.infrastructure.interfaces.cache.pipeline import SlotPipeline
+from src.infrastructure.interfaces.social_accounts.repo import (
+    SocialAccountRepository,
+)
 from src.infrastructure.interfaces.tokens.key_schema import KeySchema
 from src.infrastructure.interfaces.tokens.repo import (
     AccessTokenRepository,
     RefreshTokenRepository,
 )
+from src.infrastructure.metrics import OPERATION_LATENCY, UNIT_OF_WORK_OUTCOMES
+from src.infrastructure.resilience import REDIS, get_policy
+from src.tracing import traced
 from src.use_cases.interfaces.cache.unit_of_work import AbstractUnitOfWork
 
+PIPELINE_LATENCY = OPERATION_LATENCY.labels(REDIS, 'pipeline')
+EXECUTIONS = UNIT_OF_WORK_OUTCOMES.labels(REDIS, 'execute')
+DISCARDS = UNIT_OF_WORK_OUTCOMES.labels(REDIS, 'discard')
+
 
 class UnitOfWork(AbstractUnitOfWork):
     """Class for work with tokens repositories.
@@ -18,15 +34,29 @@ class UnitOfWork(AbstractUnitOfWork):
         AbstractUnitOfWork (class): Abstract Unit of Work.
     """
 
-    def __init__(self, redis: Redis, key_schema: KeySchema):
+    def __init__(  # noqa: WPS211 (Dependencies of the Unit of Work.)
+        self,
+        redis: AnyRedisClient,
+        key_schema: KeySchema,
+        social_account_config: SocialAccountSettings,
+        limiter: ConcurrencyLimiter,
+        redis_mode: str,
+    ):
         """Init method.
 
         Args:
-            redis (Redis): Redis client.
+            redis (AnyRedisClient): Redis or Redis Cluster client.
             key_schema (KeySchema): Class with key schemas for Redis.
+            social_account_config (SocialAccountSettings):
+            Settings for Social Accounts cache.
+            limiter (ConcurrencyLimiter): Limit of the Cache stage.
+            redis_mode (str): Mode of Redis deployment.
         """
         self._redis = redis
         self._key_schema = key_schema
+        self._social_account_config = social_account_config
+        self._limiter = limiter
+        self._by_slot = redis_mode == 'cluster'
         self.responses: list[None] = []
 
     def __call__(self, transaction: bool) -> UnitOfWork:
@@ -47,7 +77,9 @@ class UnitOfWork(AbstractUnitOfWork):
         Returns:
             UnitOfWork: Return themself.
         """
-        self._pipeline = self._redis.pipeline(transaction=self.transaction)
+        self._pipeline = SlotPipeline(
+            self._redis, self.transaction, self._by_slot,
+        )
 
         self.access_tokens = AccessTokenRepository(
             self._pipeline, self._key_schema,
@@ -55,10 +87,24 @@ class UnitOfWork(AbstractUnitOfWork):
         self.refresh_tokens = RefreshTokenRepository(
             self._pipeline, self._key_schema,
         )
+        self.social_accounts = SocialAccountRepository(
+            self._pipeline,
+            self._key_schema,
+            self._social_account_config.social_account_cache_ttl,
+        )
         return self
 
+    @traced(REDIS)
     async def _execute(self) -> None:
-        self.responses = await self._pipeline.execute()
+        # Pipelines are emptied by execute, so they are never retried.
+        async with self._limiter.acquire():
+            with PIPELINE_LATENCY.time():
+                async with asyncio.timeout_at(deadline.get()):
+                    self.responses = await get_policy(REDIS).call(
+                        self._pipeline.execute,
+                    )
+        EXECUTIONS.inc()
 
     async def _discard(self) -> None:
         await self._pipeline.discard()
+        DISCARDS.inc()
@@ -2,7 +2,18 @@
 
 from __future__ import annotations
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+import math
+from types import TracebackType
+from typing import Optional, Type
+
+import sqlalchemy as sa
+from src.infrastructure.concurrency import ConcurrencyLimiter
+from src.infrastructure.databases import PostgreSQL
+from src.infrastructure.deadlines import remaining
+from src.infrastructure.interfaces.social_networks.changes import (
+    SocialNetworkChanges,
+)
+from src.infrastructure.metrics import UNIT_OF_WORK_OUTCOMES
 from src.infrastructure.repositories.login_history import (
     LoginHistoryRepository,
 )
@@ -15,8 +26,14 @@ from src.infrastructure.repositories.user_service import UserServiceRepository
 from src.infrastructure.repositories.user_social_account import (
     UserSocialAccountRepository,
 )
+from src.infrastructure.resilience import POSTGRESQL, get_policy
+from src.tracing import traced
 from src.use_cases.interfaces.database.unit_of_work import AbstractUnitOfWork
 
+MILLISECONDS_IN_SECOND = 1000
+COMMITS = UNIT_OF_WORK_OUTCOMES.labels(POSTGRESQL, 'commit')
+ROLLBACKS = UNIT_OF_WORK_OUTCOMES.labels(POSTGRESQL, 'rollback')
+
 
 class UnitOfWork(AbstractUnitOfWork):
     """Class for work with domain entites repositories.
@@ -27,23 +44,42 @@ class UnitOfWork(AbstractUnitOfWork):
 
     def __init__(
         self,
-        session_factory: async_sessionmaker[AsyncSession],
+        database: PostgreSQL,
+        limiter: Optional[ConcurrencyLimiter] = None,
+        social_network_changes: Optional[SocialNetworkChanges] = None,
     ) -> None:
         """Init method.
 
         Args:
-            session_factory (async_sessionmaker[AsyncSession]):
-            Factory for create sessions.
+            database (PostgreSQL): PostgreSQL with primary and replicas.
+            limiter (ConcurrencyLimiter, optional):
+            Limit of the Database stage, scope holds a slot until exit.
+            social_network_changes (SocialNetworkChanges, optional):
+            Notified after commit of Social Networks changes.
         """
-        self._session_factory = session_factory
+        self._database = database
+        self._limiter = limiter
+        self._social_network_changes = social_network_changes
+        self._started: float = 0
 
+    @traced(POSTGRESQL)
     async def __aenter__(self) -> UnitOfWork:
         """Call when entry in async context manager.
 
+            Within request deadline statements are limited to the time
+            left, so the server does not run them for nobody. Scopes
+            with more time left keep the timeout of the connection.
+
+        Raises:
+            BaseException: If the statement timeout was not set.
+
         Returns:
             UnitOfWork: Return themself.
         """
-        self._session = self._session_factory()
+        if self._read_only:
+            self._session = self._database.read_sessionmaker()()
+        else:
+            self._session = self._database.sessionmaker()
 
         self.user = UserRepository(self._session)
         self.user_service = UserServiceRepository(self._session)
@@ -52,13 +88,76 @@ class UnitOfWork(AbstractUnitOfWork):
         self.social_network = SocialNetworkRepository(self._session)
         self.user_social_account = UserSocialAccountRepository(self._session)
 
+        if self._limiter:
+            self._started = self._limiter.enter()
+        try:
+            await self._limit_statements()
+        except BaseException as exc:  # noqa: WPS424 (Cancellation as well.)
+            self._exit_stage(exc)
+            await self._session.close()
+            raise
         return self
 
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> bool:
+        """Finish scope and release the Database stage slot.
+
+        Args:
+            exc_type (Optional[Type[BaseException]]): Exception Type
+            exc_val (Optional[BaseException]): Instance of Exception
+            exc_tb (Optional[TracebackType]): Traceback.
+
+        Raises:
+            BaseException: If commit or rollback failed.
+
+        Returns:
+            bool: Has error.
+        """
+        try:
+            has_error = await super().__aexit__(exc_type, exc_val, exc_tb)
+        except BaseException as exc:  # noqa: WPS424 (Cancellation as well.)
+            self._exit_stage(exc)
+            raise
+        self._exit_stage(exc_val)
+        return has_error
+
+    async def _limit_statements(self) -> None:
+        time_left = remaining()
+        if time_left is None:
+            return
+        # Connections limit statements already, a round trip is spent
+        # only when less time is left than that.
+        default = self._database.statement_timeout
+        if default is None or time_left < default:
+            await get_policy(POSTGRESQL).call(
+                self._session.execute,
+                sa.text('SET LOCAL statement_timeout = {0}'.format(
+                    max(math.ceil(time_left * MILLISECONDS_IN_SECOND), 1),
+                )),
+            )
+
+    def _exit_stage(self, exc: Optional[BaseException]) -> None:
+        if self._limiter:
+            self._limiter.exit(self._started, exc)
+
+    @traced(POSTGRESQL)
     async def _commit(self) -> None:
-        await self._session.commit()
+        await get_policy(POSTGRESQL).call(self._session.commit)
+        COMMITS.inc()
+        if not self._read_only:
+            self._database.written()
+        if self._social_network_changes and self.social_network.changed:
+            await self._social_network_changes.committed()
 
+    @traced(POSTGRESQL)
     async def _rollback(self) -> None:
         await self._session.rollback()
+        ROLLBACKS.inc()
 
+    @traced(POSTGRESQL)
     async def _close(self) -> None:
         await self._session.close()
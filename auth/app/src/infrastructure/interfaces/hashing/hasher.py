@@ -0,0 +1,100 @@
+"""Module with bcrypt password hasher."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncGenerator
+
+from passlib.context import CryptContext
+from src.config import ConcurrencySettings
+from src.infrastructure.concurrency import ConcurrencyLimiter
+from src.infrastructure.metrics import OPERATION_LATENCY
+from src.tracing import traced
+from src.use_cases.interfaces.hashing.hasher import IPasswordHasher
+
+pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
+BCRYPT = 'bcrypt'
+BCRYPT_HASH_LATENCY = OPERATION_LATENCY.labels(BCRYPT, 'hash')
+BCRYPT_VERIFY_LATENCY = OPERATION_LATENCY.labels(BCRYPT, 'verify')
+
+
+class PasswordHasher(IPasswordHasher):
+    """Hasher which runs bcrypt in threads behind the hashing limit.
+
+        bcrypt releases GIL, so hashes are computed in parallel while
+        the event loop serves other requests.
+
+    Args:
+        IPasswordHasher (class): Abstract password hasher.
+    """
+
+    def __init__(
+        self, executor: ThreadPoolExecutor, limiter: ConcurrencyLimiter,
+    ) -> None:
+        """Init method.
+
+        Args:
+            executor (ThreadPoolExecutor): Threads for hashing.
+            limiter (ConcurrencyLimiter): Limit of the hashing stage.
+        """
+        self._executor = executor
+        self._limiter = limiter
+
+    @traced(BCRYPT)
+    async def hash(self, password: str) -> str:
+        """Hash password.
+
+        Args:
+            password (str): Plain password.
+
+        Returns:
+            str: Password hash.
+        """
+        async with self._limiter.acquire():
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, _hash, password,
+            )
+
+    @traced(BCRYPT)
+    async def verify(self, password: str, hashed: str) -> bool:
+        """Check password against its hash.
+
+        Args:
+            password (str): Plain password.
+            hashed (str): Password hash.
+
+        Returns:
+            bool: True if password matches.
+        """
+        async with self._limiter.acquire():
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, _verify, password, hashed,
+            )
+
+
+def _hash(password: str) -> str:
+    # Timed in the thread, without waiting for a free one.
+    with BCRYPT_HASH_LATENCY.time():
+        return pwd_context.hash(password)
+
+
+def _verify(password: str, hashed: str) -> bool:
+    with BCRYPT_VERIFY_LATENCY.time():
+        return pwd_context.verify(password, hashed)
+
+
+async def init_hashing_executor(
+    config: ConcurrencySettings,
+) -> AsyncGenerator[ThreadPoolExecutor, Any]:
+    """Initialize threads for password hashing.
+
+    Args:
+        config (ConcurrencySettings): Settings for concurrency limits.
+
+    Yields:
+        Iterator[AsyncGenerator[ThreadPoolExecutor, Any]]: Yield executor.
+    """
+    executor = ThreadPoolExecutor(
+        config.password_hashing_threads, thread_name_prefix='hashing',
+    )
+    yield executor
+    executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,173 @@
+"""Module with background Login History writer."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, AsyncGenerator, Callable, Optional
+
+from src.config import LoginHistorySettings
+from src.domain.login_history.entities import LoginHistory
+from src.use_cases.interfaces.database.unit_of_work import AbstractUnitOfWork
+from src.use_cases.interfaces.login_history.writer import ILoginHistoryWriter
+
+logger = logging.getLogger(__name__)
+
+
+class LoginHistoryWriter(ILoginHistoryWriter):
+    """Writer which saves login entries in batches.
+
+        Entries are put to the bounded in-process queue and flushed by
+        the background task when batch is full or flush interval expired.
+        If the queue is full, entry is dropped, login is never blocked.
+        Failed batch is saved again after the flush interval, and
+        dropped after the configured number of attempts.
+
+    Args:
+        ILoginHistoryWriter (class): Abstract Login History writer.
+    """
+
+    def __init__(
+        self,
+        uow_factory: Callable[[], AbstractUnitOfWork],
+        config: LoginHistorySettings,
+    ) -> None:
+        """Init method.
+
+        Args:
+            uow_factory (Callable[[], AbstractUnitOfWork]):
+            Factory for create Database Units of Work.
+            config (LoginHistorySettings): Settings for Login History.
+        """
+        self._uow_factory = uow_factory
+        self._config = config
+        self._queue: asyncio.Queue[LoginHistory] = asyncio.Queue(
+            maxsize=config.login_history_queue_size,
+        )
+        self._pending: list[LoginHistory] = []
+        self._failed_attempts = 0
+        self._task: Optional[asyncio.Task[None]] = None
+        self.dropped = 0
+
+    def record(self, entity: LoginHistory) -> None:
+        """Put login entry to the queue.
+
+        Args:
+            entity (LoginHistory): entity of LoginHistory.
+        """
+        if not self._config.login_history_enabled:
+            return
+        try:
+            self._queue.put_nowait(entity)
+        except asyncio.QueueFull:
+            self.dropped += 1
+            queue_size = self._config.login_history_queue_size
+            if self.dropped != 1 and self.dropped % queue_size:
+                return
+            logger.warning(
+                'Login history queue is full, entry dropped.',
+                extra={'count': self.dropped},
+            )
+
+    def start(self) -> None:
+        """Start background flushing task."""
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop background task and flush everything left in the queue."""
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        while not self._queue.empty():
+            self._pending.append(self._queue.get_nowait())
+        try:
+            await asyncio.wait_for(
+                self._drain(),
+                timeout=self._config.login_history_shutdown_timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.error(
+                'Login history was not drained, entries lost.',
+                extra={'count': len(self._pending)},
+            )
+
+    async def _run(self) -> None:
+        while True:  # noqa: WPS457 (Infinite loop, cancelled on stop.)
+            await self._collect()
+            await self._flush()
+
+    async def _collect(self) -> None:
+        """Wait for the batch to be filled or flush interval expired."""
+        batch_size = self._config.login_history_batch_size
+        interval = self._config.login_history_flush_interval
+        loop = asyncio.get_running_loop()
+        if self._failed_attempts:
+            # Failed batch is kept and saved again after the interval,
+            # even if it is full, entries queued meanwhile join it.
+            await asyncio.sleep(interval)
+            deadline = loop.time()
+        else:
+            self._pending.append(await self._queue.get())
+            deadline = loop.time() + interval
+        while len(self._pending) < batch_size:
+            if not self._queue.empty():
+                self._pending.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                return
+            try:
+                self._pending.append(
+                    await asyncio.wait_for(self._queue.get(), timeout),
+                )
+            except asyncio.TimeoutError:
+                return
+
+    async def _drain(self) -> None:
+        while self._pending:
+            await self._flush()
+
+    async def _flush(self) -> None:
+        """Save pending entries, batch is kept until commit or last attempt."""
+        batch = self._pending[:self._config.login_history_batch_size]
+        uow = self._uow_factory()
+        try:
+            async with uow(autocommit=True):
+                await uow.login_history.insert_many(batch)
+        except Exception:
+            self._failed_attempts += 1
+            attempts = self._config.login_history_flush_attempts
+            attempt = {'count': len(batch), 'attempt': self._failed_attempts}
+            if self._failed_attempts < attempts:
+                logger.warning(
+                    'Failed to save login history entries, will retry.',
+                    extra=attempt,
+                    exc_info=True,
+                )
+                return
+            logger.exception(
+                'Failed to save login history entries, entries dropped.',
+                extra=attempt,
+            )
+        self._failed_attempts = 0
+        del self._pending[:len(batch)]  # noqa: WPS420 (Drop flushed batch.)
+
+
+async def init_login_history_writer(
+    uow_factory: Callable[[], AbstractUnitOfWork],
+    config: LoginHistorySettings,
+) -> AsyncGenerator[LoginHistoryWriter, Any]:
+    """Initialize Login History writer.
+
+    Args:
+        uow_factory (Callable[[], AbstractUnitOfWork]):
+        Factory for create Database Units of Work.
+        config (LoginHistorySettings): Settings for Login History.
+
+    Yields:
+        Iterator[AsyncGenerator[LoginHistoryWriter, Any]]: Yield writer.
+    """
+    writer = LoginHistoryWriter(uow_factory, config)
+    writer.start()
+    yield writer
+    await writer.stop()
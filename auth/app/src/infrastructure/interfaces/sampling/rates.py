@@ -0,0 +1,119 @@
+"""Module with Sampling rates shared through Redis."""
+
+import asyncio
+import logging
+from typing import Any, AsyncGenerator, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from src.infrastructure.interfaces.tokens.key_schema import KeySchema
+from src.infrastructure.sampling import TraceSampler
+from src.use_cases.interfaces.sampling.rates import ISamplingRates
+from src.use_cases.sampling.dto import SamplingRatesDTO
+
+logger = logging.getLogger(__name__)
+
+RESUBSCRIBE_INTERVAL = 5
+
+
+class SamplingRates(ISamplingRates):
+    """Sampling rates saved in Redis and applied by every process.
+
+        Changed rates are announced in Redis channel and every process
+        reloads them on the message and on (re)subscribe, so restarted
+        processes pick them up as well. Until rates are changed, or
+        while Redis is unavailable, defaults from settings are used.
+
+    Args:
+        ISamplingRates (class): Abstract sampling rates.
+    """
+
+    def __init__(
+        self, sampler: TraceSampler, redis: Redis, key_schema: KeySchema,
+    ) -> None:
+        """Init method.
+
+        Args:
+            sampler (TraceSampler): Sampler of the process.
+            redis (Redis): Redis client.
+            key_schema (KeySchema): Class with key schemas for Redis.
+        """
+        self._sampler = sampler
+        self._redis = redis
+        self._key = key_schema.sampling_rates()
+        self._channel = key_schema.sampling_rates_channel()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def current(self) -> SamplingRatesDTO:
+        """Get rates used by the process.
+
+        Returns:
+            SamplingRatesDTO: Current rates.
+        """
+        return self._sampler.rates
+
+    async def publish(self, rates: SamplingRatesDTO) -> None:
+        """Save rates and notify all processes.
+
+        Args:
+            rates (SamplingRatesDTO): New rates.
+        """
+        await self._redis.set(self._key, rates.model_dump_json())
+        await self._redis.publish(self._channel, '')
+
+    async def start(self) -> None:
+        """Load saved rates and start listening for changes."""
+        await self.refresh()
+        self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def refresh(self) -> None:
+        """Apply rates saved in Redis, if any."""
+        try:
+            saved = await self._redis.get(self._key)
+        except RedisError:
+            logger.exception('Failed to load sampling rates.')
+            return
+        if saved:
+            self._sampler.update(SamplingRatesDTO.model_validate_json(saved))
+
+    async def _listen(self) -> None:
+        while True:  # noqa: WPS457 (Resubscribe, cancelled on stop.)
+            try:
+                await self._subscribe()
+            except RedisError:
+                logger.warning('Sampling rates channel is lost.')
+            await asyncio.sleep(RESUBSCRIBE_INTERVAL)
+
+    async def _subscribe(self) -> None:
+        async with self._redis.pubsub() as pubsub:
+            await pubsub.subscribe(self._channel)
+            async for message in pubsub.listen():
+                # Changes published while unsubscribed are caught up
+                # on (re)subscribe confirmation.
+                if message['type'] in {'message', 'subscribe'}:
+                    await self.refresh()
+
+
+async def init_sampling_rates(
+    sampler: TraceSampler, redis: Redis, key_schema: KeySchema,
+) -> AsyncGenerator[SamplingRates, Any]:
+    """Initialize sampling rates shared by processes.
+
+    Args:
+        sampler (TraceSampler): Sampler of the process.
+        redis (Redis): Redis client.
+        key_schema (KeySchema): Class with key schemas for Redis.
+
+    Yields:
+        Iterator[AsyncGenerator[SamplingRates, Any]]: Yield rates.
+    """
+    rates = SamplingRates(sampler, redis, key_schema)
+    await rates.start()
+    yield rates
+    await rates.stop()
@@ -0,0 +1,78 @@
+"""Module with Social Accounts cache repository."""
+
+import uuid
+
+from src.infrastructure.interfaces.cache.pipeline import SlotPipeline
+from src.infrastructure.interfaces.tokens.key_schema import KeySchema
+from src.use_cases.interfaces.social_accounts.repo import (
+    ISocialAccountRepository,
+)
+
+
+class SocialAccountRepository(ISocialAccountRepository):
+    """Repository with users by their accounts in Social Networks.
+
+    Args:
+        ISocialAccountRepository (class): Abstract Repository.
+    """
+
+    def __init__(
+        self, pipeline: SlotPipeline, key_schema: KeySchema, ttl: int,
+    ) -> None:
+        """Init method.
+
+        Args:
+            pipeline (SlotPipeline): Redis pipeline grouped by slot.
+            key_schema (KeySchema): Class with key schemas for redis.
+            ttl (int): Seconds to keep social account.
+        """
+        self._pipeline = pipeline
+        self._key_schema = key_schema
+        self._ttl = ttl
+
+    async def retrieve(
+        self, social_network_id: uuid.UUID, social_account_id: str,
+    ) -> None:
+        """Retrieve user UUID of social account.
+
+        Args:
+            social_network_id (uuid.UUID): Social Network UUID.
+            social_account_id (str): Account identifier in Social Network.
+        """
+        key = self._key_schema.social_account(
+            social_network_id, social_account_id,
+        )
+        await self._pipeline.for_key(key).get(key)
+
+    async def insert(
+        self,
+        social_network_id: uuid.UUID,
+        social_account_id: str,
+        uid: uuid.UUID,
+    ) -> None:
+        """Insert user UUID of social account.
+
+        Args:
+            social_network_id (uuid.UUID): Social Network UUID.
+            social_account_id (str): Account identifier in Social Network.
+            uid (uuid.UUID): User UUID.
+        """
+        key = self._key_schema.social_account(
+            social_network_id, social_account_id,
+        )
+        pipeline = self._pipeline.for_key(key)
+        await pipeline.set(key, str(uid), ex=self._ttl)
+
+    async def delete(
+        self, social_network_id: uuid.UUID, social_account_id: str,
+    ) -> None:
+        """Delete social account.
+
+        Args:
+            social_network_id (uuid.UUID): Social Network UUID.
+            social_account_id (str): Account identifier in Social Network.
+        """
+        key = self._key_schema.social_account(
+            social_network_id, social_account_id,
+        )
+        await self._pipeline.for_key(key).delete(key)
@@ -0,0 +1,230 @@
+"""Module with in-memory Social Networks catalog."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import uuid
+from typing import Any, AsyncGenerator, Callable, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from src.config import SocialNetworkSettings
+from src.domain.social_network.entities import SocialNetwork
+from src.domain.social_network.exceptions import SocialNetworkNotFound
+from src.infrastructure.interfaces.social_networks.changes import (
+    SocialNetworkChanges,
+)
+from src.infrastructure.interfaces.tokens.key_schema import KeySchema
+from src.use_cases.interfaces.database.unit_of_work import AbstractUnitOfWork
+from src.use_cases.interfaces.social_networks.catalog import (
+    ISocialNetworkCatalog,
+)
+
+logger = logging.getLogger(__name__)
+
+CatalogVersion = tuple[int, int]
+ETAG_LENGTH = 32
+
+
+class SocialNetworkCatalog(ISocialNetworkCatalog):  # noqa: WPS214
+    """Social Networks loaded once and kept in process memory.
+
+        Catalog is reloaded when the message comes to Redis channel,
+        and, in case Redis messages are lost, when Database version
+        differs on periodic poll. Message is published after commit
+        of changes by any process. Readers never wait for the Database.
+
+    Args:
+        ISocialNetworkCatalog (class): Abstract Social Networks catalog.
+    """
+
+    def __init__(  # noqa: WPS211 (Dependencies of the catalog.)
+        self,
+        uow_factory: Callable[[], AbstractUnitOfWork],
+        redis: Redis,
+        key_schema: KeySchema,
+        changes: SocialNetworkChanges,
+        config: SocialNetworkSettings,
+    ) -> None:
+        """Init method.
+
+        Args:
+            uow_factory (Callable[[], AbstractUnitOfWork]):
+            Factory for create Database Units of Work.
+            redis (Redis): Redis client.
+            key_schema (KeySchema): Class with key schemas for Redis.
+            changes (SocialNetworkChanges): Commits of changes.
+            config (SocialNetworkSettings): Settings for Social Networks.
+        """
+        self._uow_factory = uow_factory
+        self._redis = redis
+        self._channel = key_schema.social_networks_channel()
+        self._changes = changes
+        self._config = config
+        self._version: Optional[CatalogVersion] = None
+        self._networks: list[SocialNetwork] = []
+        self._by_id: dict[uuid.UUID, SocialNetwork] = {}
+        self._by_name: dict[str, SocialNetwork] = {}
+        self._etag = '""'
+        self._tasks: list[asyncio.Task[None]] = []
+
+    @property
+    def etag(self) -> str:
+        """Get strong entity tag of the catalog.
+
+        Returns:
+            str: Quoted hash of serialized Social Networks.
+        """
+        return self._etag
+
+    def retrieve_all(self) -> list[SocialNetwork]:
+        """Retrieve all social networks.
+
+        Returns:
+            list[SocialNetwork]: Social Networks ordered by name.
+        """
+        return list(self._networks)
+
+    def retrieve_by_id(self, social_network_id: uuid.UUID) -> SocialNetwork:
+        """Retrieve social network by id.
+
+        Args:
+            social_network_id (uuid.UUID): Social Network UUID.
+
+        Raises:
+            SocialNetworkNotFound: If social network not found.
+
+        Returns:
+            SocialNetwork: Social Network.
+        """
+        try:
+            return self._by_id[social_network_id]
+        except KeyError:
+            raise SocialNetworkNotFound(str(social_network_id))
+
+    def retrieve_by_name(self, name: str) -> SocialNetwork:
+        """Retrieve social network by name.
+
+        Args:
+            name (str): Name of social network.
+
+        Raises:
+            SocialNetworkNotFound: If social network not found.
+
+        Returns:
+            SocialNetwork: Social Network.
+        """
+        try:
+            return self._by_name[name]
+        except KeyError:
+            raise SocialNetworkNotFound(name)
+
+    async def publish_changed(self) -> None:
+        """Notify all processes that Social Networks were changed."""
+        await self._redis.publish(self._channel, '')
+
+    async def start(self) -> None:
+        """Load catalog and start listening and polling tasks."""
+        self._changes.subscribe(self.publish_changed)
+        await self.refresh()
+        self._tasks = [
+            asyncio.create_task(self._listen()),
+            asyncio.create_task(self._poll()),
+        ]
+
+    async def stop(self) -> None:
+        """Stop background tasks."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def refresh(self) -> None:
+        """Reload catalog if Database version differs from the loaded one."""
+        try:
+            await self._load_if_changed()
+        except Exception:
+            logger.exception('Failed to refresh social networks catalog.')
+
+    async def _load_if_changed(self) -> None:
+        uow = self._uow_factory()
+        async with uow(autocommit=False):
+            # Version goes first: a change committed in between is
+            # loaded now and reloaded once more on the next check.
+            version = await uow.social_network.retrieve_version()
+            if version == self._version:
+                return
+            networks = await uow.social_network.retrieve_all()
+        self._replace(networks, version)
+
+    def _replace(
+        self, networks: list[SocialNetwork], version: CatalogVersion,
+    ) -> None:
+        dumped = [network.as_dto() for network in networks]
+        digest = hashlib.sha256()
+        for network_dto in dumped:
+            digest.update(network_dto.model_dump_json().encode())
+        self._networks = networks
+        self._by_id = {network.id: network for network in networks}
+        self._by_name = {dto.name: network for dto, network in zip(
+            dumped, networks,
+        )}
+        self._etag = '"{0}"'.format(digest.hexdigest()[:ETAG_LENGTH])
+        self._version = version
+        logger.info(
+            'Social networks catalog loaded.',
+            extra={'catalog_version': version},
+        )
+
+    async def _listen(self) -> None:
+        while True:  # noqa: WPS457 (Resubscribe, cancelled on stop.)
+            try:
+                await self._subscribe()
+            except RedisError:
+                logger.warning(
+                    'Social networks channel is lost, catalog is polled.',
+                )
+            await asyncio.sleep(self._config.social_network_poll_interval)
+
+    async def _subscribe(self) -> None:
+        async with self._redis.pubsub() as pubsub:
+            await pubsub.subscribe(self._channel)
+            async for message in pubsub.listen():
+                # Changes published while unsubscribed are caught up
+                # on (re)subscribe confirmation.
+                if message['type'] in {'message', 'subscribe'}:
+                    await self.refresh()
+
+    async def _poll(self) -> None:
+        while True:  # noqa: WPS457 (Infinite loop, cancelled on stop.)
+            await asyncio.sleep(self._config.social_network_poll_interval)
+            await self.refresh()
+
+
+async def init_social_network_catalog(
+    uow_factory: Callable[[], AbstractUnitOfWork],
+    redis: Redis,
+    key_schema: KeySchema,
+    changes: SocialNetworkChanges,
+    config: SocialNetworkSettings,
+) -> AsyncGenerator[SocialNetworkCatalog, Any]:
+    """Initialize Social Networks catalog.
+
+    Args:
+        uow_factory (Callable[[], AbstractUnitOfWork]):
+        Factory for create Database Units of Work.
+        redis (Redis): Redis client.
+        key_schema (KeySchema): Class with key schemas for Redis.
+        changes (SocialNetworkChanges): Commits of changes.
+        config (SocialNetworkSettings): Settings for Social Networks.
+
+    Yields:
+        Iterator[AsyncGenerator[SocialNetworkCatalog, Any]]: Yield catalog.
+    """
+    catalog = SocialNetworkCatalog(
+        uow_factory, redis, key_schema, changes, config,
+    )
+    await catalog.start()
+    yield catalog
+    await catalog.stop()
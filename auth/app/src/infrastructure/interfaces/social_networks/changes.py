@@ -0,0 +1,37 @@
+"""Module with notifications of committed Social Networks changes."""
+
+import logging
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+Notify = Callable[[], Awaitable[None]]
+
+
+class SocialNetworkChanges:  # noqa: WPS306 (Without Base class.)
+    """Subscribers notified after Social Networks change commit.
+
+    Units of Work notify it, the catalog subscribes to publish the
+    change to all processes. Failed notification is logged only, the
+    change is committed and periodic poll of the catalog finds it.
+    """
+
+    def __init__(self) -> None:
+        """Init method."""
+        self._subscribers: list[Notify] = []
+
+    def subscribe(self, notify: Notify) -> None:
+        """Call the subscriber after every commit of changes.
+
+        Args:
+            notify (Notify): Subscriber.
+        """
+        self._subscribers.append(notify)
+
+    async def committed(self) -> None:
+        """Notify subscribers that changes were committed."""
+        for notify in self._subscribers:
+            try:
+                await notify()
+            except Exception:
+                logger.exception('Failed to notify social networks change.')
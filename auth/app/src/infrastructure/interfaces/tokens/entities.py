@@ -3,25 +3,43 @@
 from __future__ import annotations
 
 import time
+from typing import Optional
 from uuid import UUID
 
-from jose import jwt
+from jose import JWTError, jwt
 from src.config import TokensSettings
-from src.use_cases.interfaces.tokens.entities import IToken, ITokenCreator
+from src.infrastructure.metrics import OPERATION_LATENCY
+from src.use_cases.exceptions import TokenNotValid
+from src.use_cases.interfaces.tokens.entities import (
+    ACCESS_TOKEN_TYPE,
+    REFRESH_TOKEN_TYPE,
+    IToken,
+    ITokenCreator,
+)
+
+JWT_SIGN_LATENCY = OPERATION_LATENCY.labels('jwt', 'sign')
+JWT_VERIFY_LATENCY = OPERATION_LATENCY.labels('jwt', 'verify')
 
 
 class Token(IToken):
     """Representation of a Token entity."""
 
-    def __init__(self, token: str, config: TokensSettings) -> None:
+    def __init__(
+        self,
+        token: str,
+        config: TokensSettings,
+        payload: Optional[dict] = None,
+    ) -> None:
         """Init method.
 
         Args:
             token (str): Json Web Token.
             config (TokensSettings): Settigns for JWT Tokens.
+            payload (dict, optional): Already verified token payload.
         """
         self.token = token
         self.config = config
+        self._payload = payload
 
     def get_encoded_token(self) -> str:
         """Get encoded token.
@@ -37,11 +55,14 @@ class Token(IToken):
         Returns:
             dict: Token Header and Payload.
         """
-        return jwt.decode(
-            self.token,
-            self.config.jwt_secret,
-            algorithms=self.config.encryption_algorithm,
-        )
+        if self._payload is not None:
+            return self._payload
+        with JWT_VERIFY_LATENCY.time():
+            return jwt.decode(
+                self.token,
+                self.config.jwt_secret,
+                algorithms=self.config.encryption_algorithm,
+            )
 
 
 class TokenCreator(ITokenCreator):
@@ -69,13 +90,15 @@ class TokenCreator(ITokenCreator):
         to_encode = {
             'uid': str(uid),
             'exp': time.time() + self.config.access_token_expiration,
+            'type': ACCESS_TOKEN_TYPE,
         }
         to_encode.update(kwargs)
-        access_token = jwt.encode(
-            to_encode,
-            self.config.jwt_secret,
-            algorithm=self.config.encryption_algorithm,
-        )
+        with JWT_SIGN_LATENCY.time():
+            access_token = jwt.encode(
+                to_encode,
+                self.config.jwt_secret,
+                algorithm=self.config.encryption_algorithm,
+            )
         return Token(
             access_token, self.config,
         )
@@ -94,12 +117,37 @@ class TokenCreator(ITokenCreator):
         to_encode = {
             'uid': str(uid),
             'exp': time.time() + self.config.refresh_token_expiration,
+            'type': REFRESH_TOKEN_TYPE,
         }
-        access_token = jwt.encode(
-            to_encode,
-            self.config.jwt_secret,
-            algorithm=self.config.encryption_algorithm,
-        )
+        with JWT_SIGN_LATENCY.time():
+            access_token = jwt.encode(
+                to_encode,
+                self.config.jwt_secret,
+                algorithm=self.config.encryption_algorithm,
+            )
         return Token(
             access_token, self.config,
         )
+
+    def load_token(self, token: str) -> Token:
+        """Load and verify encoded JWT token.
+
+        Args:
+            token (str): Json Web Token.
+
+        Raises:
+            TokenNotValid: If token is malformed, expired or not signed by us.
+
+        Returns:
+            Token: Instance of Token class with verified payload.
+        """
+        try:
+            with JWT_VERIFY_LATENCY.time():
+                payload = jwt.decode(
+                    token,
+                    self.config.jwt_secret,
+                    algorithms=self.config.encryption_algorithm,
+                )
+        except JWTError as exc:
+            raise TokenNotValid(str(exc))
+        return Token(token, self.config, payload)
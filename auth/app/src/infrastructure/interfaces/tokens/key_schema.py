@@ -6,6 +6,10 @@ from typing import Optional
 from src.use_cases.interfaces.tokens.entities import IToken
 
 DEFAULT_KEY_PREFIX = 'auth:jwt-tokens'
+SOCIAL_ACCOUNT_KEY_PREFIX = 'auth:social-accounts'
+SOCIAL_NETWORKS_CHANNEL = 'auth:social-networks:changed'
+SAMPLING_RATES_KEY = 'auth:sampling-rates'
+SAMPLING_RATES_CHANNEL = 'auth:sampling-rates:changed'
 
 
 def prefixed_key(func):
@@ -24,6 +28,22 @@ def prefixed_key(func):
     return wrapper
 
 
+def user_tag(uid: uuid.UUID) -> str:
+    """Get hash tag of user keys.
+
+        Redis Cluster hashes only the part in braces, so all keys of
+        the user are in one slot and may be used by one transaction
+        or script.
+
+    Args:
+        uid (uuid.UUID): User UUID.
+
+    Returns:
+        str: Hash tag.
+    """
+    return '{{{0}}}'.format(uid)
+
+
 class KeySchema:  # noqa: WPS306 (Without Base class.)
     """Methods to generate key names for Redis."""
 
@@ -48,7 +68,9 @@ class KeySchema:  # noqa: WPS306 (Without Base class.)
             str: Result key.
         """
         return '{0}:{1}:{2}'.format(
-            'access-token', str(uid), access_token.get_encoded_token(),
+            'access-token',
+            user_tag(uid),
+            access_token.get_encoded_token(),
         )
 
     @prefixed_key
@@ -63,5 +85,49 @@ class KeySchema:  # noqa: WPS306 (Without Base class.)
             str: Result key.
         """
         return '{0}:{1}:{2}'.format(
-            'refresh-token', str(uid), refresh_token.get_encoded_token(),
+            'refresh-token',
+            user_tag(uid),
+            refresh_token.get_encoded_token(),
+        )
+
+    def social_account(
+        self, social_network_id: uuid.UUID, social_account_id: str,
+    ):
+        """Get key for user of social account.
+
+        Args:
+            social_network_id (uuid.UUID): Social Network UUID.
+            social_account_id (str): Account identifier in Social Network.
+
+        Returns:
+            str: Result key.
+        """
+        return '{0}:{1}:{2}'.format(
+            SOCIAL_ACCOUNT_KEY_PREFIX,
+            str(social_network_id),
+            social_account_id,
         )
+
+    def social_networks_channel(self):
+        """Get channel for Social Networks change notifications.
+
+        Returns:
+            str: Channel name.
+        """
+        return SOCIAL_NETWORKS_CHANNEL
+
+    def sampling_rates(self):
+        """Get key for Sentry sampling rates.
+
+        Returns:
+            str: Result key.
+        """
+        return SAMPLING_RATES_KEY
+
+    def sampling_rates_channel(self):
+        """Get channel for sampling rates change notifications.
+
+        Returns:
+            str: Channel name.
+        """
+        return SAMPLING_RATES_CHANNEL
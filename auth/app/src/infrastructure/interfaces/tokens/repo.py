@@ -2,7 +2,7 @@
 
 import uuid
 
-from redis.asyncio.client import Pipeline
+from src.infrastructure.interfaces.cache.pipeline import SlotPipeline
 from src.infrastructure.interfaces.tokens.entities import IToken
 from src.infrastructure.interfaces.tokens.key_schema import KeySchema
 from src.use_cases.interfaces.tokens.repo import (
@@ -18,11 +18,13 @@ class AccessTokenRepository(IAccessTokenRepository):
         IAccessTokenRepository (class): Abstract Repository.
     """
 
-    def __init__(self, pipeline: Pipeline, key_schema: KeySchema) -> None:
+    def __init__(
+        self, pipeline: SlotPipeline, key_schema: KeySchema,
+    ) -> None:
         """Init method.
 
         Args:
-            pipeline (Pipeline): Redis pipeline.
+            pipeline (SlotPipeline): Redis pipeline grouped by slot.
             key_schema (KeySchema): Class with key schemas for redis.
         """
         self._pipeline = pipeline
@@ -42,7 +44,7 @@ class AccessTokenRepository(IAccessTokenRepository):
         key = self._key_schema.user_access_token(uid, access_token)
         decoded = access_token.get_decoded_token()
         expire = decoded['exp']
-        await self._pipeline.set(
+        await self._pipeline.for_key(key).set(
             name=key, value=str(expire), exat=int(expire),
         )
 
@@ -54,7 +56,7 @@ class AccessTokenRepository(IAccessTokenRepository):
             access_token (IToken): Access Json Web Token.
         """
         key = self._key_schema.user_access_token(uid, access_token)
-        await self._pipeline.exists(key)
+        await self._pipeline.for_key(key).exists(key)
 
 
 class RefreshTokenRepository(IRefreshTokenRepository):
@@ -64,11 +66,13 @@ class RefreshTokenRepository(IRefreshTokenRepository):
         IRefreshTokenRepository (class): Abstract Repository.
     """
 
-    def __init__(self, pipeline: Pipeline, key_schema: KeySchema) -> None:
+    def __init__(
+        self, pipeline: SlotPipeline, key_schema: KeySchema,
+    ) -> None:
         """Init method.
 
         Args:
-            pipeline (Pipeline): Redis pipeline.
+            pipeline (SlotPipeline): Redis pipeline grouped by slot.
             key_schema (KeySchema): Class with key schemas for redis
         """
         self._pipeline = pipeline
@@ -88,7 +92,7 @@ class RefreshTokenRepository(IRefreshTokenRepository):
         key = self._key_schema.user_refresh_token(uid, refresh_token)
         decoded = refresh_token.get_decoded_token()
         expire = decoded['exp']
-        await self._pipeline.set(
+        await self._pipeline.for_key(key).set(
             name=key, value=str(expire), exat=int(expire),
         )
 
@@ -104,7 +108,7 @@ class RefreshTokenRepository(IRefreshTokenRepository):
             refresh_token (IToken): Refresh Json Web Token.
         """
         key = self._key_schema.user_refresh_token(uid, refresh_token)
-        await self._pipeline.exists(key)
+        await self._pipeline.for_key(key).exists(key)
 
     async def delete(
         self,
@@ -118,4 +122,4 @@ class RefreshTokenRepository(IRefreshTokenRepository):
             refresh_token (IToken): Refresh Json Web Token.
         """
         key = self._key_schema.user_refresh_token(uid, refresh_token)
-        await self._pipeline.delete(key)
+        await self._pipeline.for_key(key).delete(key)
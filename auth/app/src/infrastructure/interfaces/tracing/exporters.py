@@ -0,0 +1,111 @@
+"""Module with exporters of spans."""
+
+import os
+from collections import deque
+from pathlib import Path
+from typing import Any, AsyncGenerator, Optional
+
+import orjson
+from src.config import TracingSettings
+from src.tracing import Span, SpanExporter, tracer
+
+
+class MemorySpanExporter(SpanExporter):
+    """Keep the latest spans in memory.
+
+    Args:
+        SpanExporter (class): Abstract span exporter.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Init method.
+
+        Args:
+            size (int): Number of the latest spans to keep.
+        """
+        self.spans: deque[Span] = deque(maxlen=size)
+
+    def export(self, span: Span) -> None:
+        """Keep finished span.
+
+        Args:
+            span (Span): Finished span.
+        """
+        self.spans.append(span)
+
+    def close(self) -> None:
+        """Keep spans for reading after instrumentation is off."""
+
+
+class FileSpanExporter(SpanExporter):
+    """Append spans to file of the process as JSON lines.
+
+        Every worker writes its own file suffixed with pid, as log files
+        rotated by workers are. Writes are buffered, the file is
+        complete after close.
+
+    Args:
+        SpanExporter (class): Abstract span exporter.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Init method.
+
+        Args:
+            path (Path): Path to the file, suffixed with pid.
+        """
+        self.path = path.with_name(
+            '{0}.{1}{2}'.format(path.stem, os.getpid(), path.suffix),
+        )
+        self._stream = self.path.open('ab')
+
+    def export(self, span: Span) -> None:
+        """Write finished span.
+
+        Args:
+            span (Span): Finished span.
+        """
+        record = span._asdict()  # noqa: WPS437 (Public API of NamedTuple.)
+        self._stream.write(
+            orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE),
+        )
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        self._stream.close()
+
+
+def create_exporter(config: TracingSettings) -> Optional[SpanExporter]:
+    """Create exporter chosen in settings.
+
+    Args:
+        config (TracingSettings): Settings for span instrumentation.
+
+    Returns:
+        Optional[SpanExporter]: Exporter, None if tracing is off.
+    """
+    if config.tracing_exporter == 'memory':
+        return MemorySpanExporter(config.tracing_memory_size)
+    if config.tracing_exporter == 'file':
+        return FileSpanExporter(config.tracing_file)
+    return None
+
+
+async def init_tracing(
+    config: TracingSettings,
+) -> AsyncGenerator[Optional[SpanExporter], Any]:
+    """Set span exporter of the process.
+
+    Args:
+        config (TracingSettings): Settings for span instrumentation.
+
+    Yields:
+        Iterator[AsyncGenerator[Optional[SpanExporter], Any]]:
+        Yield exporter, None if tracing is off.
+    """
+    exporter = create_exporter(config)
+    tracer.exporter = exporter
+    yield exporter
+    tracer.exporter = None
+    if exporter:
+        exporter.close()
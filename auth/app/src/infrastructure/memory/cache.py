@@ -0,0 +1,203 @@
+"""Module with in-memory cache for runs without Redis.
+
+Keys expire like Redis keys: an expired key is removed when it is
+read, keys nobody reads are swept by expiration time on every write.
+"""
+
+from __future__ import annotations
+
+import heapq
+import time
+from functools import partial
+from typing import Any, Callable, Optional
+
+
+class MemoryCache:  # noqa: WPS306 (Without Base class.)
+    """Values and expiration times by key, answered as Redis does."""
+
+    def __init__(self) -> None:
+        """Init method."""
+        self._strings: dict[str, bytes] = {}
+        self._expire_at: dict[str, float] = {}
+        # Unix times and keys, entries of changed keys are left stale.
+        self._expirations: list[tuple[float, str]] = []
+
+    def set(  # noqa: WPS125 (Name of the Redis command.)
+        self,
+        name: str,
+        value: str,  # noqa: WPS110 (Argument name of Redis client.)
+        ex: Optional[int] = None,
+        exat: Optional[int] = None,
+    ) -> bool:
+        """Set value, dropping the previous expiration time.
+
+        Args:
+            name (str): Key.
+            value (str): Value, stored encoded as Redis does.
+            ex (int, optional): Seconds to keep the key.
+            exat (int, optional): Unix time to remove the key at.
+
+        Returns:
+            bool: Always True, as Redis answers OK.
+        """
+        now = time.time()
+        self._sweep(now)
+        self._strings[name] = value.encode()
+        self._expire_at.pop(name, None)
+        if ex is not None:
+            exat = now + ex
+        if exat is not None:
+            self._expire_at[name] = exat
+            heapq.heappush(self._expirations, (exat, name))
+        return True
+
+    def get(self, name: str) -> Optional[bytes]:
+        """Get value.
+
+        Args:
+            name (str): Key.
+
+        Returns:
+            bytes | None: Value if the key exists.
+        """
+        if self._expired(name):
+            return None
+        return self._strings.get(name)
+
+    def exists(self, *names: str) -> int:
+        """Count existing keys.
+
+        Args:
+            names (str): Keys.
+
+        Returns:
+            int: Number of existing keys.
+        """
+        return sum(
+            1 for name in names
+            if not self._expired(name) and name in self._strings
+        )
+
+    def delete(self, *names: str) -> int:
+        """Delete keys.
+
+        Args:
+            names (str): Keys.
+
+        Returns:
+            int: Number of deleted keys.
+        """
+        deleted = self.exists(*names)
+        for name in names:
+            self._strings.pop(name, None)
+            self._expire_at.pop(name, None)
+        return deleted
+
+    def _expired(self, name: str) -> bool:
+        expire_at = self._expire_at.get(name)
+        if expire_at is None or expire_at > time.time():
+            return False
+        self._strings.pop(name)
+        self._expire_at.pop(name)
+        return True
+
+    def _sweep(self, now: float) -> None:
+        while self._expirations and self._expirations[0][0] <= now:
+            expire_at, name = heapq.heappop(self._expirations)
+            if self._expire_at.get(name) == expire_at:
+                self._strings.pop(name)
+                self._expire_at.pop(name)
+
+
+class MemoryPipeline:  # noqa: WPS306 (Without Base class.)
+    """Queue of cache commands with the interface of the slot pipeline.
+
+    Repositories of Redis queue commands here unchanged. Commands are
+    executed one after another with nothing awaited in between, so they
+    are always atomic, transaction or not.
+    """
+
+    def __init__(self, cache: MemoryCache) -> None:
+        """Init method.
+
+        Args:
+            cache (MemoryCache): Cache of the process.
+        """
+        self._cache = cache
+        self._commands: list[Callable[[], Any]] = []
+
+    def for_key(self, key: str) -> MemoryPipeline:
+        """Get pipeline for the next command with the key.
+
+        Args:
+            key (str): Key of the command.
+
+        Returns:
+            MemoryPipeline: Itself, there are no slots.
+        """
+        return self
+
+    async def set(  # noqa: WPS125 (Name of the Redis command.)
+        self, *args: Any, **kwargs: Any,
+    ) -> MemoryPipeline:
+        """Queue SET command.
+
+        Args:
+            args (Any): Arguments of MemoryCache.set.
+            kwargs (Any): Keyword arguments of MemoryCache.set.
+
+        Returns:
+            MemoryPipeline: Itself, as Redis pipeline does.
+        """
+        return self._queue(partial(self._cache.set, *args, **kwargs))
+
+    async def get(self, name: str) -> MemoryPipeline:
+        """Queue GET command.
+
+        Args:
+            name (str): Key.
+
+        Returns:
+            MemoryPipeline: Itself, as Redis pipeline does.
+        """
+        return self._queue(partial(self._cache.get, name))
+
+    async def exists(self, *names: str) -> MemoryPipeline:
+        """Queue EXISTS command.
+
+        Args:
+            names (str): Keys.
+
+        Returns:
+            MemoryPipeline: Itself, as Redis pipeline does.
+        """
+        return self._queue(partial(self._cache.exists, *names))
+
+    async def delete(self, *names: str) -> MemoryPipeline:
+        """Queue DEL command.
+
+        Args:
+            names (str): Keys.
+
+        Returns:
+            MemoryPipeline: Itself, as Redis pipeline does.
+        """
+        return self._queue(partial(self._cache.delete, *names))
+
+    def execute(self) -> list[Any]:
+        """Execute queued commands.
+
+        Returns:
+            list[Any]: Responses in order of commands.
+        """
+        responses = [command() for command in self._commands]
+        self._commands.clear()
+        return responses
+
+    def discard(self) -> None:
+        """Drop queued commands."""
+        self._commands.clear()
+
+    def _queue(self, command: Callable[[], Any]) -> MemoryPipeline:
+        self._commands.append(command)
+        return self
@@ -0,0 +1,145 @@
+"""Module with in-memory LoginHistoryRepository."""
+
+import uuid
+from datetime import UTC, datetime
+from operator import attrgetter
+from typing import Optional
+
+from src.domain.base import uuid7
+from src.domain.login_history.dto import LoginHistoryDTO
+from src.domain.login_history.entities import LoginHistory
+from src.domain.login_history.exceptions import LoginEntryNotFound
+from src.domain.login_history.value_objects import LoginHistoryCursor
+from src.domain.repositories.login_history.repo import ILoginHistoryRepository
+from src.domain.social_network.entities import SocialNetwork
+from src.infrastructure.memory.storage import MEMORY, MemorySession
+from src.infrastructure.repositories.base import decorate_all_methods
+from src.tracing import traced
+
+entry_position = attrgetter('created_at', 'id')
+
+
+@decorate_all_methods(traced, MEMORY)
+class LoginHistoryRepository(ILoginHistoryRepository):
+    """In-memory repository with login entries objects.
+
+    Args:
+        ILoginHistoryRepository (class): Abstract Repository class.
+    """
+
+    def __init__(self, session: MemorySession) -> None:
+        """Init method.
+
+        Args:
+            session (MemorySession): Session over in-memory tables.
+        """
+        self._session = session
+
+    async def insert(self, entity: LoginHistory) -> LoginHistory:
+        """Add a new login entry, ID is generated as the column does.
+
+        Args:
+            entity (LoginHistory): entity of LoginHistory class.
+
+        Returns:
+            LoginHistory: entity of LoginHistory class with new info.
+        """
+        now = datetime.now(UTC)
+        row = entity.as_dto().model_copy(update={
+            'id': uuid7(), 'created_at': now, 'updated_at': now,
+        })
+        self._session.login_history.insert(row)
+        return LoginHistory(row, social_network=entity.social_network)
+
+    async def insert_many(self, entities: list[LoginHistory]) -> None:
+        """Add a batch of login entries.
+
+            Identifiers and timestamps are taken from the entities.
+
+        Args:
+            entities (list[LoginHistory]): entities of LoginHistory class.
+        """
+        for entity in entities:
+            self._session.login_history.insert(entity.as_dto())
+
+    async def retrieve_by_id(
+        self,
+        login_entry_id: uuid.UUID,
+        created_at: Optional[datetime] = None,
+    ) -> LoginHistory:
+        """Retrieve login entry by ID.
+
+        Args:
+            login_entry_id (uuid.UUID): Login entry UUID.
+            created_at (datetime, optional): Login entry creation time.
+
+        Raises:
+            LoginEntryNotFound: If login entry not found.
+
+        Returns:
+            LoginHistory: Retrieved login entry.
+        """
+        row = self._session.login_history.get(login_entry_id)
+        if row is None or created_at and row.created_at != created_at:
+            raise LoginEntryNotFound
+        return self._load(row)
+
+    async def retrieve_by_user_id(
+        self, uid: uuid.UUID, since: Optional[datetime] = None,
+    ) -> list[LoginHistory]:
+        """Retrieve all login entries by user id.
+
+        Args:
+            uid (uuid.UUID): User UUID.
+            since (datetime, optional): Lower bound of creation time.
+
+        Raises:
+            LoginEntryNotFound: If no one login entry was found.
+
+        Returns:
+            list[LoginHistory]: Retrieved login entries.
+        """
+        rows = [
+            row
+            for row in self._session.login_history.select('user_id', uid)
+            if not since or row.created_at >= since
+        ]
+        if not rows:
+            raise LoginEntryNotFound
+        return [self._load(row) for row in rows]
+
+    async def retrieve_page_by_user_id(
+        self,
+        uid: uuid.UUID,
+        limit: int,
+        cursor: Optional[LoginHistoryCursor] = None,
+    ) -> list[LoginHistory]:
+        """Retrieve page of user login entries, newest first.
+
+            Keyset pagination on (created_at, id), as in PostgreSQL
+            repository, social networks are not loaded either.
+
+        Args:
+            uid (uuid.UUID): User UUID.
+            limit (int): Maximum number of entries.
+            cursor (LoginHistoryCursor, optional):
+            Position of the last entry of the previous page.
+
+        Returns:
+            list[LoginHistory]: Login entries, may be empty.
+        """
+        rows = self._session.login_history.select('user_id', uid)
+        if cursor:
+            position = (cursor.created_at, cursor.id)
+            rows = [row for row in rows if entry_position(row) < position]
+        rows.sort(key=entry_position, reverse=True)
+        return [LoginHistory(row) for row in rows[:limit]]
+
+    def _load(self, row: LoginHistoryDTO) -> LoginHistory:
+        social_network: Optional[SocialNetwork] = None
+        social_network_row = self._session.social_network.get(
+            row.social_network_id,
+        )
+        if social_network_row is not None:
+            social_network = SocialNetwork(social_network_row)
+        return LoginHistory(row, social_network=social_network)
@@ -0,0 +1,166 @@
+"""Module with in-memory Role Repository."""
+
+import uuid
+from datetime import UTC, datetime
+
+from src.config import UserSettings
+from src.domain.base import uuid7
+from src.domain.repositories.role.exceptions import (
+    BaseRoleNotFoundError,
+    RoleAlreadyExistsError,
+    RoleNotFoundError,
+)
+from src.domain.repositories.role.repo import IRoleRepository
+from src.domain.role.dto import RoleDTO
+from src.domain.role.entities import Role
+from src.domain.role.value_objects import AccessLevel
+from src.infrastructure.memory.storage import (
+    MEMORY,
+    MemorySession,
+    UniqueViolation,
+)
+from src.infrastructure.repositories.base import decorate_all_methods
+from src.tracing import traced
+
+
+@decorate_all_methods(traced, MEMORY)
+class RoleRepository(IRoleRepository):
+    """Implemented in-memory repository with Role objects.
+
+    Args:
+        IRoleRepository (class): Abstract Role Repository.
+    """
+
+    def __init__(self, session: MemorySession) -> None:
+        """Init method.
+
+        Args:
+            session (MemorySession): Session over in-memory tables.
+        """
+        self._roles = session.role
+
+    async def insert(self, role: Role) -> Role:
+        """Add a new role, ID is generated as the column default does.
+
+        Args:
+            role (Role): entity of Role class.
+
+        Raises:
+            RoleAlreadyExistsError: If role with that name already exists.
+
+        Returns:
+            Role (class): New Role class with new created role object info.
+        """
+        dumped_role = role.__dict__
+        now = datetime.now(UTC)
+        row = RoleDTO(
+            id=uuid7(),
+            name=dumped_role['_name'],
+            description=dumped_role['_description'],
+            access_level=dumped_role['_access_level'],
+            created_at=now,
+            updated_at=now,
+        )
+        try:
+            self._roles.insert(row)
+        except UniqueViolation as exc:
+            raise RoleAlreadyExistsError from exc
+        return Role(row)
+
+    async def retrieve_by_id(self, role_id: uuid.UUID) -> Role:
+        """Retrieve role by role ID from storage.
+
+        Args:
+            role_id (uuid.UUID): Role UUID ID.
+
+        Raises:
+            RoleNotFoundError: if role not found, throw this error.
+
+        Returns:
+            Role: Entity of Role.
+        """
+        row = self._roles.get(role_id)
+        if row is None:
+            raise RoleNotFoundError
+        return Role(row)
+
+    async def retrieve_by_name(self, name: str) -> Role:
+        """Retrieve role by role name from storage.
+
+        Args:
+            name (str): Role name.
+
+        Raises:
+            RoleNotFoundError: if role not found, throw this error.
+
+        Returns:
+            Role: Entity of Role.
+        """
+        row = self._roles.find('name', name)
+        if row is None:
+            raise RoleNotFoundError
+        return Role(row)
+
+    async def retrieve_base_role(self) -> Role:
+        """Retrieve base role by name from storage.
+
+        Raises:
+            BaseRoleNotFoundError: If role not found, throw this error.
+
+        Returns:
+            Role: Entity of Role.
+        """
+        row = self._roles.find('name', UserSettings().default_user_role)
+        if row is None:
+            raise BaseRoleNotFoundError
+        return Role(row)
+
+    async def update_access_level(
+        self, role_id: uuid.UUID, access_level: AccessLevel,
+    ) -> Role:
+        """Update the access level for role with that ID.
+
+        Args:
+            role_id (uuid.UUID): UUID Identifier.
+            access_level (AccessLevel): Instance of enum Access Class.
+
+        Returns:
+            Role: Entity of Role.
+        """
+        return self._update(role_id, access_level=access_level)
+
+    async def update_description(
+        self, role_id: uuid.UUID, description: str,
+    ) -> Role:
+        """Update the description for role with that ID.
+
+        Args:
+            role_id (uuid.UUID): UUID Identifier.
+            description (str): New description for role.
+
+        Returns:
+            Role: Entity of Role.
+        """
+        return self._update(role_id, description=description)
+
+    def _update(self, role_id: uuid.UUID, **fields) -> Role:
+        """Change fields of role with that ID.
+
+        Args:
+            role_id (uuid.UUID): UUID Identifier.
+            fields: New values of fields.
+
+        Raises:
+            RoleNotFoundError: if role not found, throw this error.
+
+        Returns:
+            Role: Entity of Role.
+        """
+        row = self._roles.get(role_id)
+        if row is None:
+            raise RoleNotFoundError
+        row = row.model_copy(update={
+            **fields, 'updated_at': datetime.now(UTC),
+        })
+        self._roles.update(row)
+        return Role(row)
@@ -0,0 +1,144 @@
+"""Module with in-memory Social Network repository."""
+
+import uuid
+from datetime import UTC, datetime
+from operator import attrgetter
+from pathlib import Path
+from typing import Optional
+
+from src.domain.base import uuid7
+from src.domain.repositories.social_network.repo import (
+    ISocialNetworkRepository,
+)
+from src.domain.social_network.dto import SocialNetworkDTO
+from src.domain.social_network.entities import SocialNetwork
+from src.domain.social_network.exceptions import SocialNetworkNotFound
+from src.infrastructure.memory.storage import MEMORY, MemorySession
+from src.infrastructure.repositories.base import decorate_all_methods
+from src.tracing import traced
+
+
+@decorate_all_methods(traced, MEMORY)
+class SocialNetworkRepository(ISocialNetworkRepository):
+    """In-memory repository with social network objects.
+
+    Args:
+        ISocialNetworkRepository (class): Abstract Repository Interface.
+    """
+
+    def __init__(self, session: MemorySession) -> None:
+        """Init method.
+
+        Args:
+            session (MemorySession): Session over in-memory tables.
+        """
+        self._networks = session.social_network
+        self.changed = False
+
+    async def insert(self, entity: SocialNetwork) -> SocialNetwork:
+        """Add a new social network, ID is generated as the column does.
+
+        Args:
+            entity (SocialNetwork): entity of SocialNetwork class.
+
+        Returns:
+            SocialNetwork:
+            Entity of SocialNetwork class with new info.
+        """
+        now = datetime.now(UTC)
+        row = entity.as_dto().model_copy(update={
+            'id': uuid7(), 'created_at': now, 'updated_at': now,
+        })
+        self._networks.insert(row)
+        self.changed = True
+        return SocialNetwork(row)
+
+    async def retrieve_by_id(
+        self, social_network_id: uuid.UUID,
+    ) -> SocialNetwork:
+        """Retrieve social network by ID.
+
+        Args:
+            social_network_id (uuid.UUID): Social network UUID.
+
+        Returns:
+            SocialNetwork: Retrieved social network.
+        """
+        return self._load(self._networks.get(social_network_id))
+
+    async def retrieve_by_name(self, name: str) -> SocialNetwork:
+        """Retrieve social network by name.
+
+        Args:
+            name (str): Social network name.
+
+        Returns:
+            SocialNetwork: Retrieved social network.
+        """
+        return self._load(self._networks.find('name', name))
+
+    async def retrieve_all(self) -> list[SocialNetwork]:
+        """Retrieve all social networks.
+
+        Returns:
+            list[SocialNetwork]: Social networks ordered by name.
+        """
+        return [
+            SocialNetwork(row)
+            for row in sorted(self._networks.scan(), key=attrgetter('name'))
+        ]
+
+    async def retrieve_version(self) -> tuple[int, int]:
+        """Retrieve version of social networks.
+
+            Version counts committed changes of the table, own
+            uncommitted changes are counted as well.
+
+        Returns:
+            tuple[int, int]: Version of the table and number of rows.
+        """
+        return (
+            self._networks.table.version + len(self._networks.writes),
+            len(self._networks.scan()),
+        )
+
+    async def change_picture(
+        self, social_network_id: uuid.UUID, picture_file_path: Path,
+    ) -> SocialNetwork:
+        """Change the social network picture with that ID.
+
+        Args:
+            social_network_id (uuid.UUID): Social network UUID.
+            picture_file_path (Path): New file path to picture.
+
+        Raises:
+            SocialNetworkNotFound: If social network not found.
+
+        Returns:
+            SocialNetwork: Updated social network.
+        """
+        row = self._networks.get(social_network_id)
+        if row is None:
+            raise SocialNetworkNotFound
+        row = row.model_copy(update={
+            'picture': picture_file_path, 'updated_at': datetime.now(UTC),
+        })
+        self._networks.update(row)
+        self.changed = True
+        return SocialNetwork(row)
+
+    def _load(self, row: Optional[SocialNetworkDTO]) -> SocialNetwork:
+        """Build social network entity.
+
+        Args:
+            row (SocialNetworkDTO, optional): Row of social network.
+
+        Raises:
+            SocialNetworkNotFound: If social network not found.
+
+        Returns:
+            SocialNetwork: Retrieved social network.
+        """
+        if row is None:
+            raise SocialNetworkNotFound
+        return SocialNetwork(row)
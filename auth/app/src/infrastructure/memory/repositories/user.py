@@ -0,0 +1,199 @@
+"""Module with in-memory User Repository."""
+
+import uuid
+from datetime import UTC, datetime
+from typing import Optional
+
+from src.domain.repositories.user.exceptions import UserNotFoundError
+from src.domain.repositories.user.repo import IUserRepository
+from src.domain.user.dto import UserDTO
+from src.domain.user.entities import User
+from src.domain.user.value_objects import UserAdditionalFields
+from src.infrastructure.memory.repositories.user_service import (
+    load_user_service,
+)
+from src.infrastructure.memory.storage import MEMORY, MemorySession
+from src.infrastructure.repositories.base import decorate_all_methods
+from src.tracing import traced
+
+
+@decorate_all_methods(traced, MEMORY)
+class UserRepository(IUserRepository):  # noqa: WPS214 (Too many methods.)
+    """Implement in-memory Repository with User objects.
+
+    Email is unique case-insensitively and login is unique, violations
+    raise UniqueViolation, as PostgreSQL raises IntegrityError.
+    """
+
+    def __init__(self, session: MemorySession) -> None:
+        """Init method.
+
+        Args:
+            session (MemorySession): Session over in-memory tables.
+        """
+        self._session = session
+
+    async def insert(self, user: User) -> User:
+        """Add a new user.
+
+        Args:
+            user (User): entity of User class.
+
+        Returns:
+            User (class): Entity of User class with new added info.
+        """
+        now = datetime.now(UTC)
+        row = user.as_dto().model_copy(update={
+            'created_at': now, 'updated_at': now,
+        })
+        self._session.user.insert(row)
+        return User(row, user_service=user.user_service)
+
+    async def retrieve_by_id(self, uid: uuid.UUID) -> User:
+        """Retrieve User by that ID.
+
+        Args:
+            uid (uuid.UUID): User UUID.
+
+        Returns:
+            User: Retrieved User.
+        """
+        return self._load(self._session.user.get(uid))
+
+    async def retrieve_by_email(self, email: str) -> User:
+        """Retrieve User by that email, case-insensitive.
+
+        Args:
+            email (str): Electronic mail.
+
+        Returns:
+            User: Retrieved User.
+        """
+        return self._load(self._session.user.find('email', email.lower()))
+
+    async def retrieve_by_login(self, login: str) -> User:
+        """Retrieve User by that login.
+
+        Args:
+            login (str): Unique user login.
+
+        Returns:
+            User: Retrieved User.
+        """
+        return self._load(self._session.user.find('login', login))
+
+    async def retrieve_by_email_or_login(self, email: str, login: str) -> User:
+        """Retrieve User by login or email.
+
+        Args:
+            email (str): Electronic mail.
+            login (str): Unique login.
+
+        Returns:
+            User: Retrieved user.
+        """
+        users = self._session.user
+        return self._load(
+            users.find('email', email.lower()) or users.find('login', login),
+        )
+
+    async def change_email(self, uid: uuid.UUID, email: str) -> User:
+        """Change the email of user with that ID.
+
+        Args:
+            uid (uuid.UUID): User UUID.
+            email (str): Electronic mail.
+
+        Returns:
+            User: Updated User.
+        """
+        return self._update(uid, email=email)
+
+    async def change_login(self, uid: uuid.UUID, login: str) -> User:
+        """Change the login of user with that ID.
+
+        Args:
+            uid (uuid.UUID): User UUID.
+            login (str): Unique User login.
+
+        Returns:
+            User: Updated User.
+        """
+        return self._update(uid, login=login)
+
+    async def change_password(self, uid: uuid.UUID, password: str) -> User:
+        """Change the password of user with that ID.
+
+        Args:
+            uid (uuid.UUID): User UUID.
+            password (str): New password.
+
+        Returns:
+            User: Updated User.
+        """
+        return self._update(uid, password=password)
+
+    async def update_additional_info(
+        self, uid: uuid.UUID, user_additional_fields: UserAdditionalFields,
+    ) -> User:
+        """Update additional fields of user with that ID.
+
+            Empty fields are left unchanged, as in PostgreSQL repository.
+
+        Args:
+            uid (uuid.UUID): User UUID.
+            user_additional_fields (UserAdditionalFields):
+            Pydantic model with new Additional fields.
+
+        Returns:
+            User: Updated User.
+        """
+        return self._update(uid, **{
+            field: new_value
+            for field, new_value in user_additional_fields.model_dump().items()
+            if new_value
+        })
+
+    def _update(self, uid: uuid.UUID, **fields) -> User:
+        """Change fields of user with that ID.
+
+        Args:
+            uid (uuid.UUID): User UUID.
+            fields: New values of fields.
+
+        Raises:
+            UserNotFoundError: If user not found.
+
+        Returns:
+            User: Updated User.
+        """
+        row = self._session.user.get(uid)
+        if row is None:
+            raise UserNotFoundError
+        row = row.model_copy(update={
+            **fields, 'updated_at': datetime.now(UTC),
+        })
+        self._session.user.update(row)
+        return self._load(row)
+
+    def _load(self, row: Optional[UserDTO]) -> User:
+        """Build User entity with its user service and role.
+
+        Args:
+            row (UserDTO, optional): Row of User.
+
+        Raises:
+            UserNotFoundError: If user not found.
+
+        Returns:
+            User: Retrieved User.
+        """
+        if row is None:
+            raise UserNotFoundError
+        return User(
+            entity=row,
+            user_service=load_user_service(
+                self._session,
+                self._session.user_service.get(row.user_service_id),
+            ),
+        )
@@ -0,0 +1,173 @@
+"""Module with in-memory User Service repository."""
+
+import uuid
+from datetime import UTC, datetime
+
+from src.domain.base import uuid7
+from src.domain.repositories.user.exceptions import UserNotFoundError
+from src.domain.repositories.user_service.repo import IUserServiceRepository
+from src.domain.role.entities import Role
+from src.domain.user_service.dto import UserServiceDTO
+from src.domain.user_service.entities import UserService
+from src.infrastructure.memory.storage import MEMORY, MemorySession
+from src.infrastructure.repositories.base import decorate_all_methods
+from src.tracing import traced
+
+
+def load_user_service(
+    session: MemorySession, row: UserServiceDTO,
+) -> UserService:
+    """Build User Service entity with its role.
+
+    Args:
+        session (MemorySession): Session over in-memory tables.
+        row (UserServiceDTO): Row of User Service.
+
+    Returns:
+        UserService: Entity of User Service.
+    """
+    return UserService(row, role=Role(session.role.get(row.role_id)))
+
+
+@decorate_all_methods(traced, MEMORY)
+class UserServiceRepository(IUserServiceRepository):
+    """Implement in-memory Repository with user service objects.
+
+    Args:
+        IUserServiceRepository (class): Abstract Repository Interface.
+    """
+
+    def __init__(self, session: MemorySession) -> None:
+        """Init method.
+
+        Args:
+            session (MemorySession): Session over in-memory tables.
+        """
+        self._session = session
+
+    async def insert(self, user_service: UserService) -> UserService:
+        """Add a new User Service, ID is generated as the column default does.
+
+        Args:
+            user_service (UserService): entity of User Service class.
+
+        Returns:
+            UserService: Entity of User Service class with created user info.
+        """
+        dumped_user_service = user_service.__dict__
+        now = datetime.now(UTC)
+        row = UserServiceDTO(
+            id=uuid7(),
+            role_id=dumped_user_service['_role_id'],
+            active=dumped_user_service['_active'],
+            verified=dumped_user_service['_verified'],
+            created_at=now,
+            updated_at=now,
+        )
+        self._session.user_service.insert(row)
+        return UserService(row, role=user_service.role)
+
+    async def retrieve_by_id(self, uid: uuid.UUID) -> UserService:
+        """Retrieve User Service info by user ID.
+
+        Args:
+            uid (uuid.UUID): ID of the user service.
+
+        Raises:
+            UserNotFoundError: If the user service is not found.
+
+        Returns:
+            UserService: Retrieved user service.
+        """
+        row = self._session.user_service.get(uid)
+        if row is None:
+            raise UserNotFoundError
+        return load_user_service(self._session, row)
+
+    async def update_active_status(
+        self, uid: uuid.UUID, active_status: bool,
+    ) -> UserService:
+        """Update the active status with that ID.
+
+        Args:
+            uid (uuid.UUID): ID of the user service.
+            active_status (bool): The new active status.
+
+        Returns:
+            UserService: Updated user service.
+        """
+        return self._update(uid, active=active_status)
+
+    async def update_verification_status(
+        self, uid: uuid.UUID, verified_status: bool,
+    ) -> UserService:
+        """Update the verification status of a user service.
+
+        Args:
+            uid (uuid.UUID): ID of the user service.
+            verified_status (bool): The new verification status.
+
+        Returns:
+            UserService: Updated user service.
+        """
+        return self._update(uid, verified=verified_status)
+
+    async def update_role(self, uid: uuid.UUID, role: Role) -> UserService:
+        """Update the role of a user service.
+
+        Args:
+            uid (uuid.UUID): ID of the user service.
+            role (Role): New role for update.
+
+        Returns:
+            UserService: Updated user service.
+        """
+        return self._update(uid, role_id=role.id)
+
+    async def update_role_by_user_ids(
+        self, user_ids: list[uuid.UUID], role: Role,
+    ) -> list[uuid.UUID]:
+        """Update role of many users.
+
+            Users which already have the role are not updated.
+
+        Args:
+            user_ids (list[uuid.UUID]): Users UUID IDs.
+            role (Role): New role for update.
+
+        Returns:
+            list[uuid.UUID]: IDs of users whose role was changed.
+        """
+        changed = []
+        for uid in user_ids:
+            user = self._session.user.get(uid)
+            if user is None:
+                continue
+            row = self._session.user_service.get(user.user_service_id)
+            if row is None or row.role_id == role.id:
+                continue
+            self._update(row.id, role_id=role.id)
+            changed.append(uid)
+        return changed
+
+    def _update(self, uid: uuid.UUID, **fields) -> UserService:
+        """Change fields of user service with that ID.
+
+        Args:
+            uid (uuid.UUID): ID of the user service.
+            fields: New values of fields.
+
+        Raises:
+            UserNotFoundError: If the user service is not found.
+
+        Returns:
+            UserService: Updated user service.
+        """
+        row = self._session.user_service.get(uid)
+        if row is None:
+            raise UserNotFoundError
+        row = row.model_copy(update={
+            **fields, 'updated_at': datetime.now(UTC),
+        })
+        self._session.user_service.update(row)
+        return load_user_service(self._session, row)
@@ -0,0 +1,155 @@
+"""Module with in-memory User social account repository."""
+
+import uuid
+from datetime import UTC, datetime
+
+from src.domain.repositories.user_social_account.repo import (
+    IUserSocialAccountRepository,
+)
+from src.domain.user_social_account.dto import UserSocialAccountDTO
+from src.domain.user_social_account.entities import UserSocialAccount
+from src.domain.user_social_account.exceptions import UserSocialAccountNotFound
+from src.infrastructure.memory.storage import MEMORY, MemorySession
+from src.infrastructure.repositories.base import decorate_all_methods
+from src.tracing import traced
+
+
+@decorate_all_methods(traced, MEMORY)
+class UserSocialAccountRepository(IUserSocialAccountRepository):
+    """In-memory repository with users social accounts objects.
+
+    Args:
+        IUserSocialAccountRepository (class): Abstract Repository class.
+    """
+
+    def __init__(self, session: MemorySession) -> None:
+        """Init method.
+
+        Args:
+            session (MemorySession): Session over in-memory tables.
+        """
+        self._accounts = session.user_social_account
+
+    async def insert(self, entity: UserSocialAccount) -> UserSocialAccount:
+        """Add a new social account for user.
+
+        Args:
+            entity (UserSocialAccount): entity of UserSocialAccount class.
+
+        Returns:
+            UserSocialAccount: entity of UserSocialAccount class with new info.
+        """
+        now = datetime.now(UTC)
+        row = entity.as_dto().model_copy(update={
+            'created_at': now, 'updated_at': now,
+        })
+        self._accounts.insert(row)
+        return UserSocialAccount(row)
+
+    async def delete_by_id(self, user_social_account_id: uuid.UUID) -> None:
+        """Delete social account by ID.
+
+        Args:
+            user_social_account_id (uuid.UUID): User social account UUID.
+        """
+        self._accounts.delete(user_social_account_id)
+
+    async def delete_by_user_and_social_network(
+        self, uid: uuid.UUID, social_network_id: uuid.UUID,
+    ) -> None:
+        """Delete social account by user ID and social network ID.
+
+        Args:
+            uid (uuid.UUID): User UUID.
+            social_network_id (uuid.UUID): Social Network UUID.
+        """
+        for row in self._accounts.select('user_id', uid):
+            if row.social_network_id == social_network_id:
+                self._accounts.delete(row.id)
+
+    async def retrieve_by_id(
+        self, user_social_account_id: uuid.UUID,
+    ) -> UserSocialAccount:
+        """Retrieve user social account by ID.
+
+        Args:
+            user_social_account_id (uuid.UUID): User social account UUID.
+
+        Raises:
+            UserSocialAccountNotFound: If user social account not found.
+
+        Returns:
+            UserSocialAccount: Retrieved record.
+        """
+        row = self._accounts.get(user_social_account_id)
+        if row is None:
+            raise UserSocialAccountNotFound
+        return UserSocialAccount(row)
+
+    async def retrieve_by_user_id(
+        self, uid: uuid.UUID,
+    ) -> list[UserSocialAccount]:
+        """Retrieve all user social accounts.
+
+        Args:
+            uid (uuid.UUID): User UUID.
+
+        Returns:
+            list[UserSocialAccount]: Retrieved records.
+        """
+        return self._load_all(self._accounts.select('user_id', uid))
+
+    async def retrieve_by_social_network_id(
+        self, social_network_id: uuid.UUID,
+    ) -> list[UserSocialAccount]:
+        """Retrieve all social accounts with this social network.
+
+        Args:
+            social_network_id (uuid.UUID): Social network ID.
+
+        Returns:
+            list[UserSocialAccount]: Retrieved records.
+        """
+        return self._load_all(
+            self._accounts.select('social_network_id', social_network_id),
+        )
+
+    async def retrieve_by_social_account(
+        self, social_network_id: uuid.UUID, social_account_id: str,
+    ) -> UserSocialAccount:
+        """Retrieve user social account by identifier in social network.
+
+        Args:
+            social_network_id (uuid.UUID): Social network ID.
+            social_account_id (str): Account identifier in social network.
+
+        Raises:
+            UserSocialAccountNotFound: If user social account not found.
+
+        Returns:
+            UserSocialAccount: Retrieved record.
+        """
+        row = self._accounts.find(
+            'social_account', (social_network_id, social_account_id),
+        )
+        if row is None:
+            raise UserSocialAccountNotFound
+        return UserSocialAccount(row)
+
+    def _load_all(
+        self, rows: list[UserSocialAccountDTO],
+    ) -> list[UserSocialAccount]:
+        """Build entities of records.
+
+        Args:
+            rows (list[UserSocialAccountDTO]): Rows of social accounts.
+
+        Raises:
+            UserSocialAccountNotFound: If there are no records.
+
+        Returns:
+            list[UserSocialAccount]: Retrieved records.
+        """
+        if not rows:
+            raise UserSocialAccountNotFound
+        return [UserSocialAccount(row) for row in rows]
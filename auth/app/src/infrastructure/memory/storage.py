@@ -0,0 +1,389 @@
+"""Module with in-memory tables for runs without PostgreSQL.
+
+Rows are DTOs kept by ID, indexes are dictionaries maintained on every
+write. Sessions change tables only on commit, so changes in progress
+are seen by nobody else, as with read committed isolation. Nothing is
+awaited while a commit is applied, so it is atomic for the event loop.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections import defaultdict
+from datetime import UTC, datetime
+from operator import attrgetter
+from typing import Any, Callable, Hashable, Optional
+
+from src.config import UserSettings
+from src.domain.base import uuid7
+from src.domain.role.dto import RoleDTO
+from src.domain.role.value_objects import AccessLevel
+
+MEMORY = 'memory'
+
+IndexKey = Callable[[Any], Optional[Hashable]]
+IndexEntries = dict[Hashable, set[uuid.UUID]]
+Writes = dict[uuid.UUID, Optional[Any]]
+
+by_name = attrgetter('name')
+by_user_id = attrgetter('user_id')
+
+
+class UniqueViolation(Exception):
+    """Row has the key of another row in a unique index."""
+
+
+class MemoryTable:  # noqa: WPS306 (Without Base class.)
+    """Committed rows with unique and non-unique indexes.
+
+    Key functions return None for rows out of the index,
+    so nulls do not conflict, as in PostgreSQL.
+    """
+
+    def __init__(
+        self,
+        unique: Optional[dict[str, IndexKey]] = None,
+        indexes: Optional[dict[str, IndexKey]] = None,
+    ) -> None:
+        """Init method.
+
+        Args:
+            unique (dict[str, IndexKey], optional):
+            Key functions of unique indexes by index name.
+            indexes (dict[str, IndexKey], optional):
+            Key functions of non-unique indexes by index name.
+        """
+        self.rows: dict[uuid.UUID, Any] = {}
+        # Grows on every committed change, as a sequence would.
+        self.version = 0
+        self.unique = unique or {}
+        self.indexes = indexes or {}
+        self._unique_ids: dict[str, dict[Hashable, uuid.UUID]] = {
+            name: {} for name in self.unique
+        }
+        self._index_ids: dict[str, IndexEntries] = {
+            name: defaultdict(set) for name in self.indexes
+        }
+
+    def find(self, index: str, key: Hashable) -> Optional[uuid.UUID]:
+        """Find ID of committed row by unique index.
+
+        Args:
+            index (str): Name of unique index.
+            key (Hashable): Key in the index.
+
+        Returns:
+            uuid.UUID | None: Row ID if exists.
+        """
+        return self._unique_ids[index].get(key)
+
+    def select(self, index: str, key: Hashable) -> set[uuid.UUID]:
+        """Select IDs of committed rows by non-unique index.
+
+        Args:
+            index (str): Name of non-unique index.
+            key (Hashable): Key in the index.
+
+        Returns:
+            set[uuid.UUID]: Row IDs, may be empty.
+        """
+        return self._index_ids[index].get(key, set())
+
+    def validate(self, writes: Writes, inserted: set[uuid.UUID]) -> None:
+        """Check writes of a session against rows committed since.
+
+        Args:
+            writes (Writes): New rows by ID, None for deleted rows.
+            inserted (set[uuid.UUID]): IDs of rows inserted by the session.
+
+        Raises:
+            UniqueViolation: If ID or unique key was taken meanwhile.
+        """
+        if not inserted.isdisjoint(self.rows):
+            raise UniqueViolation('id')
+        for row in writes.values():
+            if row is not None:
+                self._validate_row(row, writes)
+
+    def apply(self, writes: Writes) -> None:
+        """Replace rows and their index entries.
+
+        Args:
+            writes (Writes): New rows by ID, None for deleted rows.
+        """
+        for row_id, row in writes.items():
+            old = self.rows.pop(row_id, None)
+            if old is not None:
+                self._unindex(old)
+            if row is not None:
+                self.rows[row_id] = row
+                self._index(row)
+        self.version += len(writes)
+
+    def _validate_row(self, row: Any, writes: Writes) -> None:
+        for name, unique_key in self.unique.items():
+            owner = self.find(name, unique_key(row))
+            # Keys of rows written by the session are released.
+            if owner not in {None, row.id} and owner not in writes:
+                raise UniqueViolation(name)
+
+    def _index(self, row: Any) -> None:
+        for name, unique_key in self.unique.items():
+            key = unique_key(row)
+            if key is not None:
+                self._unique_ids[name][key] = row.id
+        for index_name, index_key in self.indexes.items():
+            key = index_key(row)
+            if key is not None:
+                self._index_ids[index_name][key].add(row.id)
+
+    def _unindex(self, row: Any) -> None:
+        for name, unique_key in self.unique.items():
+            self._unique_ids[name].pop(unique_key(row), None)
+        for index_name, index_key in self.indexes.items():
+            key = index_key(row)
+            ids = self._index_ids[index_name].get(key)
+            if ids is None:
+                continue
+            ids.discard(row.id)
+            if not ids:
+                self._index_ids[index_name].pop(key)
+
+
+class TableView:  # noqa: WPS306 (Without Base class.)
+    """Rows of the table as a session sees them, own writes included."""
+
+    def __init__(self, table: MemoryTable) -> None:
+        """Init method.
+
+        Args:
+            table (MemoryTable): Table with committed rows.
+        """
+        self.table = table
+        self.writes: Writes = {}
+        self.inserted: set[uuid.UUID] = set()
+
+    def get(self, row_id: Optional[uuid.UUID]) -> Optional[Any]:
+        """Get row by ID.
+
+        Args:
+            row_id (uuid.UUID, optional): Row ID.
+
+        Returns:
+            Any | None: Row if exists.
+        """
+        return self.writes.get(row_id, self.table.rows.get(row_id))
+
+    def find(self, index: str, key: Hashable) -> Optional[Any]:
+        """Find row by unique index.
+
+        Args:
+            index (str): Name of unique index.
+            key (Hashable): Key in the index.
+
+        Returns:
+            Any | None: Row if exists.
+        """
+        unique_key = self.table.unique[index]
+        row = self.get(self.table.find(index, key))
+        if row is not None and unique_key(row) == key:
+            return row
+        for written in self.writes.values():
+            if written is not None and unique_key(written) == key:
+                return written
+        return None
+
+    def select(self, index: str, key: Hashable) -> list[Any]:
+        """Select rows by non-unique index.
+
+        Args:
+            index (str): Name of non-unique index.
+            key (Hashable): Key in the index.
+
+        Returns:
+            list[Any]: Rows, may be empty.
+        """
+        index_key = self.table.indexes[index]
+        rows = [
+            self.table.rows[row_id]
+            for row_id in self.table.select(index, key)
+            if row_id not in self.writes
+        ]
+        rows.extend(
+            written
+            for written in self.writes.values()
+            if written is not None and index_key(written) == key
+        )
+        return rows
+
+    def scan(self) -> list[Any]:
+        """Get all rows.
+
+        Returns:
+            list[Any]: Rows in no particular order.
+        """
+        rows = [
+            row
+            for row_id, row in self.table.rows.items()
+            if row_id not in self.writes
+        ]
+        rows.extend(
+            written
+            for written in self.writes.values()
+            if written is not None
+        )
+        return rows
+
+    def insert(self, row: Any) -> None:
+        """Add a new row.
+
+        Args:
+            row (Any): Row with a new ID.
+
+        Raises:
+            UniqueViolation: If ID or unique key is taken.
+        """
+        if self.get(row.id) is not None:
+            raise UniqueViolation('id')
+        self.update(row)
+        self.inserted.add(row.id)
+
+    def update(self, row: Any) -> None:
+        """Replace the row with the same ID.
+
+        Args:
+            row (Any): Changed row.
+
+        Raises:
+            UniqueViolation: If unique key is taken by another row.
+        """
+        for name, unique_key in self.table.unique.items():
+            key = unique_key(row)
+            owner = None if key is None else self.find(name, key)
+            if owner is not None and owner.id != row.id:
+                raise UniqueViolation(name)
+        self.writes[row.id] = row
+
+    def delete(self, row_id: uuid.UUID) -> Optional[Any]:
+        """Delete row by ID.
+
+        Args:
+            row_id (uuid.UUID): Row ID.
+
+        Returns:
+            Any | None: Deleted row if existed.
+        """
+        row = self.get(row_id)
+        if row is not None:
+            self.writes[row_id] = None
+        return row
+
+    def commit(self) -> None:
+        """Apply writes to the table and forget them."""
+        # Rows deleted by others meanwhile stay deleted, as
+        # an UPDATE waiting for the lock would find nothing.
+        self.table.apply({
+            row_id: row
+            for row_id, row in self.writes.items()
+            if row_id in self.inserted or row_id in self.table.rows
+        })
+        self.rollback()
+
+    def rollback(self) -> None:
+        """Forget writes."""
+        self.writes.clear()
+        self.inserted.clear()
+
+
+class MemoryDatabase:  # noqa: WPS306 (Without Base class.)
+    """Tables of the service, shared by all sessions of the process.
+
+    Base role of new users is created with the tables,
+    there are no migrations to add it.
+    """
+
+    def __init__(self, config: UserSettings) -> None:
+        """Init method.
+
+        Args:
+            config (UserSettings): Settings with name of the base role.
+        """
+        self.role = MemoryTable(unique={'name': by_name})
+        self.user_service = MemoryTable()
+        self.user = MemoryTable(unique={
+            'email': lambda user: user.email.lower(),
+            'login': attrgetter('login'),
+        })
+        self.login_history = MemoryTable(indexes={'user_id': by_user_id})
+        self.social_network = MemoryTable(unique={'name': by_name})
+        self.user_social_account = MemoryTable(
+            unique={'social_account': attrgetter(
+                'social_network_id', 'social_account_id',
+            )},
+            indexes={
+                'user_id': by_user_id,
+                'social_network_id': attrgetter('social_network_id'),
+            },
+        )
+        now = datetime.now(UTC)
+        base_role = RoleDTO(
+            id=uuid7(),
+            name=config.default_user_role,
+            access_level=AccessLevel.base,
+            created_at=now,
+            updated_at=now,
+        )
+        self.role.apply({base_role.id: base_role})
+
+    def session(self) -> MemorySession:
+        """Open session over the tables.
+
+        Returns:
+            MemorySession: New session.
+        """
+        return MemorySession(self)
+
+
+class MemorySession:  # noqa: WPS306 (Without Base class.)
+    """Changes of one Unit of Work, applied to tables on commit."""
+
+    def __init__(self, database: MemoryDatabase) -> None:
+        """Init method.
+
+        Args:
+            database (MemoryDatabase): Tables of the service.
+        """
+        self.role = TableView(database.role)
+        self.user_service = TableView(database.user_service)
+        self.user = TableView(database.user)
+        self.login_history = TableView(database.login_history)
+        self.social_network = TableView(database.social_network)
+        self.user_social_account = TableView(database.user_social_account)
+        self._views = (
+            self.role,
+            self.user_service,
+            self.user,
+            self.login_history,
+            self.social_network,
+            self.user_social_account,
+        )
+
+    def commit(self) -> None:
+        """Apply changes of all tables, nothing if any of them conflicts.
+
+        Raises:
+            UniqueViolation: If a change conflicts with committed rows.
+        """
+        try:
+            for view in self._views:
+                view.table.validate(view.writes, view.inserted)
+        except UniqueViolation:
+            self.rollback()
+            raise
+        for changed in self._views:
+            changed.commit()
+
+    def rollback(self) -> None:
+        """Forget changes of all tables."""
+        for view in self._views:
+            view.rollback()
@@ -0,0 +1,174 @@
+"""Module with in-memory Units of Work.
+
+They replace PostgreSQL and Redis Units of Work for benchmarks and
+stress tests of use cases, which then need no external services.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from src.config import SocialAccountSettings
+from src.infrastructure.interfaces.social_accounts.repo import (
+    SocialAccountRepository,
+)
+from src.infrastructure.interfaces.social_networks.changes import (
+    SocialNetworkChanges,
+)
+from src.infrastructure.interfaces.tokens.key_schema import KeySchema
+from src.infrastructure.interfaces.tokens.repo import (
+    AccessTokenRepository,
+    RefreshTokenRepository,
+)
+from src.infrastructure.memory.cache import MemoryCache, MemoryPipeline
+from src.infrastructure.memory.repositories.login_history import (
+    LoginHistoryRepository,
+)
+from src.infrastructure.memory.repositories.role import RoleRepository
+from src.infrastructure.memory.repositories.social_network import (
+    SocialNetworkRepository,
+)
+from src.infrastructure.memory.repositories.user import UserRepository
+from src.infrastructure.memory.repositories.user_service import (
+    UserServiceRepository,
+)
+from src.infrastructure.memory.repositories.user_social_account import (
+    UserSocialAccountRepository,
+)
+from src.infrastructure.memory.storage import MEMORY, MemoryDatabase
+from src.infrastructure.metrics import UNIT_OF_WORK_OUTCOMES
+from src.tracing import traced
+from src.use_cases.interfaces.cache.unit_of_work import (
+    AbstractUnitOfWork as AbstractCacheUnitOfWork,
+)
+from src.use_cases.interfaces.database.unit_of_work import (
+    AbstractUnitOfWork as AbstractDatabaseUnitOfWork,
+)
+
+COMMITS = UNIT_OF_WORK_OUTCOMES.labels(MEMORY, 'commit')
+ROLLBACKS = UNIT_OF_WORK_OUTCOMES.labels(MEMORY, 'rollback')
+EXECUTIONS = UNIT_OF_WORK_OUTCOMES.labels(MEMORY, 'execute')
+DISCARDS = UNIT_OF_WORK_OUTCOMES.labels(MEMORY, 'discard')
+
+
+class DatabaseUnitOfWork(AbstractDatabaseUnitOfWork):
+    """Class for work with domain entities repositories in memory.
+
+        Changes are seen by other Units of Work after commit only,
+        conflicts with rows committed meanwhile fail the commit,
+        as unique indexes of PostgreSQL do. Row locks are not
+        emulated, the last commit of the same row wins.
+
+    Args:
+        AbstractDatabaseUnitOfWork (class): Abstract Unit of Work class.
+    """
+
+    def __init__(
+        self,
+        database: MemoryDatabase,
+        social_network_changes: Optional[SocialNetworkChanges] = None,
+    ) -> None:
+        """Init method.
+
+        Args:
+            database (MemoryDatabase): Tables of the process.
+            social_network_changes (SocialNetworkChanges, optional):
+            Notified after commit of Social Networks changes.
+        """
+        self._database = database
+        self._social_network_changes = social_network_changes
+
+    @traced(MEMORY)
+    async def __aenter__(self) -> DatabaseUnitOfWork:
+        """Call when entry in async context manager.
+
+            Read only scopes read the same tables, there are no replicas.
+
+        Returns:
+            DatabaseUnitOfWork: Return themself.
+        """
+        self._session = self._database.session()
+
+        self.user = UserRepository(self._session)
+        self.user_service = UserServiceRepository(self._session)
+        self.role = RoleRepository(self._session)
+        self.login_history = LoginHistoryRepository(self._session)
+        self.social_network = SocialNetworkRepository(self._session)
+        self.user_social_account = UserSocialAccountRepository(self._session)
+        return self
+
+    @traced(MEMORY)
+    async def _commit(self) -> None:
+        self._session.commit()
+        COMMITS.inc()
+        if self._social_network_changes and self.social_network.changed:
+            await self._social_network_changes.committed()
+
+    @traced(MEMORY)
+    async def _rollback(self) -> None:
+        self._session.rollback()
+        ROLLBACKS.inc()
+
+    async def _close(self) -> None:
+        # Changes left without commit are dropped, as on session close.
+        self._session.rollback()
+
+
+class CacheUnitOfWork(AbstractCacheUnitOfWork):
+    """Class for work with tokens repositories in memory.
+
+        Repositories of Redis queue commands to the in-memory pipeline,
+        so keys, values and responses are the same as with Redis.
+
+    Args:
+        AbstractCacheUnitOfWork (class): Abstract Unit of Work.
+    """
+
+    def __init__(
+        self,
+        cache: MemoryCache,
+        key_schema: KeySchema,
+        social_account_config: SocialAccountSettings,
+    ) -> None:
+        """Init method.
+
+        Args:
+            cache (MemoryCache): Cache of the process.
+            key_schema (KeySchema): Class with key schemas for Redis.
+            social_account_config (SocialAccountSettings):
+            Settings for Social Accounts cache.
+        """
+        self._cache = cache
+        self._key_schema = key_schema
+        self._social_account_config = social_account_config
+        self.responses: list[None] = []
+
+    async def __aenter__(self) -> CacheUnitOfWork:
+        """Call when entry in async context manager.
+
+        Returns:
+            CacheUnitOfWork: Return themself.
+        """
+        self._pipeline = MemoryPipeline(self._cache)
+
+        self.access_tokens = AccessTokenRepository(
+            self._pipeline, self._key_schema,
+        )
+        self.refresh_tokens = RefreshTokenRepository(
+            self._pipeline, self._key_schema,
+        )
+        self.social_accounts = SocialAccountRepository(
+            self._pipeline,
+            self._key_schema,
+            self._social_account_config.social_account_cache_ttl,
+        )
+        return self
+
+    @traced(MEMORY)
+    async def _execute(self) -> None:
+        self.responses = self._pipeline.execute()
+        EXECUTIONS.inc()
+
+    async def _discard(self) -> None:
+        self._pipeline.discard()
+        DISCARDS.inc()
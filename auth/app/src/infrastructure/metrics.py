@@ -0,0 +1,121 @@
+"""Module with Prometheus metrics of the service."""
+
+import functools
+import time
+
+import sqlalchemy as sa
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Under gunicorn every worker writes metrics to PROMETHEUS_MULTIPROC_DIR
+# and they are aggregated on scrape, see gunicorn.conf.py.
+
+# Latency of one call, from bcrypt and statements to whole requests.
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+
+REQUEST_LATENCY = Histogram(
+    'auth_http_request_duration_seconds',
+    'Time to serve HTTP request by route and status.',
+    ['method', 'route', 'status'],
+    buckets=LATENCY_BUCKETS,
+)
+OPERATION_LATENCY = Histogram(
+    'auth_operation_duration_seconds',
+    'Time spent in operation of the component.',
+    ['component', 'operation'],
+    buckets=LATENCY_BUCKETS,
+)
+UNIT_OF_WORK_OUTCOMES = Counter(
+    'auth_unit_of_work',
+    'Finished units of work by storage and outcome.',
+    ['storage', 'outcome'],
+)
+DB_POOL_CONNECTIONS = Gauge(
+    'auth_db_pool_connections',
+    'Open connections of the Database pool.',
+    ['pool'],
+    multiprocess_mode='livesum',
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    'auth_db_pool_checked_out',
+    'Connections of the Database pool in use.',
+    ['pool'],
+    multiprocess_mode='livesum',
+)
+CONCURRENCY_LIMIT = Gauge(
+    'auth_concurrency_limit',
+    'Current adaptive concurrency limit of the stage.',
+    ['stage'],
+    multiprocess_mode='liveall',
+)
+CONCURRENCY_IN_FLIGHT = Gauge(
+    'auth_concurrency_in_flight',
+    'Calls of the stage in progress.',
+    ['stage'],
+    multiprocess_mode='livesum',
+)
+CONCURRENCY_REJECTED = Counter(
+    'auth_concurrency_rejected',
+    'Calls rejected by the concurrency limit of the stage.',
+    ['stage'],
+)
+LOG_RECORDS_DROPPED = Counter(
+    'auth_log_records_dropped',
+    'Log records dropped because the logging queue was full.',
+)
+
+
+def timed(component: str):
+    """Observe latency of decorated coroutine method.
+
+        Operation label is the qualified name of the method.
+
+    Args:
+        component (str): Name of the component, e.g. postgresql.
+
+    Returns:
+        decorator: Decorator of the method.
+    """
+    def decorator(method):
+        observer = OPERATION_LATENCY.labels(component, method.__qualname__)
+
+        @functools.wraps(method)
+        async def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                observer.observe(time.perf_counter() - started)
+        return wrapper
+    return decorator
+
+
+def observe_pool(engine: AsyncEngine, pool: str) -> None:
+    """Report open and checked out connections of engine pool.
+
+    Args:
+        engine (AsyncEngine): SQLAlchemy engine.
+        pool (str): Name of the pool in metrics.
+    """
+    connections = DB_POOL_CONNECTIONS.labels(pool)
+    checked_out = DB_POOL_CHECKED_OUT.labels(pool)
+    sync_engine = engine.sync_engine
+    sa.event.listen(sync_engine, 'connect', lambda *_: connections.inc())
+    sa.event.listen(sync_engine, 'close', lambda *_: connections.dec())
+    sa.event.listen(sync_engine, 'checkout', lambda *_: checked_out.inc())
+    sa.event.listen(sync_engine, 'checkin', lambda *_: checked_out.dec())
@@ -2,31 +2,40 @@
 
 import uuid
 from datetime import UTC, datetime
+from functools import partial
 
 import sqlalchemy as sa
 from sqlalchemy.orm import Mapped, mapped_column
+from src.domain.base import uuid7
 
 
 class IDMixin:
-    """Mixin with UUID Primary key."""
+    """Mixin with UUID Primary key.
+
+    Keys are time-ordered UUIDv7, stored in the same UUID column as
+    random UUIDv4 keys of existing rows.
+    """
 
     id: Mapped[uuid.UUID] = mapped_column(
-        sa.UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+        sa.UUID(as_uuid=True), primary_key=True, default=uuid7,
     )
 
 
+utc_now = partial(datetime.now, UTC)
+
+
 class TimestampMixin:
     """Mixin with Timestamp columns."""
 
     created_at: Mapped[datetime] = mapped_column(
         sa.DateTime(True),
-        default=datetime.now(UTC),
+        default=utc_now,
         server_default=sa.func.now(),
     )
     updated_at: Mapped[datetime] = mapped_column(
         sa.DateTime(True),
-        default=datetime.now(UTC),
+        default=utc_now,
         server_default=sa.func.now(),
-        onupdate=datetime.now(UTC),
+        onupdate=utc_now,
         server_onupdate=sa.FetchedValue(),
     )
@@ -1,13 +1,13 @@
 """Module with SQLAlchemy models."""
 
 import uuid
-from datetime import date
+from datetime import date, datetime
 
 import sqlalchemy as sa
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from src.config import PostgreSQLSettings
 from src.domain.role.value_objects import AccessLevel
-from src.infrastructure.mixins import IDMixin, TimestampMixin
+from src.infrastructure.mixins import IDMixin, TimestampMixin, utc_now
 
 metadata = sa.MetaData(schema=PostgreSQLSettings().db_schema)
 
@@ -50,7 +50,7 @@ class UserService(IDMixin, TimestampMixin, Base):
     __tablename__ = 'user_service'
 
     role_id: Mapped[uuid.UUID] = mapped_column(
-        sa.ForeignKey('role.id', ondelete='SET NULL'),
+        sa.ForeignKey('role.id', ondelete='SET NULL'), index=True,
     )
     active: Mapped[bool] = mapped_column(default=True)
     verified: Mapped[bool] = mapped_column(default=False)
@@ -79,7 +79,7 @@ class User(IDMixin, TimestampMixin, Base):
     login: Mapped[str] = mapped_column(sa.String(60), unique=True)
     password: Mapped[str] = mapped_column(sa.String(100))
     user_service_id: Mapped[uuid.UUID] = mapped_column(
-        sa.ForeignKey('user_service.id', ondelete='CASCADE'),
+        sa.ForeignKey('user_service.id', ondelete='CASCADE'), index=True,
     )
     full_name: Mapped[str] = mapped_column(sa.String(60), nullable=True)
     profile_picture: Mapped[str] = mapped_column(sa.Text, nullable=True)
@@ -96,9 +96,22 @@ class User(IDMixin, TimestampMixin, Base):
     )
 
 
+# Emails are compared case-insensitively, see UserRepository.
+sa.Index('uq_user_email_lower', sa.func.lower(User.email), unique=True)
+
+
+social_network_version = sa.Sequence(
+    'social_network_version_seq', metadata=metadata,
+)
+
+
 class SocialNetwork(IDMixin, TimestampMixin, Base):
     """Social Network model.
 
+        version takes the next value of sequence on every insert and
+        update by trigger, processes reload their catalogs when it
+        differs.
+
     Args:
         IDMixin (class): UUID ID Mixin.
         TimestampMixin (class): TimeStamp Mixin.
@@ -109,6 +122,10 @@ class SocialNetwork(IDMixin, TimestampMixin, Base):
 
     picture: Mapped[str] = mapped_column(sa.Text, nullable=True)
     name: Mapped[str] = mapped_column(sa.String(24), unique=True)
+    version: Mapped[int] = mapped_column(
+        sa.BigInteger,
+        server_default=social_network_version.next_value(),
+    )
 
     login_history: Mapped[list['LoginHistory']] = relationship(
         back_populates='social_network',
@@ -128,12 +145,20 @@ class UserSocialAccount(IDMixin, TimestampMixin, Base):
     """
 
     __tablename__ = 'user_social_account'
+    __table_args__ = (
+        sa.Index(
+            'uq_user_social_account_social_network_id_social_account_id',
+            'social_network_id',
+            'social_account_id',
+            unique=True,
+        ),
+    )
 
     social_network_id: Mapped[uuid.UUID] = mapped_column(
         sa.ForeignKey('social_network.id', ondelete='CASCADE'),
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
-        sa.ForeignKey('user.id', ondelete='CASCADE'),
+        sa.ForeignKey('user.id', ondelete='CASCADE'), index=True,
     )
     social_account_id: Mapped[str]
 
@@ -146,6 +171,9 @@ class UserSocialAccount(IDMixin, TimestampMixin, Base):
 class LoginHistory(IDMixin, TimestampMixin, Base):
     """Login History model.
 
+        Table is partitioned by month on created_at,
+        so created_at is a part of the primary key.
+
     Args:
         IDMixin (class): UUID ID Mixin.
         TimestampMixin (class): TimeStamp Mixin.
@@ -153,6 +181,22 @@ class LoginHistory(IDMixin, TimestampMixin, Base):
     """
 
     __tablename__ = 'login_history'
+    __table_args__ = (
+        sa.Index(
+            'ix_login_history_user_id_created_at_id',
+            'user_id',
+            sa.text('created_at DESC'),
+            sa.text('id DESC'),
+        ),
+        {'postgresql_partition_by': 'RANGE (created_at)'},
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(True),
+        primary_key=True,
+        default=utc_now,
+        server_default=sa.func.now(),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(
         sa.ForeignKey('user.id', ondelete='CASCADE'),
@@ -166,3 +210,23 @@ class LoginHistory(IDMixin, TimestampMixin, Base):
     social_network: Mapped['SocialNetwork'] = relationship(
         back_populates='login_history',
     )
+
+
+class UserImportCheckpoint(TimestampMixin, Base):
+    """Progress of bulk user import, see src.commands.import_users.
+
+        Saved in the same transaction as each imported batch,
+        records is the number of source records already processed.
+
+    Args:
+        TimestampMixin (class): TimeStamp Mixin.
+        Base (class): Base Declarative class.
+    """
+
+    __tablename__ = 'user_import_checkpoint'
+
+    source: Mapped[str] = mapped_column(sa.Text, primary_key=True)
+    records: Mapped[int] = mapped_column(sa.BigInteger, default=0)
+    imported: Mapped[int] = mapped_column(sa.BigInteger, default=0)
+    conflicts: Mapped[int] = mapped_column(sa.BigInteger, default=0)
+    rejected: Mapped[int] = mapped_column(sa.BigInteger, default=0)
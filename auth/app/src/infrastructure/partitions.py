@@ -0,0 +1,258 @@
+"""Module with maintenance of Login History partitions."""
+
+import logging
+import re
+from datetime import UTC, date, datetime, time
+from typing import Optional
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = 'login_history'
+DEFAULT_PARTITION = 'login_history_default'
+MOVED_TABLE = 'login_history_moved'
+PARTITION_NAME = re.compile(r'^login_history_(\d{4})_(\d{2})$')
+MONTHS_IN_YEAR = 12
+PARTITIONS_QUERY = """
+    SELECT child.relname FROM pg_inherits
+    JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+    JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+    JOIN pg_namespace ON pg_namespace.oid = parent.relnamespace
+    WHERE parent.relname = :parent AND pg_namespace.nspname = :schema
+"""
+DETACHED_QUERY = """
+    SELECT relname FROM pg_class
+    JOIN pg_namespace ON pg_namespace.oid = pg_class.relnamespace
+    WHERE pg_class.relkind = 'r' AND NOT pg_class.relispartition
+    AND pg_class.relname LIKE :pattern AND pg_namespace.nspname = :schema
+"""
+# Rows of the month are kept aside while the partition is created,
+# the DEFAULT partition must hold no rows of it.
+MOVED_QUERY = 'CREATE TEMPORARY TABLE {moved} (LIKE {parent})'
+MOVE_QUERY = """
+    WITH moved AS (
+        DELETE FROM {default}
+        WHERE created_at >= :start AND created_at < :end
+        RETURNING *
+    )
+    INSERT INTO {moved} SELECT * FROM moved
+"""
+CREATE_QUERY = """
+    CREATE TABLE {partition} PARTITION OF {parent}
+    FOR VALUES FROM ('{start}') TO ('{end}')
+"""
+RESTORE_QUERY = 'INSERT INTO {partition} SELECT * FROM {moved}'
+DROP_QUERY = 'DROP TABLE {table}'
+
+
+def add_months(month_start: date, months: int) -> date:
+    """Shift first day of month by number of months.
+
+    Args:
+        month_start (date): First day of month.
+        months (int): Number of months, may be negative.
+
+    Returns:
+        date: First day of shifted month.
+    """
+    month_index = month_start.year * MONTHS_IN_YEAR + month_start.month - 1
+    month_index += months
+    return date(
+        month_index // MONTHS_IN_YEAR, month_index % MONTHS_IN_YEAR + 1, 1,
+    )
+
+
+def partition_month(name: str) -> Optional[date]:
+    """Return month of partition by its name.
+
+    Args:
+        name (str): Name of table.
+
+    Returns:
+        Optional[date]: First day of month, None if not a monthly partition.
+    """
+    match = PARTITION_NAME.match(name)
+    if not match:
+        return None
+    year, month = match.groups()
+    return date(int(year), int(month), 1)
+
+
+class LoginHistoryPartitionManager:  # noqa: WPS306 (Without Base class.)
+    """Create future and detach expired monthly login history partitions.
+
+    Partitions are named login_history_YYYY_MM and hold rows with
+    created_at in [first day of month, first day of next month) UTC.
+    Rows outside of them are caught by the DEFAULT partition.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        schema: str,
+    ) -> None:
+        """Init method.
+
+        Args:
+            session_factory (async_sessionmaker[AsyncSession]):
+            Factory for create sessions.
+            schema (str): Database schema with login_history table.
+        """
+        self._session_factory = session_factory
+        self._schema = schema
+
+    async def create_partitions(self, months_ahead: int) -> list[str]:
+        """Create partitions from current month to months ahead.
+
+            Rows of the month caught by the DEFAULT partition are moved
+            to the created partition, otherwise creating it fails.
+
+        Args:
+            months_ahead (int): Number of months after the current one.
+
+        Returns:
+            list[str]: Names of created partitions.
+        """
+        current_month = datetime.now(UTC).date().replace(day=1)
+        created: list[str] = []
+        async with self._session_factory() as session:
+            existing = await self._partitions(session)
+            for shift in range(months_ahead + 1):
+                month_start = add_months(current_month, shift)
+                name = self._partition_name(month_start)
+                if name in existing:
+                    continue
+                await self._create_partition(session, name, month_start)
+                created.append(name)
+            await session.commit()
+        return created
+
+    async def expire_partitions(
+        self, retention_months: int, drop: bool,
+    ) -> list[str]:
+        """Detach partitions older than retention period.
+
+            Detached partitions can be archived before dropping. With
+            drop, expired tables detached by earlier runs are dropped
+            as well.
+
+        Args:
+            retention_months (int): Number of months to keep.
+            drop (bool): Drop detached partitions.
+
+        Returns:
+            list[str]: Names of expired partitions.
+        """
+        cutoff = add_months(
+            datetime.now(UTC).date().replace(day=1), -retention_months,
+        )
+        expired: list[str] = []
+        async with self._session_factory() as session:
+            attached = await self._partitions(session)
+            candidates = set(attached)
+            if drop:
+                candidates |= await self._detached(session)
+            for name in sorted(candidates):
+                month_start = partition_month(name)
+                if not month_start or month_start >= cutoff:
+                    continue
+                await self._expire_partition(
+                    session, name, detach=name in attached, drop=drop,
+                )
+                expired.append(name)
+            await session.commit()
+        return expired
+
+    async def _partitions(self, session: AsyncSession) -> set[str]:
+        """Retrieve names of attached partitions.
+
+        Args:
+            session (AsyncSession): SQLAlchemy session to Database.
+
+        Returns:
+            set[str]: Names of partitions.
+        """
+        res = await session.execute(
+            sa.text(PARTITIONS_QUERY),
+            {'parent': PARENT_TABLE, 'schema': self._schema},
+        )
+        return set(res.scalars().all())
+
+    async def _detached(self, session: AsyncSession) -> set[str]:
+        """Retrieve names of tables left by detaching partitions.
+
+        Args:
+            session (AsyncSession): SQLAlchemy session to Database.
+
+        Returns:
+            set[str]: Names of tables, not attached to any parent.
+        """
+        res = await session.execute(
+            sa.text(DETACHED_QUERY),
+            {
+                'pattern': r'{0}\_%'.format(PARENT_TABLE),
+                'schema': self._schema,
+            },
+        )
+        return set(res.scalars().all())
+
+    async def _create_partition(
+        self, session: AsyncSession, name: str, month_start: date,
+    ) -> None:
+        """Create partition, moving its rows out of the DEFAULT partition.
+
+        Args:
+            session (AsyncSession): SQLAlchemy session to Database.
+            name (str): Name of the partition.
+            month_start (date): First day of month of the partition.
+        """
+        tables = {
+            'parent': self._qualified(PARENT_TABLE),
+            'default': self._qualified(DEFAULT_PARTITION),
+            'partition': self._qualified(name),
+            'moved': MOVED_TABLE,
+        }
+        bounds = {
+            'start': datetime.combine(month_start, time(), UTC),
+            'end': datetime.combine(add_months(month_start, 1), time(), UTC),
+        }
+        await session.execute(sa.text(MOVED_QUERY.format(**tables)))
+        await session.execute(sa.text(MOVE_QUERY.format(**tables)), bounds)
+        await session.execute(sa.text(
+            CREATE_QUERY.format(**tables, **bounds),
+        ))
+        await session.execute(sa.text(RESTORE_QUERY.format(**tables)))
+        await session.execute(sa.text(DROP_QUERY.format(table=MOVED_TABLE)))
+
+    async def _expire_partition(
+        self, session: AsyncSession, name: str, detach: bool, drop: bool,
+    ) -> None:
+        """Detach partition, drop it as well if asked.
+
+        Args:
+            session (AsyncSession): SQLAlchemy session to Database.
+            name (str): Name of the partition.
+            detach (bool): Partition is still attached.
+            drop (bool): Drop detached partition.
+        """
+        if detach:
+            await session.execute(sa.text(
+                'ALTER TABLE {parent} DETACH PARTITION {partition}'.format(
+                    parent=self._qualified(PARENT_TABLE),
+                    partition=self._qualified(name),
+                ),
+            ))
+        if drop:
+            await session.execute(sa.text(
+                DROP_QUERY.format(table=self._qualified(name)),
+            ))
+
+    def _partition_name(self, month_start: date) -> str:
+        return '{parent}_{month}'.format(
+            parent=PARENT_TABLE, month=month_start.strftime('%Y_%m'),
+        )
+
+    def _qualified(self, table: str) -> str:
+        return '"{schema}"."{table}"'.format(schema=self._schema, table=table)
@@ -1,36 +1,30 @@
 """Module with LoginHistoryRepository."""
 
-import logging
 import uuid
+from datetime import datetime
 from typing import Any, Optional
 
-import backoff
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import noload, selectinload
 from sqlalchemy.sql.selectable import Select
 from src.domain.login_history.dto import LoginHistoryDTO
 from src.domain.login_history.entities import LoginHistory
 from src.domain.login_history.exceptions import LoginEntryNotFound
+from src.domain.login_history.value_objects import LoginHistoryCursor
 from src.domain.repositories.login_history.repo import ILoginHistoryRepository
 from src.domain.social_network.dto import SocialNetworkDTO
 from src.domain.social_network.entities import SocialNetwork
+from src.infrastructure.metrics import timed
 from src.infrastructure.models import LoginHistory as LoginHistoryORM
 from src.infrastructure.repositories.base import decorate_all_methods
+from src.infrastructure.resilience import POSTGRESQL, resilient
+from src.tracing import traced
 
-logger = logging.getLogger(__name__)
 
-
-@decorate_all_methods(
-    backoff.on_exception,
-    wait_gen=backoff.expo,
-    exception=TimeoutError,
-    max_time=10,
-    max_tries=3,
-    logger=logger,
-    backoff_log_level=logging.WARNING,
-    giveup_log_level=logging.CRITICAL,
-)
+@decorate_all_methods(traced, POSTGRESQL)
+@decorate_all_methods(timed, POSTGRESQL)
+@decorate_all_methods(resilient, POSTGRESQL)
 class LoginHistoryRepository(ILoginHistoryRepository):
     """Repository with login entries objects.
 
@@ -79,11 +73,49 @@ class LoginHistoryRepository(ILoginHistoryRepository):
             social_network=entity.social_network,
         )
 
-    async def retrieve_by_id(self, login_entry_id: uuid.UUID) -> LoginHistory:
+    async def insert_many(self, entities: list[LoginHistory]) -> None:
+        """Add a batch of login entries.
+
+        Rows are sent as one executemany round trip, identifiers and
+        timestamps are taken from the entities, so they reflect the moment
+        of login and not the moment of flush. COPY on the driver
+        connection would run in the session transaction as well, as in
+        the user import, but for batches of hundreds of rows the single
+        round trip of executemany is close to it and needs no raw
+        connection.
+
+        Args:
+            entities (list[LoginHistory]): entities of LoginHistory class.
+        """
+        if not entities:
+            return
+        rows = []
+        for entity in entities:
+            dumped_login_history = entity.__dict__
+            rows.append({
+                'id': dumped_login_history['id'],
+                'user_id': dumped_login_history['_user_id'],
+                'user_agent': dumped_login_history['_user_agent'],
+                'social_network_id': (
+                    dumped_login_history['_social_network_id']
+                ),
+                'created_at': dumped_login_history['_created_at'],
+                'updated_at': dumped_login_history['_updated_at'],
+            })
+        await self._session.execute(sa.Insert(LoginHistoryORM), rows)
+
+    async def retrieve_by_id(
+        self,
+        login_entry_id: uuid.UUID,
+        created_at: Optional[datetime] = None,
+    ) -> LoginHistory:
         """Retrieve login entry by ID.
 
+            Without created_at every partition is searched.
+
         Args:
             login_entry_id (uuid.UUID): Login entry UUID.
+            created_at (datetime, optional): Login entry creation time.
 
         Raises:
             LoginEntryNotFound: If login entry not found.
@@ -96,31 +128,23 @@ class LoginHistoryRepository(ILoginHistoryRepository):
         ).options(
             selectinload(LoginHistoryORM.social_network),
         )
+        if created_at:
+            stmt = stmt.where(LoginHistoryORM.created_at == created_at)
         res = await self._session.execute(stmt)
         fetch = res.one_or_none()
         if not fetch:
             raise LoginEntryNotFound
-        record: LoginHistoryORM = fetch[0]
-
-        social_network_entity: Optional[SocialNetwork] = None
-        if record.social_network:
-            social_network_entity = SocialNetwork(
-                SocialNetworkDTO(
-                    **record.social_network.__dict__,
-                ),
-            )
-        return LoginHistory(
-            LoginHistoryDTO(
-                **record.__dict__,
-            ),
-            social_network=social_network_entity,
-        )
+        return self._to_entity(fetch[0])
 
-    async def retrieve_by_user_id(self, uid: uuid.UUID) -> list[LoginHistory]:
+    async def retrieve_by_user_id(
+        self, uid: uuid.UUID, since: Optional[datetime] = None,
+    ) -> list[LoginHistory]:
         """Retrieve all login entries by user id.
 
         Args:
             uid (uuid.UUID): User UUID.
+            since (datetime, optional):
+            Lower bound of creation time, partitions before it are pruned.
 
         Raises:
             LoginEntryNotFound: If no one login entry was found.
@@ -133,25 +157,67 @@ class LoginHistoryRepository(ILoginHistoryRepository):
         ).options(
             selectinload(LoginHistoryORM.social_network),
         )
+        if since:
+            stmt = stmt.where(LoginHistoryORM.created_at >= since)
         res = await self._session.execute(stmt)
-        fetch = res.fetchall()
+        fetch = res.scalars().all()
         if not fetch:
             raise LoginEntryNotFound
+        return [self._to_entity(entry) for entry in fetch]
+
+    async def retrieve_page_by_user_id(
+        self,
+        uid: uuid.UUID,
+        limit: int,
+        cursor: Optional[LoginHistoryCursor] = None,
+    ) -> list[LoginHistory]:
+        """Retrieve page of user login entries, newest first.
+
+            Keyset pagination on (created_at, id), each page is a range scan
+            of (user_id, created_at, id) index, whatever the page number or
+            number of user entries. Bound on created_at alone is redundant
+            for the result, but lets planner prune newer partitions.
+            Social networks are not loaded, they are resolved by id
+            from the process-local catalog.
 
-        records: list[LoginHistory] = []
-        for entry in fetch[0]:
-            social_network_entity: Optional[SocialNetwork] = None
-            if entry.social_network:
-                social_network_entity = SocialNetwork(
-                    SocialNetworkDTO(
-                        **entry.social_network.__dict__,
-                    ),
-                )
-            entity = LoginHistory(
-                LoginHistoryDTO(
-                    **entry.__dict__,
+        Args:
+            uid (uuid.UUID): User UUID.
+            limit (int): Maximum number of entries.
+            cursor (LoginHistoryCursor, optional):
+            Position of the last entry of the previous page.
+
+        Returns:
+            list[LoginHistory]: Login entries, may be empty.
+        """
+        stmt: Select[Any] = sa.Select(LoginHistoryORM).where(
+            LoginHistoryORM.user_id == uid,
+        ).order_by(
+            LoginHistoryORM.created_at.desc(),
+            LoginHistoryORM.id.desc(),
+        ).limit(limit).options(
+            noload(LoginHistoryORM.social_network),
+        )
+        if cursor:
+            stmt = stmt.where(
+                LoginHistoryORM.created_at <= cursor.created_at,
+                sa.tuple_(
+                    LoginHistoryORM.created_at, LoginHistoryORM.id,
+                ) < sa.tuple_(cursor.created_at, cursor.id),
+            )
+        res = await self._session.execute(stmt)
+        return [self._to_entity(entry) for entry in res.scalars().all()]
+
+    def _to_entity(self, record: LoginHistoryORM) -> LoginHistory:
+        social_network_entity: Optional[SocialNetwork] = None
+        if record.social_network:
+            social_network_entity = SocialNetwork(
+                SocialNetworkDTO(
+                    **record.social_network.__dict__,
                 ),
-                social_network=social_network_entity,
             )
-            records.append(entity)
-        return records
+        return LoginHistory(
+            LoginHistoryDTO(
+                **record.__dict__,
+            ),
+            social_network=social_network_entity,
+        )
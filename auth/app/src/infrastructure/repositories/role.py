@@ -1,12 +1,10 @@
 """Module with Role Repository."""
 
-import logging
 import uuid
 from typing import Any
 
-import backoff
 import sqlalchemy as sa
-from sqlalchemy.exc import IntegrityError, TimeoutError
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.selectable import Select
 from src.config import UserSettings
@@ -19,22 +17,16 @@ from src.domain.repositories.role.repo import IRoleRepository
 from src.domain.role.dto import RoleDTO
 from src.domain.role.entities import Role
 from src.domain.role.value_objects import AccessLevel
+from src.infrastructure.metrics import timed
 from src.infrastructure.models import Role as RoleORM
 from src.infrastructure.repositories.base import decorate_all_methods
+from src.infrastructure.resilience import POSTGRESQL, resilient
+from src.tracing import traced
 
-logger = logging.getLogger(__name__)
 
-
-@decorate_all_methods(
-    backoff.on_exception,
-    wait_gen=backoff.expo,
-    exception=TimeoutError,
-    max_time=10,
-    max_tries=3,
-    logger=logger,
-    backoff_log_level=logging.WARNING,
-    giveup_log_level=logging.CRITICAL,
-)
+@decorate_all_methods(traced, POSTGRESQL)
+@decorate_all_methods(timed, POSTGRESQL)
+@decorate_all_methods(resilient, POSTGRESQL)
 class RoleRepository(IRoleRepository):
     """Implemented repository with Role objects.
 
@@ -1,11 +1,9 @@
 """Module with Social Network repository."""
 
-import logging
 import uuid
 from pathlib import Path
 from typing import Any
 
-import backoff
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.selectable import Select
@@ -15,22 +13,16 @@ from src.domain.repositories.social_network.repo import (
 from src.domain.social_network.dto import SocialNetworkDTO
 from src.domain.social_network.entities import SocialNetwork
 from src.domain.social_network.exceptions import SocialNetworkNotFound
+from src.infrastructure.metrics import timed
 from src.infrastructure.models import SocialNetwork as SocialNetworkORM
 from src.infrastructure.repositories.base import decorate_all_methods
+from src.infrastructure.resilience import POSTGRESQL, resilient
+from src.tracing import traced
 
-logger = logging.getLogger(__name__)
 
-
-@decorate_all_methods(
-    backoff.on_exception,
-    wait_gen=backoff.expo,
-    exception=TimeoutError,
-    max_time=10,
-    max_tries=3,
-    logger=logger,
-    backoff_log_level=logging.WARNING,
-    giveup_log_level=logging.CRITICAL,
-)
+@decorate_all_methods(traced, POSTGRESQL)
+@decorate_all_methods(timed, POSTGRESQL)
+@decorate_all_methods(resilient, POSTGRESQL)
 class SocialNetworkRepository(ISocialNetworkRepository):
     """Repository with social network objects.
 
@@ -45,6 +37,7 @@ class SocialNetworkRepository(ISocialNetworkRepository):
             session (AsyncSession): SQLAlchemy session to Database.
         """
         self._session = session
+        self.changed = False
 
     async def insert(self, entity: SocialNetwork) -> SocialNetwork:
         """Add a new social network.
@@ -71,6 +64,7 @@ class SocialNetworkRepository(ISocialNetworkRepository):
         )
         res = await self._session.execute(stmt)
         fetch = res.one()
+        self.changed = True
         return SocialNetwork(
             SocialNetworkDTO(
                 id=fetch[0],
@@ -115,6 +109,35 @@ class SocialNetworkRepository(ISocialNetworkRepository):
         )
         return await self._retrieve_data(stmt)
 
+    async def retrieve_all(self) -> list[SocialNetwork]:
+        """Retrieve all social networks.
+
+        Returns:
+            list[SocialNetwork]: Social networks ordered by name.
+        """
+        stmt: Select[Any] = sa.Select(SocialNetworkORM).order_by(
+            SocialNetworkORM.name,
+        )
+        res = await self._session.execute(stmt)
+        return [
+            SocialNetwork(SocialNetworkDTO(**record.__dict__))
+            for record in res.scalars().all()
+        ]
+
+    async def retrieve_version(self) -> tuple[int, int]:
+        """Retrieve version of social networks.
+
+        Returns:
+            tuple[int, int]: Greatest row version and number of rows.
+        """
+        stmt: Select[Any] = sa.Select(
+            sa.func.coalesce(sa.func.max(SocialNetworkORM.version), 0),
+            sa.func.count(),
+        ).select_from(SocialNetworkORM)
+        res = await self._session.execute(stmt)
+        fetch = res.one()
+        return fetch[0], fetch[1]
+
     async def change_picture(
         self, social_network_id: uuid.UUID, picture_file_path: Path,
     ) -> SocialNetwork:
@@ -145,6 +168,7 @@ class SocialNetworkRepository(ISocialNetworkRepository):
         fetch = res.one_or_none()
         if not fetch:
             raise SocialNetworkNotFound
+        self.changed = True
         return SocialNetwork(
             SocialNetworkDTO(
                 id=fetch[0],
@@ -1,11 +1,9 @@
 """Module with User Repository."""
 
-import logging
 import uuid
 from pathlib import Path
 from typing import Any
 
-import backoff
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -19,23 +17,17 @@ from src.domain.user.entities import User
 from src.domain.user.value_objects import UserAdditionalFields
 from src.domain.user_service.dto import UserServiceDTO
 from src.domain.user_service.entities import UserService
+from src.infrastructure.metrics import timed
 from src.infrastructure.models import User as UserORM
 from src.infrastructure.models import UserService as UserServiceORM
 from src.infrastructure.repositories.base import decorate_all_methods
+from src.infrastructure.resilience import POSTGRESQL, resilient
+from src.tracing import traced
 
-logger = logging.getLogger(__name__)
 
-
-@decorate_all_methods(
-    backoff.on_exception,
-    wait_gen=backoff.expo,
-    exception=TimeoutError,
-    max_time=10,
-    max_tries=3,
-    logger=logger,
-    backoff_log_level=logging.WARNING,
-    giveup_log_level=logging.CRITICAL,
-)
+@decorate_all_methods(traced, POSTGRESQL)
+@decorate_all_methods(timed, POSTGRESQL)
+@decorate_all_methods(resilient, POSTGRESQL)
 class UserRepository(IUserRepository):  # noqa: WPS214 (Too many methods.)
     """Implement Repository with User objects."""
 
@@ -117,7 +109,7 @@ class UserRepository(IUserRepository):  # noqa: WPS214 (Too many methods.)
         return await self._retrieve_data(stmt)
 
     async def retrieve_by_email(self, email: str) -> User:
-        """Retrieve User by that email.
+        """Retrieve User by that email, case-insensitive.
 
         Args:
             email (str): Electronic mail.
@@ -126,7 +118,7 @@ class UserRepository(IUserRepository):  # noqa: WPS214 (Too many methods.)
             User: Retrieved User.
         """
         stmt: Select[Any] = sa.Select(UserORM).where(
-            UserORM.email == email,
+            sa.func.lower(UserORM.email) == email.lower(),
         )
         return await self._retrieve_data(stmt)
 
@@ -154,9 +146,13 @@ class UserRepository(IUserRepository):  # noqa: WPS214 (Too many methods.)
         Returns:
             User: Retrieved user.
         """
+        # Email of one user and login of another match both of them.
         stmt: Select[Any] = sa.Select(UserORM).where(
-            sa.or_(UserORM.email == email, UserORM.login == login),
-        )
+            sa.or_(
+                sa.func.lower(UserORM.email) == email.lower(),
+                UserORM.login == login,
+            ),
+        ).limit(1)
         return await self._retrieve_data(stmt)
 
     async def change_email(self, uid: uuid.UUID, email: str) -> User:
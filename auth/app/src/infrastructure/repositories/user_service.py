@@ -1,11 +1,10 @@
 """Module with User Service repository."""
 
-import logging
 import uuid
 from typing import Any
 
-import backoff
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlalchemy.sql.selectable import Select
@@ -15,23 +14,18 @@ from src.domain.role.dto import RoleDTO
 from src.domain.role.entities import Role
 from src.domain.user_service.dto import UserServiceDTO
 from src.domain.user_service.entities import UserService
+from src.infrastructure.metrics import timed
 from src.infrastructure.models import Role as RoleORM
+from src.infrastructure.models import User as UserORM
 from src.infrastructure.models import UserService as UserServiceORM
 from src.infrastructure.repositories.base import decorate_all_methods
+from src.infrastructure.resilience import POSTGRESQL, resilient
+from src.tracing import traced
 
-logger = logging.getLogger(__name__)
 
-
-@decorate_all_methods(
-    backoff.on_exception,
-    wait_gen=backoff.expo,
-    exception=TimeoutError,
-    max_time=10,
-    max_tries=3,
-    logger=logger,
-    backoff_log_level=logging.WARNING,
-    giveup_log_level=logging.CRITICAL,
-)
+@decorate_all_methods(traced, POSTGRESQL)
+@decorate_all_methods(timed, POSTGRESQL)
+@decorate_all_methods(resilient, POSTGRESQL)
 class UserServiceRepository(IUserServiceRepository):
     """Implement Repository with user service objects.
 
@@ -200,6 +194,47 @@ class UserServiceRepository(IUserServiceRepository):
             role=role,
         )
 
+    async def update_role_by_user_ids(
+        self, user_ids: list[uuid.UUID], role: Role,
+    ) -> list[uuid.UUID]:
+        """Update role of many users in one statement.
+
+            IDs are passed as one array parameter and joined with unnest,
+            so statement text does not depend on number of users.
+            Users which already have the role are not updated and locked.
+
+        Args:
+            user_ids (list[uuid.UUID]): Users UUID IDs.
+            role (Role): New role for update.
+
+        Returns:
+            list[uuid.UUID]: IDs of users whose role was changed.
+        """
+        ids = sa.func.unnest(
+            sa.literal(user_ids, postgresql.ARRAY(sa.UUID)),
+        ).table_valued('id').render_derived(name='ids')
+        # Core tables, ORM bulk update can not return columns of FROM.
+        user_service = UserServiceORM.__table__
+        user = UserORM.__table__
+        # Targets are resolved first from the array, whatever statistics
+        # of role_id say, they are stale right after the previous flip.
+        targets = sa.Select(
+            user.c.id, user.c.user_service_id,
+        ).join_from(
+            ids, user, user.c.id == ids.c.id,
+        ).cte('targets').prefix_with('MATERIALIZED')
+        stmt = sa.Update(user_service).where(
+            user_service.c.id == targets.c.user_service_id,
+            user_service.c.role_id.is_distinct_from(role.id),
+        ).values(
+            role_id=role.id,
+            updated_at=sa.func.now(),
+        ).returning(
+            targets.c.id,
+        )
+        res = await self._session.execute(stmt)
+        return list(res.scalars().all())
+
     async def _retrieve_one(self, stmt: Select[Any]) -> UserService:
         """Retrieve User Service by some statement.
 
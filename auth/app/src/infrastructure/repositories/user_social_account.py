@@ -1,10 +1,8 @@
 """Module with User social account."""
 
-import logging
 import uuid
 from typing import Any
 
-import backoff
 import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.selectable import Select
@@ -14,22 +12,16 @@ from src.domain.repositories.user_social_account.repo import (
 from src.domain.user_social_account.dto import UserSocialAccountDTO
 from src.domain.user_social_account.entities import UserSocialAccount
 from src.domain.user_social_account.exceptions import UserSocialAccountNotFound
+from src.infrastructure.metrics import timed
 from src.infrastructure.models import UserSocialAccount as UserSocialAccountORM
 from src.infrastructure.repositories.base import decorate_all_methods
+from src.infrastructure.resilience import POSTGRESQL, resilient
+from src.tracing import traced
 
-logger = logging.getLogger(__name__)
 
-
-@decorate_all_methods(
-    backoff.on_exception,
-    wait_gen=backoff.expo,
-    exception=TimeoutError,
-    max_time=10,
-    max_tries=3,
-    logger=logger,
-    backoff_log_level=logging.WARNING,
-    giveup_log_level=logging.CRITICAL,
-)
+@decorate_all_methods(traced, POSTGRESQL)
+@decorate_all_methods(timed, POSTGRESQL)
+@decorate_all_methods(resilient, POSTGRESQL)
 class UserSocialAccountRepository(IUserSocialAccountRepository):
     """Repository with users social accounts objects.
 
@@ -56,6 +48,7 @@ class UserSocialAccountRepository(IUserSocialAccountRepository):
         """
         dumped_user_social_account = entity.__dict__
         stmt = sa.Insert(UserSocialAccountORM).values(
+            id=dumped_user_social_account['id'],
             social_network_id=dumped_user_social_account['_social_network_id'],
             user_id=dumped_user_social_account['_user_id'],
             social_account_id=dumped_user_social_account['_social_account_id'],
@@ -157,6 +150,27 @@ class UserSocialAccountRepository(IUserSocialAccountRepository):
         )
         return await self._retrieve_all(stmt)
 
+    async def retrieve_by_social_account(
+        self, social_network_id: uuid.UUID, social_account_id: str,
+    ) -> UserSocialAccount:
+        """Retrieve user social account by identifier in social network.
+
+            Served by unique (social_network_id, social_account_id) index,
+            the key which OAuth callback has.
+
+        Args:
+            social_network_id (uuid.UUID): Social network ID.
+            social_account_id (str): Account identifier in social network.
+
+        Returns:
+            UserSocialAccount: Retrieved record.
+        """
+        stmt: Select[Any] = sa.Select(UserSocialAccountORM).where(
+            UserSocialAccountORM.social_network_id == social_network_id,
+            UserSocialAccountORM.social_account_id == social_account_id,
+        )
+        return await self._retrieve_one(stmt)
+
     async def _retrieve_one(self, stmt: Select[Any]) -> UserSocialAccount:
         """Retrieve one record by some statement.
 
@@ -0,0 +1,366 @@
+"""Module with resilience policies of Database and Cache calls."""
+
+import asyncio
+import functools
+import logging
+import random
+import time
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from redis import exceptions as redis_exceptions
+from sqlalchemy import exc as sa_exceptions
+from src.config import ResilienceSettings
+from src.use_cases.exceptions import DependencyUnavailable
+
+logger = logging.getLogger(__name__)
+
+POSTGRESQL = 'postgresql'
+REDIS = 'redis'
+# Only methods with these prefixes are retried, others may write.
+IDEMPOTENT_PREFIXES = ('retrieve',)
+
+ReturnType = TypeVar('ReturnType')
+Reset = Callable[[], Awaitable[None]]
+
+
+def is_postgresql_transient(exc: BaseException) -> bool:
+    """Check exception means PostgreSQL is unreachable or overloaded.
+
+    Args:
+        exc (BaseException): Raised exception.
+
+    Returns:
+        bool: True for pool timeouts and connection errors.
+    """
+    if isinstance(exc, sa_exceptions.DBAPIError):
+        return exc.connection_invalidated or isinstance(exc, (
+            sa_exceptions.OperationalError, sa_exceptions.InterfaceError,
+        ))
+    # Session left unusable by a lost connection raises
+    # PendingRollbackError, nothing reached the server then. Other
+    # InvalidRequestError, as MultipleResultsFound, are bugs of callers.
+    return isinstance(exc, (
+        sa_exceptions.TimeoutError,
+        sa_exceptions.PendingRollbackError,
+        OSError,
+    ))
+
+
+def is_redis_transient(exc: BaseException) -> bool:
+    """Check exception means Redis is unreachable or overloaded.
+
+    Args:
+        exc (BaseException): Raised exception.
+
+    Returns:
+        bool: True for timeouts and connection errors.
+    """
+    return isinstance(exc, (
+        redis_exceptions.ConnectionError,
+        redis_exceptions.TimeoutError,
+        redis_exceptions.ClusterDownError,
+        OSError,
+    ))
+
+
+TRANSIENT_CHECKS = MappingProxyType({
+    POSTGRESQL: is_postgresql_transient,
+    REDIS: is_redis_transient,
+})
+
+
+class CircuitBreaker:  # noqa: WPS306 (Without Base class.)
+    """Stop calls to dependency after consecutive failures.
+
+    After reset timeout one call is let through as a probe, the others
+    keep failing fast for one more timeout unless the probe succeeds.
+    """
+
+    def __init__(
+        self, name: str, failure_threshold: int, reset_timeout: float,
+    ) -> None:
+        """Init method.
+
+        Args:
+            name (str): Name of dependency.
+            failure_threshold (int): Consecutive failures to open.
+            reset_timeout (float): Seconds to wait before the probe.
+        """
+        self._name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        # Monotonic time of the last answer, read by health checks.
+        self.answered_at: Optional[float] = None
+
+    @property
+    def closed(self) -> bool:
+        """Check calls are let through.
+
+        Returns:
+            bool: True if breaker is closed.
+        """
+        return self._opened_at is None
+
+    @property
+    def retry_after(self) -> float:
+        """Get seconds until the next probe.
+
+        Returns:
+            float: Seconds, reset timeout if breaker is closed.
+        """
+        if self._opened_at is None:
+            return self._reset_timeout
+        return max(
+            self._opened_at + self._reset_timeout - time.monotonic(), 0,
+        )
+
+    def acquire(self) -> bool:
+        """Check call is allowed.
+
+        Returns:
+            bool: True if breaker is closed or call is the probe.
+        """
+        if self._opened_at is None:
+            return True
+        now = time.monotonic()
+        if now < self._opened_at + self._reset_timeout:
+            return False
+        self._opened_at = now
+        return True
+
+    def record_success(self) -> None:
+        """Close breaker after the dependency answered."""
+        if self._opened_at is not None:
+            logger.warning(
+                'Circuit is closed.', extra={'dependency': self._name},
+            )
+        self._failures = 0
+        self._opened_at = None
+        self.answered_at = time.monotonic()
+
+    def record_failure(self) -> None:
+        """Count failure, open breaker on threshold or failed probe."""
+        self._failures += 1
+        if self._opened_at is None:
+            if self._failures < self._failure_threshold:
+                return
+            logger.error('Circuit is open.', extra={'dependency': self._name})
+        self._opened_at = time.monotonic()
+
+
+class RetryBudget:  # noqa: WPS306 (Without Base class.)
+    """Token bucket which limits retries to a share of calls.
+
+    Every call adds ratio of a token and every retry takes a whole one,
+    tokens are also refilled at a small rate so rare calls may retry.
+    """
+
+    def __init__(self, ratio: float, per_second: float) -> None:
+        """Init method.
+
+        Args:
+            ratio (float): Retries allowed per call.
+            per_second (float): Retries allowed per second regardless.
+        """
+        self._ratio = ratio
+        self._per_second = per_second
+        self._capacity = max(per_second * 10, 1)
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+
+    def deposit(self) -> None:
+        """Add tokens for a call."""
+        self._tokens = min(self._tokens + self._ratio, self._capacity)
+
+    def withdraw(self) -> bool:
+        """Take token for a retry.
+
+        Returns:
+            bool: True if retry is allowed.
+        """
+        now = time.monotonic()
+        self._tokens = min(
+            self._tokens + (now - self._updated_at) * self._per_second,
+            self._capacity,
+        )
+        self._updated_at = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+class ResiliencePolicy:  # noqa: WPS306 (Without Base class.)
+    """Circuit breaker, retry budget and jittered retries of dependency."""
+
+    def __init__(
+        self,
+        name: str,
+        config: ResilienceSettings,
+        is_transient: Callable[[BaseException], bool],
+    ) -> None:
+        """Init method.
+
+        Args:
+            name (str): Name of dependency.
+            config (ResilienceSettings): Settings for breakers and retries.
+            is_transient (Callable[[BaseException], bool]):
+            Check exception means dependency is unhealthy.
+        """
+        self.name = name
+        self._config = config
+        self._is_transient = is_transient
+        self._breaker = CircuitBreaker(
+            name,
+            config.breaker_failure_threshold,
+            config.breaker_reset_timeout,
+        )
+        self._budget = RetryBudget(
+            config.retry_budget_ratio, config.retry_budget_per_second,
+        )
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        """Get circuit breaker of dependency.
+
+        Returns:
+            CircuitBreaker: Breaker shared by calls in the process.
+        """
+        return self._breaker
+
+    async def call(  # noqa: WPS211 (Options of the call.)
+        self,
+        func: Callable[..., Awaitable[ReturnType]],
+        *args: Any,
+        idempotent: bool = False,
+        before_retry: Optional[Reset] = None,
+        **kwargs: Any,
+    ) -> ReturnType:
+        """Call dependency through the breaker.
+
+            Not transient exceptions mean the dependency answered, so they
+            close the breaker and are raised as is.
+
+        Args:
+            func (Callable[..., Awaitable[ReturnType]]): Call to dependency.
+            args: Positional arguments of the call.
+            idempotent (bool): Call may be retried after transient error.
+            before_retry (Reset, optional):
+            Reset of the state left by the failed attempt.
+            kwargs: Key value arguments of the call.
+
+        Raises:
+            DependencyUnavailable: If breaker is open or call failed.
+
+        Returns:
+            ReturnType: Result of the call.
+        """
+        self._budget.deposit()
+        attempt = 0
+        while True:  # noqa: WPS457 (Until success or give up.)
+            try:
+                return await self._attempt(func, *args, **kwargs)
+            except DependencyUnavailable as exc:
+                if not self._may_retry(exc, idempotent, attempt):
+                    raise
+            attempt += 1
+            await asyncio.sleep(self._delay(attempt))
+            if before_retry is not None:
+                await before_retry()
+
+    async def _attempt(
+        self,
+        func: Callable[..., Awaitable[ReturnType]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> ReturnType:
+        if not self._breaker.acquire():
+            raise DependencyUnavailable(self.name, self._breaker.retry_after)
+        try:
+            response = await func(*args, **kwargs)
+        except Exception as exc:
+            if not self._is_transient(exc):
+                self._breaker.record_success()
+                raise
+            self._breaker.record_failure()
+            raise DependencyUnavailable(
+                self.name, self._breaker.retry_after,
+            ) from exc
+        self._breaker.record_success()
+        return response
+
+    def _may_retry(
+        self, exc: DependencyUnavailable, idempotent: bool, attempt: int,
+    ) -> bool:
+        # Calls rejected by the open breaker have no cause.
+        if exc.__cause__ is None or not idempotent:
+            return False
+        if attempt >= self._config.retry_attempts or not self._breaker.closed:
+            return False
+        return self._budget.withdraw()
+
+    def _delay(self, attempt: int) -> float:
+        # Full jitter: retries of concurrent calls do not come together.
+        return random.uniform(0, min(  # noqa: S311 (Not for security.)
+            self._config.retry_base_delay * 2 ** attempt,
+            self._config.retry_max_delay,
+        ))
+
+
+_policies: dict[str, ResiliencePolicy] = {}
+
+
+def get_policy(dependency: str) -> ResiliencePolicy:
+    """Get policy shared by all calls to dependency in the process.
+
+    Args:
+        dependency (str): Name of dependency, POSTGRESQL or REDIS.
+
+    Returns:
+        ResiliencePolicy: Policy of dependency.
+    """
+    if dependency not in _policies:
+        _policies[dependency] = ResiliencePolicy(
+            dependency,
+            ResilienceSettings(),
+            TRANSIENT_CHECKS[dependency],
+        )
+    return _policies[dependency]
+
+
+def resilient(dependency: str):
+    """Call decorated method of repository through the policy of dependency.
+
+        Methods named with IDEMPOTENT_PREFIXES are retried if the call
+        began the transaction of the session. The session is rolled
+        back before the retry, a lost connection leaves it unusable,
+        and the rollback would drop no work of the scope done before.
+
+    Args:
+        dependency (str): Name of dependency.
+
+    Returns:
+        decorator: Decorator of the method.
+    """
+    def decorator(method):
+        idempotent = method.__name__.startswith(IDEMPOTENT_PREFIXES)
+
+        @functools.wraps(method)
+        async def wrapper(repository, *args, **kwargs):
+            session = getattr(repository, '_session', None)
+            retried = idempotent and session is not None and (
+                not session.in_transaction()
+            )
+            return await get_policy(dependency).call(
+                method,
+                repository,
+                *args,
+                idempotent=retried,
+                before_retry=session.rollback if retried else None,
+                **kwargs,
+            )
+        return wrapper
+    return decorator
@@ -0,0 +1,29 @@
+"""Module with routes of requests resolved before the router."""
+
+from typing import Any, Optional, Sequence
+
+from starlette.routing import BaseRoute, Match
+
+
+def route_template(
+    routes: Sequence[BaseRoute], scope: dict[str, Any],
+) -> Optional[str]:
+    """Find template of the route which serves the request.
+
+        Middlewares and the trace sampler run before the router, so the
+        route is matched here as the router does. Templates are keys of
+        route settings and the route label of metrics, without the root
+        path, for example /api/public/v1/user/signup/.
+
+    Args:
+        routes (Sequence[BaseRoute]): Routes of the application.
+        scope (dict[str, Any]): ASGI connection scope.
+
+    Returns:
+        Optional[str]: Template, None if no route matches.
+    """
+    for route in routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, 'path', None)
+    return None
@@ -0,0 +1,206 @@
+"""Module with adaptive sampling of Sentry traces."""
+
+import random
+import time
+from collections import OrderedDict
+from datetime import datetime
+from http import HTTPStatus
+from typing import Any, Optional, Sequence, Union
+
+from src.config import SamplingSettings
+from src.infrastructure.routes import route_template
+from src.use_cases.sampling.dto import SamplingRatesDTO
+from starlette.routing import BaseRoute
+
+Event = dict[str, Any]
+# Sentry sets it for transactions failed with unhandled exception.
+FAILED_STATUS = 'internal_error'
+# Share of the budget recorded past the rate, so failed and slow
+# requests among them are kept.
+PROMOTION_SHARE = 0.2
+# Trace IDs of transactions sampled by rate, not yet finished.
+PICKED_LIMIT = 1024
+
+
+class TraceBudget:  # noqa: WPS306 (Without Base class.)
+    """Token bucket of traces sent per second."""
+
+    def __init__(self, per_second: float) -> None:
+        """Init method.
+
+        Args:
+            per_second (float): Traces allowed per second.
+        """
+        self._per_second = per_second
+        self._capacity = max(per_second, 1)
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+
+    def available(self) -> bool:
+        """Check trace may be sent now.
+
+        Returns:
+            bool: True if there is a token.
+        """
+        now = time.monotonic()
+        self._tokens = min(
+            self._tokens + (now - self._updated_at) * self._per_second,
+            self._capacity,
+        )
+        self._updated_at = now
+        return self._tokens >= 1
+
+    def take(self) -> bool:
+        """Take token for a trace.
+
+        Returns:
+            bool: True if trace may be sent.
+        """
+        if not self.available():
+            return False
+        self._tokens -= 1
+        return True
+
+
+class TraceSampler:  # noqa: WPS306 (Without Base class.)
+    """Sampling of Sentry traces within the budget of the process.
+
+    Transactions are sampled when they start, by rate of their route
+    while the budget has tokens, and all of them are sent. A small
+    share of the budget records transactions past the rate, those are
+    sent only when they fail or are slow. Recorded transactions are
+    bounded by the budget and its share, not by the load, so failed
+    transactions past it are not sent, their errors are still sent
+    as error events.
+    """
+
+    def __init__(self, config: SamplingSettings) -> None:
+        """Init method.
+
+        Args:
+            config (SamplingSettings): Default sampling rates.
+        """
+        self.update(SamplingRatesDTO(
+            traces_rate=config.sentry_traces_rate,
+            route_traces_rates=config.sentry_route_traces_rates,
+            slow_request_threshold=config.sentry_slow_request_threshold,
+            max_traces_per_second=config.sentry_max_traces_per_second,
+            profiles_rate=config.sentry_profiles_rate,
+        ))
+        # Routes of the application, rates are keyed by route template.
+        self.routes: Sequence[BaseRoute] = ()
+
+    @property
+    def rates(self) -> SamplingRatesDTO:
+        """Get current rates.
+
+        Returns:
+            SamplingRatesDTO: Rates used by the sampler.
+        """
+        return self._rates
+
+    def update(self, rates: SamplingRatesDTO) -> None:
+        """Replace rates and budget.
+
+        Args:
+            rates (SamplingRatesDTO): New rates.
+        """
+        self._rates = rates
+        self._budget = TraceBudget(rates.max_traces_per_second)
+        self._promotions = TraceBudget(
+            rates.max_traces_per_second * PROMOTION_SHARE,
+        )
+        self._picked: OrderedDict[str, None] = OrderedDict()
+
+    def traces_sampler(self, sampling_context: dict[str, Any]) -> float:
+        """Decide whether to record transaction, Sentry traces_sampler.
+
+        Args:
+            sampling_context (dict[str, Any]): Context of transaction.
+
+        Returns:
+            float: 1 to record transaction, 0 to skip it.
+        """
+        parent_sampled = sampling_context.get('parent_sampled')
+        if parent_sampled is False:
+            return 0
+        transaction = sampling_context.get('transaction_context', {})
+        # Upstream service has already sampled the distributed trace.
+        if parent_sampled or self._by_rate(transaction, sampling_context):
+            if self._budget.take():
+                self._pick(transaction.get('trace_id'))
+                return 1
+        return 1 if self._promotions.take() else 0
+
+    def profiles_sampler(self, sampling_context: dict[str, Any]) -> float:
+        """Get profiling rate of recorded transaction.
+
+        Args:
+            sampling_context (dict[str, Any]): Context of transaction.
+
+        Returns:
+            float: Profiling rate.
+        """
+        return self._rates.profiles_rate
+
+    def before_send_transaction(
+        self, event: Event, hint: dict[str, Any],
+    ) -> Optional[Event]:
+        """Keep or drop finished transaction.
+
+        Args:
+            event (Event): Transaction event.
+            hint (dict[str, Any]): Event hint.
+
+        Returns:
+            Optional[Event]: Event to send or None to drop it.
+        """
+        contexts = event.get('contexts', {})
+        trace_id = contexts.get('trace', {}).get('trace_id')
+        if trace_id in self._picked:
+            self._picked.pop(trace_id)
+            return event
+        if self._should_promote(event):
+            return event
+        return None
+
+    def _by_rate(
+        self, transaction: dict[str, Any], sampling_context: dict[str, Any],
+    ) -> bool:
+        rate = self._rates.traces_rate
+        scope = sampling_context.get('asgi_scope')
+        if self._rates.route_traces_rates and scope is not None:
+            # Router has not resolved the route yet, it is matched here.
+            route = route_template(self.routes, scope)
+            rate = self._rates.route_traces_rates.get(route or '', rate)
+        return random.random() < rate  # noqa: S311 (Not for security.)
+
+    def _pick(self, trace_id: Optional[str]) -> None:
+        if trace_id is None:
+            return
+        self._picked[trace_id] = None
+        if len(self._picked) > PICKED_LIMIT:
+            self._picked.popitem(last=False)
+
+    def _should_promote(self, event: Event) -> bool:
+        contexts = event.get('contexts', {})
+        status_code = contexts.get('response', {}).get('status_code', 0)
+        if contexts.get('trace', {}).get('status') == FAILED_STATUS:
+            return True
+        if status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            return True
+        return _duration(event) >= self._rates.slow_request_threshold
+
+
+def _duration(event: Event) -> float:
+    started = _timestamp(event.get('start_timestamp'))
+    finished = _timestamp(event.get('timestamp'))
+    if started is None or finished is None:
+        return 0
+    return (finished - started).total_seconds()
+
+
+def _timestamp(timestamp: Union[str, datetime, None]) -> Optional[datetime]:
+    if isinstance(timestamp, str):
+        return datetime.fromisoformat(timestamp)
+    return timestamp
@@ -0,0 +1,341 @@
+"""Module with loading of imported users to Database."""
+
+from __future__ import annotations
+
+import csv
+from typing import Any, Iterable, NamedTuple, Optional, TextIO
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from src.infrastructure.user_import.source import ValidatedBatch
+
+STAGING_TABLE = 'user_import_staging'
+STAGING_COLUMNS = (
+    'line',
+    'user_service_id',
+    'user_id',
+    'role',
+    'active',
+    'verified',
+    'email',
+    'login',
+    'password',
+    'full_name',
+    'birthday',
+    'phone_number',
+    'bio',
+    'created_at',
+)
+CREATE_STAGING_TABLE = """
+    CREATE TEMPORARY TABLE user_import_staging (
+        line BIGINT NOT NULL,
+        user_service_id UUID NOT NULL,
+        user_id UUID NOT NULL,
+        role VARCHAR(24),
+        active BOOLEAN NOT NULL,
+        verified BOOLEAN NOT NULL,
+        email VARCHAR(254) NOT NULL,
+        login VARCHAR(60) NOT NULL,
+        password VARCHAR(100) NOT NULL,
+        full_name VARCHAR(60),
+        birthday DATE,
+        phone_number VARCHAR(24),
+        bio VARCHAR(1000),
+        created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+        conflict TEXT
+    ) ON COMMIT DELETE ROWS
+"""
+CREATE_STAGING = (
+    CREATE_STAGING_TABLE,
+    'CREATE INDEX ON user_import_staging (lower(email))',
+    'CREATE INDEX ON user_import_staging (login)',
+)
+# Rows are checked against existing users and against earlier rows
+# of the same batch, earlier batches are already in the user table.
+MARK_UNKNOWN_ROLE = """
+    UPDATE user_import_staging AS s SET conflict = 'unknown role'
+    WHERE NOT EXISTS (
+        SELECT 1 FROM {schema}.role
+        WHERE role.name = coalesce(s.role, :default_role)
+    )
+"""
+MARK_EMAIL_EXISTS = """
+    UPDATE user_import_staging AS s SET conflict = 'email exists'
+    WHERE s.conflict IS NULL AND (
+        EXISTS (
+            SELECT 1 FROM {schema}."user" AS u
+            WHERE lower(u.email) = lower(s.email)
+        ) OR EXISTS (
+            SELECT 1 FROM user_import_staging AS d
+            WHERE lower(d.email) = lower(s.email) AND d.line < s.line
+        )
+    )
+"""
+MARK_LOGIN_EXISTS = """
+    UPDATE user_import_staging AS s SET conflict = 'login exists'
+    WHERE s.conflict IS NULL AND (
+        EXISTS (SELECT 1 FROM {schema}."user" AS u WHERE u.login = s.login)
+        OR EXISTS (
+            SELECT 1 FROM user_import_staging AS d
+            WHERE d.login = s.login AND d.line < s.line
+        )
+    )
+"""
+INSERT_USER_SERVICES = """
+    INSERT INTO {schema}.user_service (
+        id, role_id, active, verified, created_at, updated_at
+    )
+    SELECT
+        s.user_service_id, role.id, s.active, s.verified,
+        s.created_at, s.created_at
+    FROM user_import_staging AS s
+    JOIN {schema}.role ON role.name = coalesce(s.role, :default_role)
+    WHERE s.conflict IS NULL
+"""
+# Users signed up while the batch was checked are skipped here.
+INSERT_USERS = """
+    INSERT INTO {schema}."user" (
+        id, email, login, password, user_service_id, full_name,
+        birthday, phone_number, bio, created_at, updated_at
+    )
+    SELECT
+        s.user_id, s.email, s.login, s.password, s.user_service_id,
+        s.full_name, s.birthday, s.phone_number, s.bio,
+        s.created_at, s.created_at
+    FROM user_import_staging AS s
+    WHERE s.conflict IS NULL
+    ON CONFLICT DO NOTHING
+"""
+MARK_SKIPPED = """
+    UPDATE user_import_staging AS s SET conflict = 'concurrent sign up'
+    WHERE s.conflict IS NULL AND NOT EXISTS (
+        SELECT 1 FROM {schema}."user" AS u WHERE u.id = s.user_id
+    )
+"""
+DELETE_SKIPPED_USER_SERVICES = """
+    DELETE FROM {schema}.user_service AS us
+    USING user_import_staging AS s
+    WHERE us.id = s.user_service_id AND s.conflict = 'concurrent sign up'
+"""
+MERGE = (
+    MARK_UNKNOWN_ROLE,
+    MARK_EMAIL_EXISTS,
+    MARK_LOGIN_EXISTS,
+    INSERT_USER_SERVICES,
+    INSERT_USERS,
+    MARK_SKIPPED,
+    DELETE_SKIPPED_USER_SERVICES,
+)
+CONFLICTS_QUERY = """
+    SELECT line, email, login, conflict FROM user_import_staging
+    WHERE conflict IS NOT NULL ORDER BY line
+"""
+CHECKPOINT_QUERY = """
+    SELECT records, imported, conflicts, rejected
+    FROM {schema}.user_import_checkpoint WHERE source = :source
+"""
+SAVE_CHECKPOINT = """
+    INSERT INTO {schema}.user_import_checkpoint AS c (
+        source, records, imported, conflicts, rejected
+    ) VALUES (:source, :records, :imported, :conflicts, :rejected)
+    ON CONFLICT (source) DO UPDATE SET
+        records = excluded.records,
+        imported = c.imported + excluded.imported,
+        conflicts = c.conflicts + excluded.conflicts,
+        rejected = c.rejected + excluded.rejected,
+        updated_at = now()
+"""
+REPORT_HEADER = ('line', 'email', 'login', 'reason')
+
+
+class ImportAlreadyRunning(Exception):
+    """Import of the same source is running in another process."""
+
+
+class ImportStats(NamedTuple):
+    """Number of processed, imported, conflicting and rejected records."""
+
+    records: int = 0
+    imported: int = 0
+    conflicts: int = 0
+    rejected: int = 0
+
+
+class ImportReport:  # noqa: WPS306 (Without Base class.)
+    """CSV report with conflicting and rejected records.
+
+    Lines are flushed before the batch is committed, so after resume
+    a record may be reported twice, but it is never lost.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        """Init method.
+
+        Args:
+            stream (TextIO): Report file opened for appending.
+        """
+        self._stream = stream
+        self._writer = csv.writer(stream)
+        if not stream.tell():
+            self._writer.writerow(REPORT_HEADER)
+
+    def write(self, rows: Iterable[tuple[Any, ...]]) -> None:
+        """Write report rows.
+
+        Args:
+            rows (Iterable[tuple[Any, ...]]): Line, email, login, reason.
+        """
+        self._writer.writerows(rows)
+        self._stream.flush()
+
+
+class UserImporter:  # noqa: WPS306 (Without Base class.)
+    """Load validated users with COPY and merge them batch by batch.
+
+    Every batch is copied to the temporary staging table, checked for
+    conflicts and merged into user_service and user tables in one
+    transaction together with the checkpoint, so after a failure
+    import resumes from the first not committed batch.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        schema: str,
+        source: str,
+        default_role: str,
+    ) -> None:
+        """Init method.
+
+        Args:
+            engine (AsyncEngine): SQLAlchemy engine.
+            schema (str): Database schema with user tables.
+            source (str): Name of the import, key of the checkpoint.
+            default_role (str): Role of users imported without role.
+        """
+        self._engine = engine
+        self._schema = '"{0}"'.format(schema)
+        self._source = source
+        self._default_role = default_role
+        self._connection: Optional[AsyncConnection] = None
+
+    async def __aenter__(self) -> ImportStats:
+        """Lock the source and create staging table.
+
+        Raises:
+            ImportAlreadyRunning: If source is imported by another process.
+
+        Returns:
+            ImportStats: Progress saved in the checkpoint.
+        """
+        self._connection = await self._engine.connect()
+        if not await self._lock(self._connection):
+            await self._connection.close()
+            raise ImportAlreadyRunning(self._source)
+        checkpoint = await self._prepare(self._connection)
+        await self._connection.commit()
+        return checkpoint
+
+    async def __aexit__(self, *args) -> None:
+        """Close connection, advisory lock is released with it.
+
+        Args:
+            args: Exception info.
+        """
+        if self._connection:
+            await self._connection.close()
+            self._connection = None
+
+    async def load(
+        self, batch: ValidatedBatch, report: ImportReport,
+    ) -> ImportStats:
+        """Copy, merge and checkpoint one batch.
+
+        Args:
+            batch (ValidatedBatch): Validated batch.
+            report (ImportReport): Report of skipped records.
+
+        Raises:
+            RuntimeError: If importer is not entered.
+
+        Returns:
+            ImportStats: Result of the batch.
+        """
+        connection = self._connection
+        if connection is None:
+            raise RuntimeError('Importer is not entered.')
+        async with connection.begin():
+            await self._copy(connection, batch.records)
+            conflicts = await self._merge(connection)
+            report.write(
+                (line, '', '', reason) for line, reason in batch.rejected
+            )
+            report.write(conflicts)
+            stats = ImportStats(
+                records=batch.last_line,
+                imported=len(batch.records) - len(conflicts),
+                conflicts=len(conflicts),
+                rejected=len(batch.rejected),
+            )
+            await connection.execute(
+                sa.text(SAVE_CHECKPOINT.format(schema=self._schema)),
+                {
+                    'source': self._source,
+                    'records': stats.records,
+                    'imported': stats.imported,
+                    'conflicts': stats.conflicts,
+                    'rejected': stats.rejected,
+                },
+            )
+        return stats
+
+    async def _lock(self, connection: AsyncConnection) -> bool:
+        return await connection.scalar(
+            sa.text('SELECT pg_try_advisory_lock(hashtext(:source))'),
+            {'source': self._source},
+        )
+
+    async def _prepare(self, connection: AsyncConnection) -> ImportStats:
+        for statement in CREATE_STAGING:
+            await connection.execute(sa.text(statement))
+        res = await connection.execute(
+            sa.text(CHECKPOINT_QUERY.format(schema=self._schema)),
+            {'source': self._source},
+        )
+        checkpoint = res.one_or_none()
+        return ImportStats(*checkpoint) if checkpoint else ImportStats()
+
+    async def _copy(
+        self, connection: AsyncConnection, records: list[tuple[Any, ...]],
+    ) -> None:
+        # The first statement opens transaction, COPY goes in it as well.
+        await connection.execute(sa.text(
+            'TRUNCATE {0}'.format(STAGING_TABLE),
+        ))
+        driver = (await connection.get_raw_connection()).driver_connection
+        await driver.copy_records_to_table(
+            STAGING_TABLE, records=records, columns=STAGING_COLUMNS,
+        )
+        # Temporary tables are not analyzed by autovacuum.
+        await connection.execute(sa.text(
+            'ANALYZE {0}'.format(STAGING_TABLE),
+        ))
+
+    async def _merge(
+        self, connection: AsyncConnection,
+    ) -> list[tuple[Any, ...]]:
+        """Merge staging rows and return conflicting ones.
+
+        Args:
+            connection (AsyncConnection): Connection in transaction.
+
+        Returns:
+            list[tuple[Any, ...]]: Line, email, login and conflict reason.
+        """
+        for statement in MERGE:
+            await connection.execute(
+                sa.text(statement.format(schema=self._schema)),
+                {'default_role': self._default_role},
+            )
+        res = await connection.execute(sa.text(CONFLICTS_QUERY))
+        return [tuple(row) for row in res.all()]
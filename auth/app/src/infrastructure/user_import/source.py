@@ -0,0 +1,125 @@
+"""Module with reading and validation of imported users."""
+
+from __future__ import annotations
+
+import csv
+import json
+from datetime import UTC, datetime
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable, Iterator, NamedTuple
+
+import pydantic as pd
+from src.domain.base import uuid7
+from src.use_cases.user.dto import UserImportDTO
+
+NDJSON_SUFFIXES = frozenset(('.ndjson', '.jsonl'))
+
+SourceRecord = tuple[int, Any]
+
+
+class ValidatedBatch(NamedTuple):
+    """Batch of source records after validation.
+
+    Records are rows of the staging table, see loader.STAGING_COLUMNS.
+    """
+
+    last_line: int
+    records: list[tuple[Any, ...]]
+    rejected: list[tuple[int, str]]
+
+
+def read_source(path: Path, skip: int) -> Iterator[SourceRecord]:
+    """Read records of CSV or NDJSON file one by one.
+
+        NDJSON lines are returned unparsed, they are parsed along with
+        validation in worker processes.
+
+    Args:
+        path (Path): Path to the source file.
+        skip (int): Number of records processed before.
+
+    Yields:
+        Iterator[SourceRecord]: Record number, starting from 1, and record.
+    """
+    with path.open(newline='', encoding='utf-8') as source:
+        records: Iterable[Any] = source
+        if path.suffix not in NDJSON_SUFFIXES:
+            records = csv.DictReader(source)
+        yield from islice(enumerate(records, start=1), skip, None)
+
+
+def batched(
+    records: Iterator[SourceRecord], size: int,
+) -> Iterator[list[SourceRecord]]:
+    """Split records to lists of size records.
+
+    Args:
+        records (Iterator[SourceRecord]): Source records.
+        size (int): Batch size.
+
+    Yields:
+        Iterator[list[SourceRecord]]: Batches of records.
+    """
+    while True:  # noqa: WPS457 (Until records are exhausted.)
+        batch = list(islice(records, size))
+        if not batch:
+            return
+        yield batch
+
+
+def validate_batch(batch: list[SourceRecord]) -> ValidatedBatch:
+    """Validate records and build rows of the staging table.
+
+        Runs in worker processes, so it is a module level function.
+
+    Args:
+        batch (list[SourceRecord]): Source records.
+
+    Returns:
+        ValidatedBatch: Staging rows and rejected records.
+    """
+    now = datetime.now(UTC)
+    records: list[tuple[Any, ...]] = []
+    rejected: list[tuple[int, str]] = []
+    for line, record in batch:
+        try:
+            user = UserImportDTO.model_validate(_parse(record))
+        except ValueError as exc:
+            rejected.append((line, _reason(exc)))
+            continue
+        records.append((
+            line,
+            uuid7(),
+            uuid7(),
+            user.role,
+            user.active,
+            user.verified,
+            user.email,
+            user.login,
+            user.password,
+            user.full_name,
+            user.birthday,
+            user.phone_number,
+            user.bio,
+            user.created_at or now,
+        ))
+    return ValidatedBatch(batch[-1][0], records, rejected)
+
+
+def _parse(record: Any) -> dict[str, Any]:
+    if isinstance(record, str):
+        return json.loads(record)
+    # Empty CSV cells are missing values, not empty strings.
+    return {key: cell for key, cell in record.items() if cell}
+
+
+def _reason(exc: ValueError) -> str:
+    if isinstance(exc, pd.ValidationError):
+        return '; '.join(
+            '{0}: {1}'.format(
+                '.'.join(str(part) for part in error['loc']), error['msg'],
+            )
+            for error in exc.errors()
+        )
+    return str(exc)
@@ -0,0 +1,138 @@
+"""Module with warm-up of a worker before it takes traffic.
+
+First requests of a cold worker open Database and Redis connections,
+compile SQL statements, start hashing threads and load bcrypt. Warm-up
+does all of it with probe values, which match no user, so it writes
+nothing.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from contextlib import suppress
+from typing import Awaitable, Callable
+
+from src.config import WarmUpSettings
+from src.domain.repositories.user.exceptions import UserNotFoundError
+from src.infrastructure.interfaces.social_networks.catalog import (
+    SocialNetworkCatalog,
+)
+from src.use_cases.interfaces.cache.unit_of_work import (
+    AbstractUnitOfWork as AbstractCacheUnitOfWork,
+)
+from src.use_cases.interfaces.database.unit_of_work import (
+    AbstractUnitOfWork as AbstractDatabaseUnitOfWork,
+)
+from src.use_cases.interfaces.hashing.hasher import IPasswordHasher
+from src.use_cases.interfaces.tokens.entities import IToken, ITokenCreator
+
+logger = logging.getLogger(__name__)
+
+PROBE_EMAIL = 'warm-up@example.invalid'
+PROBE_LOGIN = 'warm-up'
+PROBE_PASSWORD = 'warm-up'  # noqa: S105 (Not a secret.)
+PROBE_USER_ID = uuid.UUID(int=0)
+
+CacheUnitOfWorkFactory = Callable[[], Awaitable[AbstractCacheUnitOfWork]]
+
+
+class Readiness:  # noqa: WPS306 (Without Base class.)
+    """Flag of the worker, set once it is warmed up."""
+
+    def __init__(self) -> None:
+        """Init method."""
+        self.ready = False
+
+
+class WarmUp:  # noqa: WPS306 (Without Base class.)
+    """Hot paths of sign up and sign in, run once before traffic.
+
+    Failures are logged and the worker starts anyway, requests
+    fail or succeed on their own then.
+    """
+
+    def __init__(  # noqa: WPS211 (Dependencies of the warm-up.)
+        self,
+        database_uow_factory: Callable[[], AbstractDatabaseUnitOfWork],
+        cache_uow_factory: CacheUnitOfWorkFactory,
+        catalog: SocialNetworkCatalog,
+        hasher: IPasswordHasher,
+        tokens: ITokenCreator,
+        readiness: Readiness,
+        config: WarmUpSettings,
+    ) -> None:
+        """Init method.
+
+        Args:
+            database_uow_factory (Callable[[], AbstractDatabaseUnitOfWork]):
+            Factory for create Database Units of Work.
+            cache_uow_factory (CacheUnitOfWorkFactory):
+            Async factory for create Cache Units of Work.
+            catalog (SocialNetworkCatalog): Social Networks catalog.
+            hasher (IPasswordHasher): Hasher of passwords.
+            tokens (ITokenCreator): Fabric for create Tokens.
+            readiness (Readiness): Flag set after warm-up.
+            config (WarmUpSettings): Settings for warm-up.
+        """
+        self._database_uow_factory = database_uow_factory
+        self._cache_uow_factory = cache_uow_factory
+        self._catalog = catalog
+        self._hasher = hasher
+        self._tokens = tokens
+        self._readiness = readiness
+        self._config = config
+
+    async def run(self) -> None:
+        """Warm up within the timeout, then set the readiness flag."""
+        started = time.monotonic()
+        try:
+            await asyncio.wait_for(
+                self._warm_up(), self._config.warmup_timeout,
+            )
+        except Exception:
+            logger.exception('Warm-up failed, worker starts cold.')
+        self._readiness.ready = True
+        logger.info(
+            'Worker is ready.',
+            extra={'warmup_seconds': time.monotonic() - started},
+        )
+
+    async def _warm_up(self) -> None:
+        refresh_token = self._tokens.create_refresh_token(PROBE_USER_ID)
+        self._tokens.load_token(refresh_token.get_encoded_token())
+        # Scopes run at once, so each of them checks out a connection.
+        # First failure cancels the rest, timeout cancels all of them.
+        async with asyncio.TaskGroup() as group:
+            group.create_task(self._warm_hasher())
+            group.create_task(self._catalog.refresh())
+            for _ in range(self._config.warmup_connections):
+                group.create_task(self._warm_primary())
+                group.create_task(self._warm_reads())
+                group.create_task(self._warm_cache(refresh_token))
+
+    async def _warm_hasher(self) -> None:
+        hashed = await self._hasher.hash(PROBE_PASSWORD)
+        await self._hasher.verify(PROBE_PASSWORD, hashed)
+
+    async def _warm_primary(self) -> None:
+        uow = self._database_uow_factory()
+        async with uow(autocommit=False):
+            await uow.role.retrieve_base_role()
+            with suppress(UserNotFoundError):
+                await uow.user.retrieve_by_email_or_login(
+                    PROBE_EMAIL, PROBE_LOGIN,
+                )
+
+    async def _warm_reads(self) -> None:
+        uow = self._database_uow_factory()
+        async with uow(autocommit=False, read_only=True):
+            with suppress(UserNotFoundError):
+                await uow.user.retrieve_by_email(PROBE_EMAIL)
+            with suppress(UserNotFoundError):
+                await uow.user.retrieve_by_login(PROBE_LOGIN)
+
+    async def _warm_cache(self, refresh_token: IToken) -> None:
+        uow = await self._cache_uow_factory()
+        async with uow(False):
+            await uow.refresh_tokens.exists(PROBE_USER_ID, refresh_token)
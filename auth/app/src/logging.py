@@ -1,36 +1,229 @@
-"""Module with logging configuration."""
+"""Module with logging configuration.
 
-from src.config import LoggingSettings
+Handlers of the configuration write from a listener thread, records
+are only put to a bounded queue on the event loop, so latency of
+requests does not depend on the disk.
+"""
 
-config = LoggingSettings()
+import copy
+import logging
+import os
+import time
+from logging.config import dictConfig
+from logging.handlers import QueueHandler, QueueListener
+from queue import Full, Queue
+from typing import Optional
 
+import orjson
+from src.config import APISettings, LoggingSettings
+from src.infrastructure.metrics import LOG_RECORDS_DROPPED
 
-def get_logging_config() -> dict:
+DATE_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+# Attributes of every record, the others are extra fields of the call.
+RECORD_ATTRIBUTES = frozenset(
+    logging.makeLogRecord({}).__dict__,
+).union(('message', 'asctime'))
+
+
+class OrjsonFormatter(logging.Formatter):
+    """Format record as JSON line serialized with orjson.
+
+        Fields of the service are computed once per process, time is
+        formatted once per second, extra fields of the call are added
+        as is and serialized with str if JSON has no type for them.
+
+    Args:
+        logging.Formatter (class): Base formatter.
+    """
+
+    def __init__(self, service: str, version: str) -> None:
+        """Init method.
+
+        Args:
+            service (str): Name of the service.
+            version (str): Version of the service.
+        """
+        super().__init__()
+        self._static = {
+            'service': service,
+            'version': version,
+            'pid': os.getpid(),
+        }
+        self._second: Optional[int] = None
+        self._asctime = ''
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format record.
+
+        Args:
+            record (logging.LogRecord): Record of the logging call.
+
+        Returns:
+            str: JSON object.
+        """
+        document = {
+            **self._static,
+            'name': record.name,
+            'asctime': self._format_time(record.created),
+            'levelname': record.levelname,
+            'filename': record.filename,
+            'lineno': record.lineno,
+            'funcName': record.funcName,
+            'message': record.getMessage(),
+        }
+        for key, field in record.__dict__.items():
+            if key not in RECORD_ATTRIBUTES:
+                document[key] = field
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            document['exc_info'] = record.exc_text
+        if record.stack_info:
+            document['stack_info'] = self.formatStack(record.stack_info)
+        return orjson.dumps(document, default=str).decode()
+
+    def _format_time(self, created: float) -> str:
+        second = int(created)
+        if second != self._second:
+            self._second = second
+            self._asctime = time.strftime(DATE_FORMAT, time.gmtime(second))
+        return self._asctime
+
+
+class DroppingQueueHandler(QueueHandler):
+    """Put records to the queue without waiting for free space.
+
+        Records logged while the queue is full are dropped and counted,
+        the number is logged as a warning once the queue has space.
+
+    Args:
+        QueueHandler (class): Handler which sends records to a queue.
+    """
+
+    def __init__(self, queue: Queue) -> None:
+        """Init method.
+
+        Args:
+            queue (Queue): Bounded queue read by the listener.
+        """
+        super().__init__(queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put record or count it as dropped.
+
+        Args:
+            record (logging.LogRecord): Prepared record.
+        """
+        if self.dropped and self._put(self._dropped_record()):
+            self.dropped = 0
+        # Record waits behind the report of the dropped ones.
+        if self.dropped or not self._put(record):
+            self.dropped += 1
+            LOG_RECORDS_DROPPED.inc()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge arguments and traceback, keeping fields for formatter.
+
+            Unlike the base method the message is not formatted here,
+            so the listener formats it once with its own formatter.
+
+        Args:
+            record (logging.LogRecord): Record of the logging call.
+
+        Returns:
+            logging.LogRecord: Copy safe to pass to another thread.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(
+                record.exc_info,
+            )
+            record.exc_info = None
+        return record
+
+    def _put(self, record: logging.LogRecord) -> bool:
+        try:
+            self.queue.put_nowait(record)
+        except Full:
+            return False
+        return True
+
+    def _dropped_record(self) -> logging.LogRecord:
+        return logging.makeLogRecord({
+            'name': __name__,
+            'levelno': logging.WARNING,
+            'levelname': logging.getLevelName(logging.WARNING),
+            'msg': 'Dropped {0} log records, logging queue is full.'.format(
+                self.dropped,
+            ),
+        })
+
+
+def get_log_file(config: LoggingSettings) -> str:
+    """Return path of the log file of the process.
+
+    Args:
+        config (LoggingSettings): Logging settings.
+
+    Returns:
+        str: Path, suffixed with pid if every worker rotates its file.
+    """
+    path = config.logging_file
+    if config.logging_rotation == 'worker':
+        path = path.with_name(
+            '{0}.{1}{2}'.format(path.stem, os.getpid(), path.suffix),
+        )
+    return str(path)
+
+
+def get_file_handler_config(config: LoggingSettings) -> dict:
+    """Return configuration of the file handler.
+
+    Args:
+        config (LoggingSettings): Logging settings.
+
+    Returns:
+        dict: Handler configuration.
+    """
+    file_handler = {
+        'level': 'INFO',
+        'formatter': 'json',
+        'filename': get_log_file(config),
+    }
+    if config.logging_rotation == 'external':
+        file_handler['class'] = 'logging.handlers.WatchedFileHandler'
+        return file_handler
+    file_handler['class'] = 'logging.handlers.RotatingFileHandler'
+    file_handler['maxBytes'] = 5242880
+    file_handler['backupCount'] = 10
+    return file_handler
+
+
+def get_logging_config(config: LoggingSettings) -> dict:
     """Return logging configuration.
 
+    Args:
+        config (LoggingSettings): Logging settings.
+
     Returns:
         dict: Logging Configuration.
     """
+    api = APISettings()
     return {
         'version': 1,
         'disable_existing_loggers': False,
         'formatters': {
             'json': {
-                'format': '%(name)s - %(asctime)s - %(levelname)s - '
-                + '%(filename)s:%(lineno)d:%(funcName)s - %(message)s',
-                'datefmt': '%Y-%m-%dT%H:%M:%SZ',
-                'class': 'pythonjsonlogger.jsonlogger.JsonFormatter',
+                '()': OrjsonFormatter,
+                'service': api.api_title,
+                'version': api.api_version,
             },
         },
         'handlers': {
-            'file': {
-                'class': 'logging.handlers.RotatingFileHandler',
-                'maxBytes': 5242880,
-                'backupCount': 10,
-                'level': 'INFO',
-                'formatter': 'json',
-                'filename': 'logs/application.log',
-            },
+            'file': get_file_handler_config(config),
         },
         'loggers': {
             '': {
@@ -40,3 +233,36 @@ def get_logging_config() -> dict:
             },
         },
     }
+
+
+def start_logging() -> QueueListener:
+    """Apply configuration and move its handlers behind the queue.
+
+        Settings are read here, in the worker, not on import, so
+        the module is imported before fork with no file opened.
+
+    Returns:
+        QueueListener: Started listener, stop it to flush the queue.
+    """
+    config = LoggingSettings()
+    dictConfig(get_logging_config(config))
+    root = logging.getLogger()
+    sinks = root.handlers[:]
+    queue: Queue = Queue(config.logging_queue_size)
+    for sink in sinks:
+        root.removeHandler(sink)
+    root.addHandler(DroppingQueueHandler(queue))
+    listener = QueueListener(queue, *sinks, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def stop_logging(listener: QueueListener) -> None:
+    """Write queued records and close handlers of the listener.
+
+    Args:
+        listener (QueueListener): Listener returned by start_logging.
+    """
+    listener.stop()
+    for sink in listener.handlers:
+        sink.close()
@@ -0,0 +1,137 @@
+"""Module with lightweight spans of use cases, units of work and calls.
+
+Spans are recorded only while an exporter is set, otherwise traced
+functions are called directly after one attribute check.
+"""
+
+from __future__ import annotations
+
+import functools
+import secrets
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, NamedTuple, Optional
+
+USE_CASE = 'use_case'
+TRACE_ID_BYTES = 16
+SPAN_ID_BYTES = 8
+
+SpanContext = tuple[str, str]
+
+
+class Span(NamedTuple):
+    """Finished span, times are in seconds."""
+
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    name: str
+    component: str
+    started_at: float
+    duration: float
+    error: Optional[str]
+
+
+class SpanExporter(ABC):
+    """Destination of finished spans.
+
+    Args:
+        ABC (class): Used to create an abstract class.
+    """
+
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        """Export finished span.
+
+        Args:
+            span (Span): Finished span.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Flush and release exporter."""
+
+
+class Tracer:  # noqa: WPS306 (Without Base class.)
+    """Exporter of the process, None while instrumentation is off."""
+
+    def __init__(self) -> None:
+        """Init method."""
+        self.exporter: Optional[SpanExporter] = None
+
+
+tracer = Tracer()
+# Trace and span ID of the span in progress.
+current_span: ContextVar[Optional[SpanContext]] = ContextVar(
+    'current_span', default=None,
+)
+
+
+@contextmanager
+def span(name: str, component: str) -> Iterator[None]:
+    """Record the block as a child of the span in progress.
+
+    Args:
+        name (str): Name of the span.
+        component (str): Component, e.g. use_case or postgresql.
+
+    Raises:
+        BaseException: Exception of the block, after recording.
+
+    Yields:
+        Iterator[None]: Nothing.
+    """
+    exporter = tracer.exporter
+    if exporter is None:
+        yield
+        return
+    parent = current_span.get()
+    trace_id = parent[0] if parent else secrets.token_hex(TRACE_ID_BYTES)
+    span_id = secrets.token_hex(SPAN_ID_BYTES)
+    token = current_span.set((trace_id, span_id))
+    started_at = time.time()
+    started = time.perf_counter()
+    error: Optional[str] = None
+    try:
+        yield
+    except BaseException as exc:  # noqa: WPS424 (Cancellation as well.)
+        error = type(exc).__name__
+        raise
+    finally:
+        current_span.reset(token)
+        exporter.export(Span(
+            trace_id=trace_id,
+            span_id=span_id,
+            parent_id=parent[1] if parent else None,
+            name=name,
+            component=component,
+            started_at=started_at,
+            duration=time.perf_counter() - started,
+            error=error,
+        ))
+
+
+def traced(component: str):
+    """Record decorated coroutine function as a span.
+
+        Span name is the qualified name of the function.
+
+    Args:
+        component (str): Component, e.g. use_case or postgresql.
+
+    Returns:
+        decorator: Decorator of the function.
+    """
+    def decorator(method):
+        name = method.__qualname__
+
+        @functools.wraps(method)
+        async def wrapper(*args, **kwargs):
+            if tracer.exporter is None:
+                return await method(*args, **kwargs)
+            with span(name, component):
+                return await method(*args, **kwargs)
+        return wrapper
+    return decorator
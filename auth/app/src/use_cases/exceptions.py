@@ -3,3 +3,26 @@
 
 class PasswordNotCorrect(Exception):
     """Password for that user account not correct."""
+
+
+class TokenNotValid(Exception):
+    """Token is malformed, expired or has invalid signature."""
+
+
+class AccessDenied(Exception):
+    """Token owner has not enough access level."""
+
+
+class DependencyUnavailable(Exception):
+    """Dependency is unhealthy or overloaded, call is not made or failed."""
+
+    def __init__(self, dependency: str, retry_after: float) -> None:
+        """Init method.
+
+        Args:
+            dependency (str): Name of unavailable dependency.
+            retry_after (float): Seconds until the next attempt is allowed.
+        """
+        super().__init__(dependency)
+        self.dependency = dependency
+        self.retry_after = retry_after
@@ -6,6 +6,9 @@ from abc import ABC, abstractmethod
 from types import TracebackType
 from typing import Optional, Type
 
+from src.use_cases.interfaces.social_accounts.repo import (
+    ISocialAccountRepository,
+)
 from src.use_cases.interfaces.tokens.repo import (
     IAccessTokenRepository,
     IRefreshTokenRepository,
@@ -23,6 +26,7 @@ class AbstractUnitOfWork(ABC):
 
     access_tokens: IAccessTokenRepository
     refresh_tokens: IRefreshTokenRepository
+    social_accounts: ISocialAccountRepository
 
     def __call__(self, transaction: bool) -> AbstractUnitOfWork:
         """Magic method responsible for the logic when calling class.
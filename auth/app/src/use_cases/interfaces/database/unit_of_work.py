@@ -34,16 +34,20 @@ class AbstractUnitOfWork(ABC):
     social_network: ISocialNetworkRepository
     user_social_account: IUserSocialAccountRepository
 
-    def __call__(self, autocommit: bool) -> AbstractUnitOfWork:
+    def __call__(
+        self, autocommit: bool, read_only: bool = False,
+    ) -> AbstractUnitOfWork:
         """Magic method responsible for the logic when calling class.
 
         Args:
             autocommit (bool): Do autocommit in session or not.
+            read_only (bool): Scope only reads, it may go to a replica.
 
         Returns:
             AbstractUnitOfWork: Return itself.
         """
         self._autocommit = autocommit
+        self._read_only = read_only
         return self
 
     async def __aenter__(self) -> AbstractUnitOfWork:
@@ -0,0 +1,34 @@
+"""Module with class for hashing of passwords."""
+
+from abc import ABC, abstractmethod
+
+
+class IPasswordHasher(ABC):
+    """Hasher which does not block the event loop.
+
+    Args:
+        ABC (class): Used to create an abstract class.
+    """
+
+    @abstractmethod
+    async def hash(self, password: str) -> str:
+        """Hash password.
+
+        Args:
+            password (str): Plain password.
+
+        Returns:
+            str: Password hash.
+        """
+
+    @abstractmethod
+    async def verify(self, password: str, hashed: str) -> bool:
+        """Check password against its hash.
+
+        Args:
+            password (str): Plain password.
+            hashed (str): Password hash.
+
+        Returns:
+            bool: True if password matches.
+        """
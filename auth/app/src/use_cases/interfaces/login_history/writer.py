@@ -0,0 +1,23 @@
+"""Module with class for recording Login History."""
+
+from abc import ABC, abstractmethod
+
+from src.domain.login_history.entities import LoginHistory
+
+
+class ILoginHistoryWriter(ABC):
+    """Writer which records login entries outside of the request path.
+
+    Args:
+        ABC (class): Used to create an abstract class.
+    """
+
+    @abstractmethod
+    def record(self, entity: LoginHistory) -> None:
+        """Schedule login entry for saving.
+
+            Must not block and must not wait for storage.
+
+        Args:
+            entity (LoginHistory): entity of LoginHistory.
+        """
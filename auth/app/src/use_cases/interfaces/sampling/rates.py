@@ -0,0 +1,29 @@
+"""Module with Sampling rates."""
+
+from abc import ABC, abstractmethod
+
+from src.use_cases.sampling.dto import SamplingRatesDTO
+
+
+class ISamplingRates(ABC):
+    """Sampling rates shared by all processes of the service.
+
+    Args:
+        ABC (class): Used to create an abstract class.
+    """
+
+    @abstractmethod
+    def current(self) -> SamplingRatesDTO:
+        """Get rates used by the process.
+
+        Returns:
+            SamplingRatesDTO: Current rates.
+        """
+
+    @abstractmethod
+    async def publish(self, rates: SamplingRatesDTO) -> None:
+        """Save rates and apply them in all processes.
+
+        Args:
+            rates (SamplingRatesDTO): New rates.
+        """
@@ -0,0 +1,51 @@
+"""Module with classes for cache of Social Accounts."""
+
+import uuid
+from abc import ABC, abstractmethod
+
+
+class ISocialAccountRepository(ABC):
+    """Cache of users by their accounts in Social Networks.
+
+        Commands are queued, results are in responses of Unit of Work.
+
+    Args:
+        ABC (class): Used to create an abstract class.
+    """
+
+    @abstractmethod
+    async def retrieve(
+        self, social_network_id: uuid.UUID, social_account_id: str,
+    ) -> None:
+        """Retrieve user UUID of social account.
+
+        Args:
+            social_network_id (uuid.UUID): Social Network UUID ID.
+            social_account_id (str): Account identifier in Social Network.
+        """
+
+    @abstractmethod
+    async def insert(
+        self,
+        social_network_id: uuid.UUID,
+        social_account_id: str,
+        uid: uuid.UUID,
+    ) -> None:
+        """Insert user UUID of social account.
+
+        Args:
+            social_network_id (uuid.UUID): Social Network UUID ID.
+            social_account_id (str): Account identifier in Social Network.
+            uid (uuid.UUID): User UUID ID.
+        """
+
+    @abstractmethod
+    async def delete(
+        self, social_network_id: uuid.UUID, social_account_id: str,
+    ) -> None:
+        """Delete social account, when it is unlinked from user.
+
+        Args:
+            social_network_id (uuid.UUID): Social Network UUID ID.
+            social_account_id (str): Account identifier in Social Network.
+        """
@@ -0,0 +1,57 @@
+"""Module with Social Networks catalog."""
+
+import uuid
+from abc import ABC, abstractmethod
+
+from src.domain.social_network.entities import SocialNetwork
+
+
+class ISocialNetworkCatalog(ABC):
+    """In-memory catalog of Social Networks.
+
+    Args:
+        ABC (class): Used to create an abstract class.
+    """
+
+    @property
+    @abstractmethod
+    def etag(self) -> str:
+        """Get strong entity tag of the catalog.
+
+        Returns:
+            str: Quoted tag, changes with any of Social Networks.
+        """
+
+    @abstractmethod
+    def retrieve_all(self) -> list[SocialNetwork]:
+        """Retrieve all social networks.
+
+        Returns:
+            list[SocialNetwork]: Social Networks ordered by name.
+        """
+
+    @abstractmethod
+    def retrieve_by_id(self, social_network_id: uuid.UUID) -> SocialNetwork:
+        """Retrieve social network by id.
+
+        Args:
+            social_network_id (uuid.UUID): Social Network UUID ID.
+
+        Returns:
+            SocialNetwork: Social Network.
+        """
+
+    @abstractmethod
+    def retrieve_by_name(self, name: str) -> SocialNetwork:
+        """Retrieve social network by name.
+
+        Args:
+            name (str): Name of social network.
+
+        Returns:
+            SocialNetwork: Social Network.
+        """
+
+    @abstractmethod
+    async def publish_changed(self) -> None:
+        """Notify processes, call it after Social Networks change commit."""
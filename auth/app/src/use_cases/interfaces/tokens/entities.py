@@ -5,6 +5,10 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from uuid import UUID
 
+# Value of the type claim, a refresh token is not accepted for access.
+ACCESS_TOKEN_TYPE = 'access'  # noqa: S105 (Not a secret.)
+REFRESH_TOKEN_TYPE = 'refresh'  # noqa: S105 (Not a secret.)
+
 
 class IToken(ABC):
     """Abstract representation of a Token entity."""
@@ -54,3 +58,14 @@ class ITokenCreator(ABC):
         Returns:
             IToken: Instance of IToken class.
         """
+
+    @abstractmethod
+    def load_token(self, token: str) -> IToken:
+        """Load and verify encoded JWT token.
+
+        Args:
+            token (str): Json Web Token.
+
+        Returns:
+            IToken: Instance of IToken class.
+        """
@@ -0,0 +1,21 @@
+"""Module with DTO's for Sampling Use cases."""
+
+from typing import Annotated
+
+import pydantic as pd
+
+Rate = Annotated[float, pd.Field(ge=0, le=1)]
+
+
+class SamplingRatesDTO(pd.BaseModel):
+    """Sentry traces sampling rates data transfer object.
+
+    Args:
+        BaseModel (class): Base Pydantic class for models.
+    """
+
+    traces_rate: Rate
+    route_traces_rates: dict[str, Rate] = {}
+    slow_request_threshold: Annotated[float, pd.Field(gt=0)]
+    max_traces_per_second: Annotated[float, pd.Field(ge=0)]
+    profiles_rate: Rate
@@ -0,0 +1,102 @@
+"""Module with Sampling rates Use case."""
+
+import uuid
+
+from src.domain.repositories.user.exceptions import UserNotFoundError
+from src.domain.role.value_objects import AccessLevel
+from src.use_cases.exceptions import AccessDenied
+from src.use_cases.interfaces.database.unit_of_work import (
+    AbstractUnitOfWork as AbstractDatabaseUnitOfWork,
+)
+from src.use_cases.interfaces.sampling.rates import ISamplingRates
+from src.use_cases.interfaces.tokens.entities import (
+    ACCESS_TOKEN_TYPE,
+    ITokenCreator,
+)
+from src.use_cases.sampling.dto import SamplingRatesDTO
+
+
+class SamplingRatesUseCase:
+    """Read and change Sentry sampling rates, superusers only."""
+
+    def __init__(
+        self,
+        database_uow: AbstractDatabaseUnitOfWork,
+        tokens: ITokenCreator,
+        rates: ISamplingRates,
+    ) -> None:
+        """Init method.
+
+        Args:
+            database_uow (AbstractDatabaseUnitOfWork):
+            Unit of Work with main Database.
+            tokens (ITokenCreator): Fabric for create Tokens.
+            rates (ISamplingRates): Rates shared by all processes.
+        """
+        self.database_uow = database_uow
+        self.tokens = tokens
+        self.rates = rates
+
+    async def retrieve(self, access_token: str) -> SamplingRatesDTO:
+        """Retrieve rates used by the process.
+
+        Args:
+            access_token (str): Superuser JWT access token.
+
+        Returns:
+            SamplingRatesDTO: Current rates.
+        """
+        await self._check_superuser(access_token)
+        return self.rates.current()
+
+    async def change(
+        self, access_token: str, dto: SamplingRatesDTO,
+    ) -> SamplingRatesDTO:
+        """Change rates in all processes.
+
+        Args:
+            access_token (str): Superuser JWT access token.
+            dto (SamplingRatesDTO): New rates.
+
+        Returns:
+            SamplingRatesDTO: Applied rates.
+        """
+        await self._check_superuser(access_token)
+        await self.rates.publish(dto)
+        return dto
+
+    async def _check_superuser(self, access_token: str) -> None:
+        """Check token owner is superuser.
+
+        Args:
+            access_token (str): JWT access token.
+
+        Raises:
+            AccessDenied: If owner is not superuser or not found.
+        """
+        if not await self._is_superuser(access_token):
+            raise AccessDenied
+
+    async def _is_superuser(self, access_token: str) -> bool:
+        """Check access level of token owner.
+
+            Role is read from the primary, so a revoked access does not
+            live on a lagging replica.
+
+        Args:
+            access_token (str): JWT access token.
+
+        Returns:
+            bool: True if owner exists and is superuser.
+        """
+        payload = self.tokens.load_token(access_token).get_decoded_token()
+        if payload.get('type') != ACCESS_TOKEN_TYPE:
+            return False
+        async with self.database_uow(autocommit=False):
+            try:
+                user = await self.database_uow.user.retrieve_by_id(
+                    uuid.UUID(payload['uid']),
+                )
+            except UserNotFoundError:
+                return False
+        return user.user_service.role.check_access(AccessLevel.superuser)
@@ -0,0 +1,36 @@
+"""Module with Social Networks listing Use case."""
+
+from src.domain.social_network.dto import SocialNetworkDTO
+from src.use_cases.interfaces.social_networks.catalog import (
+    ISocialNetworkCatalog,
+)
+
+
+class ListSocialNetworksUseCase:
+    """List Social Networks from process-local catalog."""
+
+    def __init__(self, catalog: ISocialNetworkCatalog) -> None:
+        """Init method.
+
+        Args:
+            catalog (ISocialNetworkCatalog): Social Networks catalog.
+        """
+        self._catalog = catalog
+
+    def etag(self) -> str:
+        """Get strong entity tag of the current list.
+
+        Returns:
+            str: Quoted entity tag.
+        """
+        return self._catalog.etag
+
+    def execute(self) -> list[SocialNetworkDTO]:
+        """List Social Networks.
+
+        Returns:
+            list[SocialNetworkDTO]: Social Networks ordered by name.
+        """
+        return [
+            network.as_dto() for network in self._catalog.retrieve_all()
+        ]
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Annotated
+from datetime import date, datetime
+from typing import Annotated, Optional
 
 import pydantic as pd
-from passlib.context import CryptContext
 from pydantic_core import PydanticCustomError
+from src.domain.login_history.dto import LoginHistoryDTO
 from src.domain.user.dto import UserDTO
 
-pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
+BCRYPT_HASH_PATTERN = r'^\$2[abxy]\$\d{2}\$[./A-Za-z0-9]{53}$'
 
 
 class UserSignUpDTO(pd.BaseModel):
@@ -27,16 +28,6 @@ class UserSignUpDTO(pd.BaseModel):
         str, pd.StringConstraints(strip_whitespace=True),
     ]
 
-    @pd.model_validator(mode='after')
-    def serialize_model(self) -> UserSignUpDTO:
-        """Hash password.
-
-        Returns:
-            UserSignUpDTO: Return themself.
-        """
-        self.password = pwd_context.hash(self.password)
-        return self
-
 
 class UserSignInDTO(pd.BaseModel):
     """User sign in data transfer object.
@@ -76,3 +67,51 @@ class UserOutDTO(pd.BaseModel):
     user: UserDTO
     access_token: str
     refresh_token: str
+
+
+class LoginHistoryPageDTO(pd.BaseModel):
+    """Page of user login history.
+
+    Args:
+        BaseModel (class): Base Pydantic class for models.
+    """
+
+    entries: list[LoginHistoryDTO]
+    next_cursor: Optional[str] = None
+
+
+class UserImportDTO(pd.BaseModel):
+    """Imported user data transfer object.
+
+        Password is already hashed by bcrypt on the old platform
+        and is stored as is.
+
+    Args:
+        BaseModel (class): Base Pydantic class for models.
+    """
+
+    email: pd.EmailStr
+    login: Annotated[
+        str, pd.StringConstraints(max_length=60, strip_whitespace=True),
+    ]
+    password: Annotated[str, pd.StringConstraints(pattern=BCRYPT_HASH_PATTERN)]
+    full_name: Optional[
+        Annotated[
+            str, pd.StringConstraints(max_length=60, strip_whitespace=True),
+        ]
+    ] = None
+    birthday: Optional[date] = None
+    phone_number: Optional[
+        Annotated[
+            str, pd.StringConstraints(max_length=24, strip_whitespace=True),
+        ]
+    ] = None
+    bio: Optional[Annotated[str, pd.StringConstraints(max_length=1000)]] = None
+    role: Optional[
+        Annotated[
+            str, pd.StringConstraints(max_length=24, strip_whitespace=True),
+        ]
+    ] = None
+    active: bool = True
+    verified: bool = False
+    created_at: Optional[datetime] = None
@@ -0,0 +1,81 @@
+"""Module with Login History Use case."""
+
+import uuid
+from typing import Optional
+
+from src.domain.login_history.value_objects import LoginHistoryCursor
+from src.tracing import USE_CASE, traced
+from src.use_cases.exceptions import TokenNotValid
+from src.use_cases.interfaces.database.unit_of_work import (
+    AbstractUnitOfWork as AbstractDatabaseUnitOfWork,
+)
+from src.use_cases.interfaces.tokens.entities import (
+    ACCESS_TOKEN_TYPE,
+    ITokenCreator,
+)
+from src.use_cases.user.dto import LoginHistoryPageDTO
+
+
+class LoginHistoryUseCase:
+    """User login history Use case."""
+
+    def __init__(
+        self,
+        database_uow: AbstractDatabaseUnitOfWork,
+        tokens: ITokenCreator,
+    ) -> None:
+        """Init method.
+
+        Args:
+            database_uow (AbstractDatabaseUnitOfWork):
+            Unit of Work with main Database.
+            tokens (ITokenCreator): Fabric for create Tokens.
+        """
+        self.database_uow = database_uow
+        self.tokens = tokens
+
+    @traced(USE_CASE)
+    async def execute(
+        self,
+        access_token: str,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> LoginHistoryPageDTO:
+        """Retrieve page of login history of the token owner.
+
+            One extra entry is requested to find out
+            whether the next page exists.
+
+        Args:
+            access_token (str): User JWT access token.
+            limit (int): Page size.
+            cursor (str, optional): Cursor returned with the previous page.
+
+        Raises:
+            TokenNotValid: If token is not a valid access token.
+
+        Returns:
+            LoginHistoryPageDTO: Login entries and cursor of the next page.
+        """
+        payload = self.tokens.load_token(access_token).get_decoded_token()
+        if payload.get('type') != ACCESS_TOKEN_TYPE:
+            raise TokenNotValid('Not an access token.')
+        page_cursor = LoginHistoryCursor.decode(cursor) if cursor else None
+
+        async with self.database_uow(autocommit=False, read_only=True):
+            repository = self.database_uow.login_history
+            entries = await repository.retrieve_page_by_user_id(
+                uuid.UUID(payload['uid']), limit + 1, page_cursor,
+            )
+
+        next_cursor: Optional[str] = None
+        if len(entries) > limit:
+            entries = entries[:limit]
+            last_entry = entries[-1].as_dto()
+            next_cursor = LoginHistoryCursor(
+                created_at=last_entry.created_at, id=last_entry.id,
+            ).encode()
+        return LoginHistoryPageDTO(
+            entries=[entry.as_dto() for entry in entries],
+            next_cursor=next_cursor,
+        )
@@ -0,0 +1,95 @@
+"""Module with bulk Role reassignment Use case."""
+
+import logging
+import uuid
+from itertools import islice
+from typing import Callable, Iterable, Iterator
+
+from src.tracing import USE_CASE, traced
+from src.use_cases.interfaces.database.unit_of_work import (
+    AbstractUnitOfWork as AbstractDatabaseUnitOfWork,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 5000
+
+
+def chunked(
+    user_ids: Iterable[uuid.UUID], size: int,
+) -> Iterator[list[uuid.UUID]]:
+    """Split stream of IDs to sorted chunks.
+
+        Sorted chunks lock rows in the same order in every transaction,
+        so concurrent reassignments wait for each other instead of
+        deadlocking.
+
+    Args:
+        user_ids (Iterable[uuid.UUID]): Users UUID IDs.
+        size (int): Chunk size.
+
+    Yields:
+        Iterator[list[uuid.UUID]]: Chunks of IDs.
+    """
+    iterator = iter(user_ids)
+    while True:  # noqa: WPS457 (Until IDs are exhausted.)
+        chunk = sorted(set(islice(iterator, size)))
+        if not chunk:
+            return
+        yield chunk
+
+
+class ReassignRoleUseCase:
+    """Move many users to the role, for example after billing changes."""
+
+    def __init__(
+        self,
+        database_uow_factory: Callable[[], AbstractDatabaseUnitOfWork],
+    ) -> None:
+        """Init method.
+
+        Args:
+            database_uow_factory (Callable[[], AbstractDatabaseUnitOfWork]):
+            Factory for create Database Units of Work.
+        """
+        self.database_uow_factory = database_uow_factory
+
+    @traced(USE_CASE)
+    async def execute(
+        self,
+        user_ids: Iterable[uuid.UUID],
+        role_name: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """Reassign role of users.
+
+            Every chunk is one UPDATE in its own transaction, so row locks
+            are held for the time of one chunk only and memory does not
+            depend on number of users.
+
+        Args:
+            user_ids (Iterable[uuid.UUID]): Users UUID IDs.
+            role_name (str): Name of the new role.
+            chunk_size (int): Number of users per transaction.
+
+        Returns:
+            int: Number of users whose role was changed.
+        """
+        uow = self.database_uow_factory()
+        async with uow(autocommit=False):
+            role = await uow.role.retrieve_by_name(role_name)
+
+        changed = 0
+        for chunk in chunked(user_ids, chunk_size):
+            uow = self.database_uow_factory()
+            async with uow(autocommit=True):
+                updated = await uow.user_service.update_role_by_user_ids(
+                    chunk, role,
+                )
+            changed += len(updated)
+            logger.info('Role set for users.', extra={
+                'role': role_name,
+                'updated': len(updated),
+                'count': len(chunk),
+            })
+        return changed
@@ -2,7 +2,9 @@
 
 import logging
 
+from src.domain.login_history.entities import LoginHistory
 from src.domain.user.entities import User
+from src.tracing import USE_CASE, traced
 from src.use_cases.exceptions import PasswordNotCorrect
 from src.use_cases.interfaces.cache.unit_of_work import (
     AbstractUnitOfWork as AbstractCacheUnitOfWork,
@@ -10,8 +12,10 @@ from src.use_cases.interfaces.cache.unit_of_work import (
 from src.use_cases.interfaces.database.unit_of_work import (
     AbstractUnitOfWork as AbstractDatabaseUnitOfWork,
 )
+from src.use_cases.interfaces.hashing.hasher import IPasswordHasher
+from src.use_cases.interfaces.login_history.writer import ILoginHistoryWriter
 from src.use_cases.interfaces.tokens.entities import ITokenCreator
-from src.use_cases.user.dto import UserOutDTO, UserSignInDTO, pwd_context
+from src.use_cases.user.dto import UserOutDTO, UserSignInDTO
 
 logger = logging.getLogger(__name__)
 
@@ -19,11 +23,13 @@ logger = logging.getLogger(__name__)
 class SignInUseCase:
     """User login Use case."""
 
-    def __init__(
+    def __init__(  # noqa: WPS211 (Dependencies of the use case.)
         self,
         cache_uow: AbstractCacheUnitOfWork,
         database_uow: AbstractDatabaseUnitOfWork,
         tokens: ITokenCreator,
+        login_history: ILoginHistoryWriter,
+        hasher: IPasswordHasher,
     ) -> None:
         """Init method.
 
@@ -32,16 +38,24 @@ class SignInUseCase:
             database_uow (AbstractDatabaseUnitOfWork):
             Unit of Work with main Database.
             tokens (ITokenCreator): Fabric for create Tokens.
+            login_history (ILoginHistoryWriter): Writer of login entries.
+            hasher (IPasswordHasher): Hasher of passwords.
         """
         self.cache_uow = cache_uow
         self.database_uow = database_uow
         self.tokens = tokens
+        self.login_history = login_history
+        self.hasher = hasher
 
-    async def execute(self, dto: UserSignInDTO) -> UserOutDTO:
+    @traced(USE_CASE)
+    async def execute(
+        self, dto: UserSignInDTO, user_agent: str = '',
+    ) -> UserOutDTO:
         """User signin use case.
 
         Args:
             dto (UserSignInDTO): DTO with info for user login.
+            user_agent (str): HTTP Header intended to identify User.
 
         Raises:
             PasswordNotCorrect: If password not correct, throw this.
@@ -54,7 +68,7 @@ class SignInUseCase:
             dto.credential_is_email,
         )
         user_as_dto = user.as_dto()
-        if not pwd_context.verify(dto.password, user_as_dto.password):
+        if not await self.hasher.verify(dto.password, user_as_dto.password):
             raise PasswordNotCorrect
 
         access_token = self.tokens.create_access_token(user_as_dto.id)
@@ -65,12 +79,15 @@ class SignInUseCase:
                 user_as_dto.id,
                 refresh_token,
             )
-            logger.debug('Insert tokens to Redis for user ({uid})'.format(
-                uid=user_as_dto.id,
-                ),
+            logger.debug(
+                'Insert tokens to Redis for user.',
+                extra={'uid': user_as_dto.id},
             )
 
-        logger.info('User {uid} logged in account.'.format(uid=user_as_dto.id))
+        self.login_history.record(
+            LoginHistory.create(uid=user_as_dto.id, user_agent=user_agent),
+        )
+        logger.info('User logged in account.', extra={'uid': user_as_dto.id})
 
         return UserOutDTO(
             user=user_as_dto,
@@ -90,7 +107,7 @@ class SignInUseCase:
         Returns:
             User: Retrieved user.
         """
-        async with self.database_uow(autocommit=True):
+        async with self.database_uow(autocommit=False, read_only=True):
             if credential_is_email:
                 return await self.database_uow.user.retrieve_by_email(
                     credential,
@@ -10,12 +10,14 @@ from src.domain.repositories.user.exceptions import (
 from src.domain.role.entities import Role
 from src.domain.user.entities import User
 from src.domain.user_service.entities import UserService
+from src.tracing import USE_CASE, traced
 from src.use_cases.interfaces.cache.unit_of_work import (
     AbstractUnitOfWork as AbstractCacheUnitOfWork,
 )
 from src.use_cases.interfaces.database.unit_of_work import (
     AbstractUnitOfWork as AbstractDatabaseUnitOfWork,
 )
+from src.use_cases.interfaces.hashing.hasher import IPasswordHasher
 from src.use_cases.interfaces.tokens.entities import ITokenCreator
 from src.use_cases.user.dto import UserOutDTO, UserSignUpDTO
 
@@ -30,6 +32,7 @@ class SignUpUseCase:
         cache_uow: AbstractCacheUnitOfWork,
         database_uow: AbstractDatabaseUnitOfWork,
         tokens: ITokenCreator,
+        hasher: IPasswordHasher,
     ) -> None:
         """Init method.
 
@@ -38,11 +41,14 @@ class SignUpUseCase:
             database_uow (AbstractDatabaseUnitOfWork):
             Unit of Work with main Database.
             tokens (ITokenCreator): Fabric for create Tokens.
+            hasher (IPasswordHasher): Hasher of passwords.
         """
         self.cache_uow = cache_uow
         self.database_uow = database_uow
         self.tokens = tokens
+        self.hasher = hasher
 
+    @traced(USE_CASE)
     async def execute(self, dto: UserSignUpDTO) -> UserOutDTO:
         """Register User.
 
@@ -59,10 +65,8 @@ class SignUpUseCase:
         exists = await self._check_user_exists(dto.email, dto.login)
         if exists:
             logger.debug(
-                'Attempt to create a user [{email}, {login}],'.format(
-                    email=dto.email, login=dto.login,
-                )
-                + ' but it has already been created.',
+                'Attempt to create a user, but it has already been created.',
+                extra={'email': dto.email, 'login': dto.login},
             )
             raise UserAlreadyExists
 
@@ -73,8 +77,10 @@ class SignUpUseCase:
                 logger.error('Base role for new users not found.')
                 raise err
 
+        # Hashed after checks, taken login costs no hashing.
+        password = await self.hasher.hash(dto.password)
         created_user = await self._insert_user(
-            role, dto.email, dto.login, dto.password,
+            role, dto.email, dto.login, password,
         )
         access_token = self.tokens.create_access_token(created_user.id)
         refresh_token = self.tokens.create_refresh_token(created_user.id)
@@ -84,9 +90,9 @@ class SignUpUseCase:
                 created_user.id, refresh_token,
             )
 
-        logger.info('New user created - [{email}, {login}]'.format(
-            email=dto.email, login=dto.login,
-            ),
+        logger.info(
+            'New user created.',
+            extra={'email': dto.email, 'login': dto.login},
         )
         return UserOutDTO(
             user=created_user.as_dto(),
@@ -0,0 +1,20 @@
+"""Fixtures shared by tests."""
+
+from typing import Iterator
+
+import pytest
+from pydantic import ValidationError
+from src.config import PostgreSQLSettings
+
+
+@pytest.fixture(name='settings')
+def fixture_settings() -> Iterator[PostgreSQLSettings]:
+    """Read settings of the Database.
+
+    Yields:
+        Iterator[PostgreSQLSettings]: Settings, test skipped without them.
+    """
+    try:
+        yield PostgreSQLSettings()
+    except ValidationError:
+        pytest.skip('Database is not configured.')
@@ -0,0 +1,105 @@
+"""Helpers of tests which need the Database."""
+
+from typing import Any, Optional
+
+import pytest
+import sqlalchemy as sa
+from src.config import PostgreSQLSettings
+from src.domain.user.entities import User
+from src.domain.user_service.entities import UserService
+from src.infrastructure.databases import PostgreSQL
+from src.infrastructure.interfaces.database.unit_of_work import UnitOfWork
+from src.infrastructure.models import User as UserORM
+from src.infrastructure.models import UserService as UserServiceORM
+
+PASSWORD = 'password'  # noqa: S105 (Not a secret.)
+
+
+async def connect(settings: PostgreSQLSettings) -> PostgreSQL:
+    """Create Database, test is skipped if it does not answer.
+
+    Args:
+        settings (PostgreSQLSettings): Settings for PostgreSQL.
+
+    Returns:
+        PostgreSQL: Database with primary and replicas.
+    """
+    postgresql = PostgreSQL(settings)
+    try:
+        await postgresql.ping()
+    except OSError as exc:
+        pytest.skip('Database is not available: {0}'.format(exc))
+    return postgresql
+
+
+async def dispose(postgresql: PostgreSQL) -> None:
+    """Close connections of the primary and replicas.
+
+    Args:
+        postgresql (PostgreSQL): Database to close.
+    """
+    for engine in postgresql.engines:
+        await engine.dispose()
+
+
+async def insert_user(uow: UnitOfWork, suffix: str) -> User:
+    """Insert user with unique email and login.
+
+    Args:
+        uow (UnitOfWork): Database Unit of Work.
+        suffix (str): Part of email and login.
+
+    Returns:
+        User: Inserted user.
+    """
+    async with uow(autocommit=True):
+        role = await uow.role.retrieve_base_role()
+        user_service = await uow.user_service.insert(
+            UserService.create(role=role),
+        )
+        return await uow.user.insert(User.create(
+            email='test-{0}@example.com'.format(suffix),
+            login='test-{0}'.format(suffix),
+            password=PASSWORD,
+            user_service=user_service,
+        ))
+
+
+async def delete_users(postgresql: PostgreSQL, users: list[User]) -> None:
+    """Delete inserted users and their services.
+
+    Args:
+        postgresql (PostgreSQL): Database.
+        users (list[User]): Inserted users.
+    """
+    ids = [user.id for user in users]
+    async with postgresql.sessionmaker() as session:
+        await session.execute(
+            sa.delete(UserORM).where(UserORM.id.in_(ids)),
+        )
+        await session.execute(
+            sa.delete(UserServiceORM).where(UserServiceORM.id.in_(ids)),
+        )
+        await session.commit()
+
+
+async def execute(
+    postgresql: PostgreSQL,
+    statement: str,
+    statement_params: Optional[dict] = None,
+) -> list[Any]:
+    """Execute SQL statement and commit.
+
+    Args:
+        postgresql (PostgreSQL): Database.
+        statement (str): SQL statement.
+        statement_params (Optional[dict]): Statement parameters.
+
+    Returns:
+        list[Any]: First column of returned rows, empty if none.
+    """
+    async with postgresql.sessionmaker() as session:
+        res = await session.execute(sa.text(statement), statement_params)
+        column = list(res.scalars().all()) if res.returns_rows else []
+        await session.commit()
+    return column
@@ -0,0 +1,82 @@
+"""Tests of statements captured for query plan checks."""
+
+import asyncio
+from typing import Any
+
+from src.commands.check_query_plans import (
+    StatementRecorder,
+    capture_statements,
+    seq_scans,
+)
+from src.config import PostgreSQLSettings
+from src.infrastructure.databases import PostgreSQL
+from tests.database import connect, dispose
+
+Statements = list[tuple[str, Any]]
+
+
+async def capture(settings: PostgreSQLSettings) -> Statements:
+    """Capture statements, test is skipped if Database does not answer.
+
+    Args:
+        settings (PostgreSQLSettings): Settings for PostgreSQL.
+
+    Returns:
+        Statements: Statements with their parameters.
+    """
+    postgresql = await connect(settings)
+    statements = await capture_statements(postgresql)
+    await dispose(postgresql)
+    return statements
+
+
+def test_recorder_keeps_selects() -> None:
+    """Only SELECT statements are recorded."""
+    recorder = StatementRecorder()
+    recorder(statement='  select 1', parameters=())
+    recorder(statement='INSERT INTO role VALUES (1)', parameters=())
+    recorder(statement='SET LOCAL statement_timeout = 1', parameters=())
+    assert recorder.statements == [('  select 1', ())]
+
+
+def test_seq_scans_in_child_plans() -> None:
+    """Sequential scans are found in child plans."""
+    plan = {
+        'Node Type': 'Nested Loop',
+        'Plans': [
+            {'Node Type': 'Index Scan', 'Relation Name': 'user'},
+            {'Node Type': 'Seq Scan', 'Relation Name': 'role'},
+        ],
+    }
+    assert list(seq_scans(plan)) == ['role']
+
+
+def test_capture_lookups(settings: PostgreSQLSettings) -> None:
+    """Lookups of both scopes are recorded on the primary.
+
+    Args:
+        settings (PostgreSQLSettings): Settings of the Database.
+    """
+    statements = asyncio.run(capture(settings))
+    assert statements
+    assert all(
+        statement.lstrip().upper().startswith('SELECT')
+        for statement, _ in statements
+    )
+
+
+def test_capture_replica_lookups(settings: PostgreSQLSettings) -> None:
+    """Lookups routed to replicas are recorded as well.
+
+    Args:
+        settings (PostgreSQLSettings): Settings of the Database.
+    """
+    primary_only = asyncio.run(capture(settings))
+    # Primary stands for the replica, read-only scope is routed to it.
+    replica_dsn = PostgreSQL(settings).engine.url.render_as_string(
+        hide_password=False,
+    )
+    with_replica = asyncio.run(capture(settings.model_copy(update={
+        'db_replica_dsns': [replica_dsn],
+    })))
+    assert len(with_replica) == len(primary_only)
@@ -0,0 +1,181 @@
+"""Tests of Login History partitions maintenance."""
+
+import asyncio
+import uuid
+from datetime import UTC, date, datetime, time
+
+from src.config import PostgreSQLSettings
+from src.infrastructure.databases import PostgreSQL
+from src.infrastructure.interfaces.database.unit_of_work import UnitOfWork
+from src.infrastructure.partitions import (
+    DEFAULT_PARTITION,
+    MONTHS_IN_YEAR,
+    PARENT_TABLE,
+    PARTITIONS_QUERY,
+    LoginHistoryPartitionManager,
+    add_months,
+    partition_month,
+)
+from tests.database import connect, delete_users, dispose, execute, insert_user
+
+# Older than any partition created by migrations.
+EXPIRED_MONTH = date.fromisoformat('2000-01-01')
+EXPIRED_PARTITION = '{0}_{1}'.format(
+    PARENT_TABLE, EXPIRED_MONTH.strftime('%Y_%m'),
+)
+INSERT_ENTRY = """
+    INSERT INTO "{schema}".login_history (
+        id, user_id, user_agent, created_at, updated_at
+    ) VALUES (:id, :user_id, 'test', :created_at, :created_at)
+"""
+ENTRY_PARTITION = """
+    SELECT pg_class.relname FROM "{schema}".login_history
+    JOIN pg_class ON pg_class.oid = login_history.tableoid
+    WHERE login_history.id = :id
+"""
+CREATE_PARTITION = """
+    CREATE TABLE "{schema}"."{name}" PARTITION OF "{schema}".login_history
+    FOR VALUES FROM ('{start}+00') TO ('{end}+00')
+"""
+EXISTING_TABLE = 'SELECT to_regclass(:name)::text'
+
+
+def months_since(month_start: date) -> int:
+    """Count months from month start to the current month.
+
+    Args:
+        month_start (date): First day of month.
+
+    Returns:
+        int: Number of months, negative for future months.
+    """
+    now = datetime.now(UTC)
+    return (
+        (now.year - month_start.year) * MONTHS_IN_YEAR
+        + now.month - month_start.month
+    )
+
+
+async def create_over_default(
+    postgresql: PostgreSQL, schema: str, user_id: uuid.UUID,
+) -> tuple[list[str], list[str]]:
+    """Create partition of month with an entry in the DEFAULT partition.
+
+    Args:
+        postgresql (PostgreSQL): Database.
+        schema (str): Database schema with login_history table.
+        user_id (uuid.UUID): ID of the user of the entry.
+
+    Returns:
+        tuple[list[str], list[str]]: Created partitions, and partitions
+        holding the entry before and after.
+    """
+    names = await execute(
+        postgresql,
+        PARTITIONS_QUERY,
+        {'parent': PARENT_TABLE, 'schema': schema},
+    )
+    month_start = add_months(max(filter(None, map(partition_month, names))), 1)
+    entry = {'id': uuid.uuid4()}
+    created_at = datetime.combine(month_start, time(), UTC)
+    await execute(
+        postgresql,
+        INSERT_ENTRY.format(schema=schema),
+        {'user_id': user_id, 'created_at': created_at, **entry},
+    )
+    holders = await execute(
+        postgresql, ENTRY_PARTITION.format(schema=schema), entry,
+    )
+    created = await LoginHistoryPartitionManager(
+        postgresql.sessionmaker, schema,
+    ).create_partitions(-months_since(month_start))
+    holders += await execute(
+        postgresql, ENTRY_PARTITION.format(schema=schema), entry,
+    )
+    return created, holders
+
+
+async def default_rows_scenario(  # noqa: WPS217 (Steps of the scenario.)
+    settings: PostgreSQLSettings,
+) -> tuple[list[str], list[str]]:
+    """Create partition over the DEFAULT partition and clean up.
+
+    Args:
+        settings (PostgreSQLSettings): Settings for PostgreSQL.
+
+    Returns:
+        tuple[list[str], list[str]]: Created partitions, and partitions
+        holding the entry before and after.
+    """
+    postgresql = await connect(settings)
+    user = await insert_user(UnitOfWork(postgresql), uuid.uuid4().hex)
+    created, holders = await create_over_default(
+        postgresql, settings.db_schema, user.id,
+    )
+    await delete_users(postgresql, [user])
+    for name in created:
+        await execute(postgresql, 'DROP TABLE "{0}"."{1}"'.format(
+            settings.db_schema, name,
+        ))
+    await dispose(postgresql)
+    return created, holders
+
+
+async def expire_scenario(  # noqa: WPS217 (Steps of the scenario.)
+    settings: PostgreSQLSettings,
+) -> tuple[list[str], list[str], list[str]]:
+    """Expire old partition without drop, then with drop.
+
+    Args:
+        settings (PostgreSQLSettings): Settings for PostgreSQL.
+
+    Returns:
+        tuple[list[str], list[str], list[str]]: Partitions detached,
+        then dropped, and tables left with the partition name.
+    """
+    postgresql = await connect(settings)
+    await execute(postgresql, CREATE_PARTITION.format(
+        schema=settings.db_schema,
+        name=EXPIRED_PARTITION,
+        start=EXPIRED_MONTH,
+        end=add_months(EXPIRED_MONTH, 1),
+    ))
+    manager = LoginHistoryPartitionManager(
+        postgresql.sessionmaker, settings.db_schema,
+    )
+    # Only the partition of the expired month is older than retention.
+    retention = months_since(add_months(EXPIRED_MONTH, 1))
+    detached = await manager.expire_partitions(retention, drop=False)
+    dropped = await manager.expire_partitions(retention, drop=True)
+    left = await execute(postgresql, EXISTING_TABLE, {
+        'name': '"{0}"."{1}"'.format(settings.db_schema, EXPIRED_PARTITION),
+    })
+    await dispose(postgresql)
+    return detached, dropped, left
+
+
+def test_create_partition_moves_default_rows(
+    settings: PostgreSQLSettings,
+) -> None:
+    """Rows of the month are moved from the DEFAULT partition.
+
+    Args:
+        settings (PostgreSQLSettings): Settings of the Database.
+    """
+    created, holders = asyncio.run(default_rows_scenario(settings))
+    assert len(created) == 1
+    assert holders == [DEFAULT_PARTITION, created[0]]
+
+
+def test_detached_partition_dropped_later(
+    settings: PostgreSQLSettings,
+) -> None:
+    """Partition detached without drop is dropped by the next run.
+
+    Args:
+        settings (PostgreSQLSettings): Settings of the Database.
+    """
+    detached, dropped, left = asyncio.run(expire_scenario(settings))
+    assert detached == [EXPIRED_PARTITION]
+    assert dropped == [EXPIRED_PARTITION]
+    assert left == [None]
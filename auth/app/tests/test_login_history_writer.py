@@ -0,0 +1,129 @@
+"""Tests of retries of the Login History writer."""
+
+import asyncio
+import uuid
+from types import TracebackType
+from typing import Optional, Type
+
+from src.config import LoginHistorySettings
+from src.domain.login_history.entities import LoginHistory
+from src.infrastructure.interfaces.login_history.writer import (
+    LoginHistoryWriter,
+)
+
+BATCH_SIZE = 2
+FLUSH_INTERVAL = 0.2
+# Timer of the event loop may fire a little early.
+TOLERANCE = 0.9
+
+
+class FailingRepository:  # noqa: WPS306 (Without Base class.)
+    """Login History repository failing the first inserts."""
+
+    def __init__(self, failures: int) -> None:
+        """Init method.
+
+        Args:
+            failures (int): Number of inserts to fail.
+        """
+        self.failures = failures
+        self.attempted_at: list[float] = []
+        self.saved: list[LoginHistory] = []
+
+    async def insert_many(self, entities: list[LoginHistory]) -> None:
+        """Fail or save entries.
+
+        Args:
+            entities (list[LoginHistory]): entities of LoginHistory class.
+
+        Raises:
+            ConnectionError: While failures are left.
+        """
+        self.attempted_at.append(asyncio.get_running_loop().time())
+        if len(self.attempted_at) <= self.failures:
+            raise ConnectionError('Database is down.')
+        self.saved.extend(entities)
+
+
+class FakeUnitOfWork:  # noqa: WPS306 (Without Base class.)
+    """Unit of Work with the failing repository only."""
+
+    def __init__(self, repository: FailingRepository) -> None:
+        """Init method.
+
+        Args:
+            repository (FailingRepository): Login History repository.
+        """
+        self.login_history = repository
+
+    def __call__(self, autocommit: bool) -> 'FakeUnitOfWork':
+        """Enter scope.
+
+        Args:
+            autocommit (bool): Ignored.
+
+        Returns:
+            FakeUnitOfWork: Return itself.
+        """
+        return self
+
+    async def __aenter__(self) -> 'FakeUnitOfWork':
+        """Enter scope.
+
+        Returns:
+            FakeUnitOfWork: Return itself.
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> bool:
+        """Exit scope, exceptions are raised further.
+
+        Args:
+            exc_type (Optional[Type[BaseException]]): Exception Type
+            exc_val (Optional[BaseException]): Instance of Exception
+            exc_tb (Optional[TracebackType]): Traceback.
+
+        Returns:
+            bool: False to raise exceptions.
+        """
+        return False
+
+
+async def write_full_batch(repository: FailingRepository) -> None:
+    """Record a full batch and wait until it is saved.
+
+    Args:
+        repository (FailingRepository): Login History repository.
+    """
+    uow = FakeUnitOfWork(repository)
+    writer = LoginHistoryWriter(
+        lambda: uow,  # type: ignore[arg-type,return-value]
+        LoginHistorySettings(
+            login_history_batch_size=BATCH_SIZE,
+            login_history_flush_interval=FLUSH_INTERVAL,
+        ),
+    )
+    writer.start()
+    for _ in range(BATCH_SIZE):
+        writer.record(LoginHistory.create(uid=uuid.uuid4(), user_agent='test'))
+    while not repository.saved:
+        await asyncio.sleep(FLUSH_INTERVAL / 10)
+    await writer.stop()
+
+
+def test_failed_full_batch_waits_interval() -> None:
+    """Full batch is saved again only after the flush interval."""
+    repository = FailingRepository(failures=2)
+    asyncio.run(write_full_batch(repository))
+    attempts = repository.attempted_at
+    assert len(attempts) == 3
+    assert len(repository.saved) == BATCH_SIZE
+    assert all(
+        later - earlier >= FLUSH_INTERVAL * TOLERANCE
+        for earlier, later in zip(attempts, attempts[1:])
+    )
@@ -0,0 +1,156 @@
+"""Tests of lookup plans against the migrated schema."""
+
+import asyncio
+import uuid
+from contextlib import suppress
+from typing import Any, Callable, Coroutine, Iterator, Optional
+
+import pytest
+import sqlalchemy as sa
+from src.commands.check_query_plans import (
+    NOT_FOUND,
+    PAGE_SIZE,
+    StatementRecorder,
+    capture_statements,
+    explain,
+    seq_scans,
+)
+from src.config import PostgreSQLSettings
+from src.infrastructure.databases import PostgreSQL
+from src.infrastructure.interfaces.database.unit_of_work import UnitOfWork
+from tests.database import connect, dispose
+
+PROBE_ID = uuid.uuid4()
+PROBE_EMAIL = 'Probe@Example.com'
+PROBE_ACCOUNT = 'probe'
+Statements = list[tuple[str, Any]]
+Lookup = Callable[[UnitOfWork], Coroutine[Any, Any, Any]]
+# Hot lookups with the index serving each of them, partitions of
+# Login History have their own copies of the partitioned index.
+HOT_LOOKUPS = (
+    (
+        lambda unit: unit.user.retrieve_by_email(PROBE_EMAIL),
+        'uq_user_email_lower',
+    ),
+    (
+        lambda unit: unit.user_social_account.retrieve_by_social_account(
+            PROBE_ID, PROBE_ACCOUNT,
+        ),
+        'uq_user_social_account_social_network_id_social_account_id',
+    ),
+    (
+        lambda unit: unit.login_history.retrieve_page_by_user_id(
+            PROBE_ID, PAGE_SIZE,
+        ),
+        'user_created_idx',
+    ),
+)
+
+
+async def capture_lookup(postgresql: PostgreSQL, lookup: Lookup) -> Statements:
+    """Run one lookup and capture its statements.
+
+    Args:
+        postgresql (PostgreSQL): Database to run the lookup against.
+        lookup (Lookup): Repository lookup.
+
+    Returns:
+        Statements: Statements with their parameters.
+    """
+    recorder = StatementRecorder()
+    engine = postgresql.engine.sync_engine
+    sa.event.listen(engine, 'before_cursor_execute', recorder, named=True)
+    uow = UnitOfWork(postgresql)
+    async with uow(autocommit=False):
+        with suppress(*NOT_FOUND):
+            await lookup(uow)
+    sa.event.remove(engine, 'before_cursor_execute', recorder)
+    return recorder.statements
+
+
+async def explain_all(
+    postgresql: PostgreSQL, statements: Statements,
+) -> list[dict]:
+    """Explain statements with sequential scans disabled, as the command.
+
+    Args:
+        postgresql (PostgreSQL): Database to explain statements on.
+        statements (Statements): Statements with their parameters.
+
+    Returns:
+        list[dict]: Plans of statements.
+    """
+    async with postgresql.engine.connect() as conn:
+        await conn.exec_driver_sql('SET enable_seqscan = off')
+        return [
+            await explain(conn, statement, statement_params)
+            for statement, statement_params in statements
+        ]
+
+
+async def plan_lookups(
+    settings: PostgreSQLSettings, lookup: Optional[Lookup] = None,
+) -> list[dict]:
+    """Explain statements of one lookup or of all lookups of the command.
+
+    Args:
+        settings (PostgreSQLSettings): Settings for PostgreSQL.
+        lookup (Optional[Lookup]): Repository lookup, None for all of them.
+
+    Returns:
+        list[dict]: Plans of statements.
+    """
+    postgresql = await connect(settings)
+    if lookup:
+        statements = await capture_lookup(postgresql, lookup)
+    else:
+        statements = await capture_statements(postgresql)
+    plans = await explain_all(postgresql, statements)
+    await dispose(postgresql)
+    return plans
+
+
+def index_names(plan: dict) -> Iterator[str]:
+    """Find indexes used by plan.
+
+    Args:
+        plan (dict): Node of JSON plan.
+
+    Yields:
+        Iterator[str]: Names of indexes.
+    """
+    name = plan.get('Index Name')
+    if name:
+        yield name
+    for child in plan.get('Plans', []):
+        yield from index_names(child)
+
+
+def test_lookups_use_indexes(settings: PostgreSQLSettings) -> None:
+    """No lookup of the command reads a table by sequential scan.
+
+    Args:
+        settings (PostgreSQLSettings): Settings of the Database.
+    """
+    plans = asyncio.run(plan_lookups(settings))
+    assert plans
+    relations = [relation for plan in plans for relation in seq_scans(plan)]
+    assert not relations
+
+
+@pytest.mark.parametrize(('lookup', 'index'), HOT_LOOKUPS)
+def test_hot_lookup_uses_index(
+    settings: PostgreSQLSettings, lookup: Lookup, index: str,
+) -> None:
+    """Hot lookup is served by its index.
+
+    Args:
+        settings (PostgreSQLSettings): Settings of the Database.
+        lookup (Lookup): Repository lookup.
+        index (str): Name, or suffix of names of partition indexes.
+    """
+    plans = asyncio.run(plan_lookups(settings, lookup))
+    assert plans
+    for plan in plans:
+        assert not list(seq_scans(plan))
+        assert any(name.endswith(index) for name in index_names(plan))
@@ -0,0 +1,105 @@
+"""Tests of route settings keyed by route template."""
+
+import asyncio
+from http import HTTPStatus
+from typing import Any
+
+from src.api.middlewares import DeadlineMiddleware
+from src.config import SamplingSettings
+from src.infrastructure.routes import route_template
+from src.infrastructure.sampling import TraceSampler
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+ROOT_PATH = '/auth'
+TEMPLATE = '/api/v1/user/{user_id}/'
+USER_PATH = '/api/v1/user/42/'
+SLOW_REQUEST = 1.0
+
+
+async def slow_endpoint(request: Request) -> Response:
+    """Answer after the route timeout.
+
+    Args:
+        request (Request): Request.
+
+    Returns:
+        Response: Empty response.
+    """
+    await asyncio.sleep(SLOW_REQUEST)
+    return Response()
+
+
+ROUTES = (Route(TEMPLATE, endpoint=slow_endpoint),)
+
+
+def http_scope(path: str) -> dict[str, Any]:
+    """Build scope of request behind the root path.
+
+    Args:
+        path (str): Path of the request, without the root path.
+
+    Returns:
+        dict[str, Any]: ASGI connection scope.
+    """
+    return {
+        'type': 'http',
+        'method': 'GET',
+        'root_path': ROOT_PATH,
+        'path': '{0}{1}'.format(ROOT_PATH, path),
+        'headers': [],
+        'query_string': b'',
+    }
+
+
+async def answer_status(app: Starlette, path: str) -> int:
+    """Call application and return status of its answer.
+
+    Args:
+        app (Starlette): ASGI application.
+        path (str): Path of the request, without the root path.
+
+    Returns:
+        int: Status code.
+    """
+    received: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+    received.put_nowait({'type': 'http.request', 'body': b''})
+    sent: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+    await app(http_scope(path), received.get, sent.put)
+    return sent.get_nowait()['status']
+
+
+def test_route_template() -> None:
+    """Template is found without the root path and parameters."""
+    assert route_template(ROUTES, http_scope(USER_PATH)) == TEMPLATE
+    assert route_template(ROUTES, http_scope('/missing/')) is None
+
+
+def test_sampler_rate_by_template() -> None:
+    """Sampler takes the rate of the route template."""
+    sampler = TraceSampler(SamplingSettings(
+        sentry_traces_rate=0,
+        sentry_route_traces_rates={TEMPLATE: 1},
+        sentry_max_traces_per_second=1,
+    ))
+    sampler.routes = ROUTES
+    event = {'contexts': {'trace': {'trace_id': 'picked'}}}
+    assert sampler.traces_sampler({
+        'asgi_scope': http_scope(USER_PATH),
+        'transaction_context': {'trace_id': 'picked'},
+    }) == 1
+    assert sampler.before_send_transaction(event, {}) == event
+
+
+def test_deadline_by_template() -> None:
+    """Deadline middleware takes the timeout of the route template."""
+    app = Starlette(routes=list(ROUTES), middleware=[Middleware(
+        DeadlineMiddleware,
+        timeout=SLOW_REQUEST * 10,
+        route_timeouts={TEMPLATE: SLOW_REQUEST / 10},
+    )])
+    status = asyncio.run(answer_status(app, USER_PATH))
+    assert status == HTTPStatus.GATEWAY_TIMEOUT
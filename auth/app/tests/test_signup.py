@@ -0,0 +1,89 @@
+"""Tests of sign up checks against taken email and login."""
+
+import asyncio
+import uuid
+from contextlib import suppress
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import exc as sa_exceptions
+from src.config import PostgreSQLSettings
+from src.domain.repositories.user.exceptions import UserAlreadyExists
+from src.infrastructure.interfaces.database.unit_of_work import UnitOfWork
+from src.infrastructure.resilience import (
+    POSTGRESQL,
+    get_policy,
+    is_postgresql_transient,
+)
+from src.use_cases.user.dto import UserSignUpDTO
+from src.use_cases.user.signup import SignUpUseCase
+from tests.database import (
+    PASSWORD,
+    connect,
+    delete_users,
+    dispose,
+    insert_user,
+)
+
+# More attempts than failures opening the breaker by default.
+ATTEMPTS = 6
+
+
+async def sign_up_mismatched(settings: PostgreSQLSettings) -> int:
+    """Sign up with email of one user and login of another.
+
+    Args:
+        settings (PostgreSQLSettings): Settings for PostgreSQL.
+
+    Returns:
+        int: Attempts refused as taken.
+    """
+    postgresql = await connect(settings)
+    uow = UnitOfWork(postgresql)
+    users = [
+        await insert_user(uow, uuid.uuid4().hex) for _ in range(2)
+    ]
+    use_case = SignUpUseCase(
+        cache_uow=Mock(), database_uow=uow, tokens=Mock(), hasher=Mock(),
+    )
+    dto = UserSignUpDTO(
+        email=users[0].as_dto().email,
+        login=users[1].as_dto().login,
+        password=PASSWORD,
+    )
+    refused = 0
+    for _ in range(ATTEMPTS):
+        with suppress(UserAlreadyExists):
+            await use_case.execute(dto)
+            continue
+        refused += 1
+    await delete_users(postgresql, users)
+    await dispose(postgresql)
+    return refused
+
+
+def test_sign_up_mismatched_is_taken(settings: PostgreSQLSettings) -> None:
+    """Email and login of different users are refused as taken.
+
+    Args:
+        settings (PostgreSQLSettings): Settings of the Database.
+    """
+    assert asyncio.run(sign_up_mismatched(settings)) == ATTEMPTS
+    assert get_policy(POSTGRESQL).breaker.closed
+
+
+@pytest.mark.parametrize(('exc', 'transient'), [
+    (sa_exceptions.PendingRollbackError('rollback'), True),
+    (sa_exceptions.MultipleResultsFound('two rows'), False),
+    (sa_exceptions.ResourceClosedError('closed'), False),
+])
+def test_invalid_requests_are_not_outages(
+    exc: BaseException, transient: bool,
+) -> None:
+    """Only unusable session counts as PostgreSQL outage.
+
+    Args:
+        exc (BaseException): Raised exception.
+        transient (bool): Expected outage.
+    """
+    assert is_postgresql_transient(exc) is transient
@@ -0,0 +1,62 @@
+"""Tests of the worker warm-up."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+from src.config import WarmUpSettings
+from src.infrastructure.warmup import Readiness, WarmUp
+
+SLOW_REFRESH = 10.0
+
+
+class SlowCatalog:  # noqa: WPS306 (Without Base class.)
+    """Catalog which refreshes longer than the warm-up lasts."""
+
+    def __init__(self) -> None:
+        """Init method."""
+        self.cancelled = False
+
+    async def refresh(self) -> None:
+        """Wait until cancelled.
+
+        Raises:
+            asyncio.CancelledError: Refresh is cancelled.
+        """
+        try:
+            await asyncio.sleep(SLOW_REFRESH)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+async def warm_up_failing(catalog: SlowCatalog, readiness: Readiness) -> bool:
+    """Run warm-up with failing hasher.
+
+    Args:
+        catalog (SlowCatalog): Catalog refreshed by warm-up.
+        readiness (Readiness): Flag set after warm-up.
+
+    Returns:
+        bool: Catalog refresh was cancelled by the time warm-up ended.
+    """
+    hasher = Mock(hash=AsyncMock(side_effect=ConnectionError('down')))
+    warm_up = WarmUp(
+        database_uow_factory=Mock(),
+        cache_uow_factory=AsyncMock(),
+        catalog=catalog,  # type: ignore[arg-type]
+        hasher=hasher,
+        tokens=Mock(),
+        readiness=readiness,
+        config=WarmUpSettings(
+            warmup_connections=0, warmup_timeout=SLOW_REFRESH * 2,
+        ),
+    )
+    await asyncio.wait_for(warm_up.run(), SLOW_REFRESH / 2)
+    return catalog.cancelled
+
+
+def test_failure_cancels_siblings() -> None:
+    """First failure cancels the rest and the worker still gets ready."""
+    readiness = Readiness()
+    assert asyncio.run(warm_up_failing(SlowCatalog(), readiness))
+    assert readiness.ready
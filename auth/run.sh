@@ -17,4 +17,4 @@ done
 echo "Cache database started"
 
 cd app
-gunicorn src.api.main:app --workers 4 --worker-class uvicorn.workers.UvicornWorker --bind 0.0.0.0:8000
+gunicorn src.api.main:app --config gunicorn.conf.py